@@ -1,4 +1,5 @@
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
 from proposals_node.models import Proposal
 from project_proposal.models import ProjectProposal
 from project_proposal.models import ProjectProposalHistory
@@ -25,6 +26,8 @@ class ActivityProposal(models.Model):
    clusters = models.JSONField(null=True, blank=True)
    agendas = models.JSONField(null=True, blank=True)
    sdg_addressed = models.CharField(max_length=255, blank=True, null=True)
+   # sdg numbers parsed from sdg_addressed for facet filters
+   sdg_goals = models.JSONField(null=True, blank=True)
    mandated_academic_program = models.CharField(max_length=255, blank=True, null=True)
    rationale = models.TextField(null=True, blank=True)
    significance = models.TextField(null=True, blank=True)
@@ -37,6 +40,14 @@ class ActivityProposal(models.Model):
    budget_requirements = models.JSONField(null=True, blank=True)
    created_at = models.DateTimeField(auto_now_add=True)
    
+   class Meta:
+      indexes = [
+         GinIndex(fields=['tags'], opclasses=['jsonb_path_ops'], name='activity_tags_gin_idx'),
+         GinIndex(fields=['clusters'], opclasses=['jsonb_path_ops'], name='activity_clusters_gin_idx'),
+         GinIndex(fields=['agendas'], opclasses=['jsonb_path_ops'], name='activity_agendas_gin_idx'),
+         GinIndex(fields=['sdg_goals'], opclasses=['jsonb_path_ops'], name='activity_sdg_goals_gin_idx'),
+      ]
+
    def __str__(self):
       return self.activity_title
    
@@ -1,3 +1,25 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
+from benchmarks.factory import SyntheticDataFactory, SCALES
+from jobs.services import JobService
+from proposals_node.models import Proposal
 
 # Create your tests here.
+class ActivitySubmitTest(TestCase):
+
+    def test_root_moves_to_for_review_in_a_job(self):
+        data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        activity = data.activities[0]
+        root = activity.project_proposal.program_proposal.proposal
+        Proposal.objects.filter(id=root.id).update(status="draft")
+        client = APIClient()
+        client.force_authenticate(activity.proposal.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.put(f"/api/activity-proposal/{activity.id}/", {"activity_title": "Reading camp"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Proposal.objects.get(id=root.id).status, "draft")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            JobService.run_pending()
+        self.assertEqual(Proposal.objects.get(id=root.id).status, "for_review")
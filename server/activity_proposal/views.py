@@ -5,7 +5,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, AllowAny 
-from .models import ActivityProposal
+from .models import ActivityProposal, ActivityProposalHistory
 from .serializers import (
     ActivityProposalSerializer,
     ActivityProposalUpdateSaveHistorySerializer,
@@ -14,9 +14,10 @@ from .serializers import (
 from .mapper import ActivityHistoryMapper
 from notifications.services import NotificationService
 from reviewer.services import ProposalReviewerServices
+from archives.selectors import ArchiveSelectors
 from proposals_node.models import Proposal
 from proposals_node.services import YearConfigService
-from notifications.models import Notification
+from jobs.services import JobService
 from reviewer.models import ProposalReviewer
 from proposals_node.models import Proposal
 
@@ -46,8 +47,9 @@ class ActivityProposalDetail(APIView):
         )
         return activity_proposal
 
+    # archived years stay readable
     def get(self, request, pk):
-        activity_proposal = self.get_object(pk)
+        activity_proposal = ArchiveSelectors.get_live_or_archived(ActivityProposal, id=pk)
         serializer = ActivityProposalSerializer(activity_proposal)
         return Response(serializer.data, status=status.HTTP_200_OK)
     
@@ -72,10 +74,13 @@ class ActivityProposalDetail(APIView):
                 .proposal
             )
 
-            # Update status safely
-            if root_proposal.status in ["draft", "for_revision"]:
-                root_proposal.status = "for_review"
-                root_proposal.save()
+            # only draft and for_revision may move to for_review, anything else is left alone. every activity
+            # of a program shares this root row, the job locks it after the save so saves do not queue on it
+            JobService.enqueue("proposals_node.transition", {
+                "proposal_ids": [root_proposal.id],
+                "to_status": "for_review",
+                "actor_id": request.user.id,
+            })
             
             
             NotificationService.admin_notifications(
@@ -122,12 +127,12 @@ class UpdateActivitySaveHistoryView(APIView):
                 f"The activity proposal titled '{serializer.data.get('activity_title')}' has been updated by {request.user.profile.name} and saved to history."
             )
             # notification for reviwer
-            # save notification for every reviewer that this proposal is already revised
-            for r in proposal_reviewer:
-                Notification.objects.create(
-                    user= r.reviewer,
-                    message=f"The proposal '{activity_data.activity_title}' has been revised by the implementor and is ready for your review."
-                )
+            # notify every reviewer that this proposal is already revised, once per version
+            NotificationService.notify_proposal_reviewers(
+                activity_data.proposal_id,
+                f"The proposal '{activity_data.activity_title}' has been revised by the implementor and is ready for your review.",
+                idempotency_key=f"revision-notice-{activity_data.proposal_id}-v{activity_data.proposal.version_no}",
+            )
             # remove the reviewed indicator for reviewer
             proposal_reviewer.update(is_review=False)
             
@@ -144,10 +149,13 @@ class ActivityListHistoryView(APIView):
         # serialize the object
         ...
         # get the current proposal
-        proposal = get_object_or_404(Proposal, id=proposal_id)
-        activity_proposals = get_object_or_404(ActivityProposal, proposal=proposal)
-        # get the history
-        history = proposal.activity_history.all()
+        proposal = ArchiveSelectors.get_live_or_archived(Proposal, id=proposal_id)
+        activity_proposals = ArchiveSelectors.get_live_or_archived(ActivityProposal, proposal=proposal)
+        # get the history, from the archive for closed years
+        if getattr(proposal, "archived", False):
+            history = ArchiveSelectors.filter(ActivityProposalHistory, proposal=proposal)
+        else:
+            history = proposal.activity_history.all()
         
         activity_serializer = ActivityProposalSerializer(activity_proposals)
         history_serializer = ActivityProposalHistoryListSerializer(history, many=True)
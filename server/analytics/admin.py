@@ -0,0 +1,7 @@
+from django.contrib import admin
+from .models import ProposalTimeline, StatusRollup, RollupCursor
+
+admin.site.register(ProposalTimeline)
+admin.site.register(StatusRollup)
+admin.site.register(RollupCursor)
+# Register your models here.
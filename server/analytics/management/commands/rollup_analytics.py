@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from analytics.services import StatusRollupService
+
+
+class Command(BaseCommand):
+    help = "Roll up the status events written since the last run into the turnaround analytics."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        processed = StatusRollupService.process_new_events(batch=options["batch"])
+        self.stdout.write(self.style.SUCCESS(f"Rolled up {processed} status events."))
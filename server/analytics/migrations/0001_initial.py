@@ -0,0 +1,57 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('proposals_node', '0011_status_event_append_only'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupCursor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('last_event_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProposalTimeline',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('campus', models.CharField(blank=True, default='', max_length=100)),
+                ('submitted_at', models.DateTimeField(blank=True, null=True)),
+                ('first_reviewed_at', models.DateTimeField(blank=True, null=True)),
+                ('approved_at', models.DateTimeField(blank=True, null=True)),
+                ('revision_rounds', models.PositiveIntegerField(default=0)),
+                ('proposal', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='timeline', to='proposals_node.proposal')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='StatusRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('dimension', models.CharField(choices=[('day', 'Day'), ('campus', 'Campus'), ('reviewer', 'Reviewer')], max_length=20)),
+                ('key', models.CharField(blank=True, default='', max_length=100)),
+                ('label', models.CharField(blank=True, default='', max_length=255)),
+                ('submissions', models.PositiveIntegerField(default=0)),
+                ('first_reviews', models.PositiveIntegerField(default=0)),
+                ('first_review_seconds', models.BigIntegerField(default=0)),
+                ('revisions', models.PositiveIntegerField(default=0)),
+                ('approvals', models.PositiveIntegerField(default=0)),
+                ('approval_seconds', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['dimension', 'day'], name='status_rollup_dim_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('dimension', 'key', 'day'), name='unique_status_rollup')],
+            },
+        ),
+    ]
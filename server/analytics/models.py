@@ -0,0 +1,58 @@
+from django.db import models
+from proposals_node.models import Proposal
+
+# Create your models here.
+# the milestones of one proposal, filled in as status events are rolled up
+class ProposalTimeline(models.Model):
+    proposal = models.OneToOneField(Proposal, on_delete=models.CASCADE, related_name="timeline")
+    campus = models.CharField(max_length=100, blank=True, default="")
+    submitted_at = models.DateTimeField(null=True, blank=True)
+    first_reviewed_at = models.DateTimeField(null=True, blank=True)
+    approved_at = models.DateTimeField(null=True, blank=True)
+    revision_rounds = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"Timeline of proposal {self.proposal_id}"
+
+
+# daily counters per dimension, averages are seconds_total / count at read time
+class StatusRollup(models.Model):
+    DIMENSION_CHOICES = [
+        ('day', 'Day'),
+        ('campus', 'Campus'),
+        ('reviewer', 'Reviewer'),
+    ]
+
+    day = models.DateField()
+    dimension = models.CharField(max_length=20, choices=DIMENSION_CHOICES)
+    # campus name or reviewer id, empty for the day dimension
+    key = models.CharField(max_length=100, blank=True, default="")
+    label = models.CharField(max_length=255, blank=True, default="")
+
+    submissions = models.PositiveIntegerField(default=0)
+    first_reviews = models.PositiveIntegerField(default=0)
+    first_review_seconds = models.BigIntegerField(default=0)
+    revisions = models.PositiveIntegerField(default=0)
+    approvals = models.PositiveIntegerField(default=0)
+    approval_seconds = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['dimension', 'key', 'day'], name='unique_status_rollup')
+        ]
+        indexes = [
+            models.Index(fields=['dimension', 'day'], name='status_rollup_dim_day_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.dimension} {self.key} {self.day}"
+
+
+# how far the rollups have read the status event log
+class RollupCursor(models.Model):
+    name = models.CharField(max_length=50, unique=True)
+    last_event_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} at {self.last_event_id}"
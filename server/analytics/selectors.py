@@ -0,0 +1,46 @@
+from django.db.models import Max, Sum
+from .models import StatusRollup
+
+
+def hours(seconds, count):
+    return round(seconds / count / 3600, 2) if count else None
+
+
+class TurnaroundSelectors:
+
+    # one grouped query over the daily rollups, the event log is never read here
+    @staticmethod
+    def turnaround(dimension, date_from=None, date_to=None):
+        rollups = StatusRollup.objects.filter(dimension=dimension)
+        if date_from:
+            rollups = rollups.filter(day__gte=date_from)
+        if date_to:
+            rollups = rollups.filter(day__lte=date_to)
+
+        group = "day" if dimension == "day" else "key"
+        rows = (
+            rollups.values(group)
+            .annotate(
+                name=Max("label"),
+                submissions_total=Sum("submissions"),
+                first_reviews_total=Sum("first_reviews"),
+                first_review_seconds_total=Sum("first_review_seconds"),
+                revisions_total=Sum("revisions"),
+                approvals_total=Sum("approvals"),
+                approval_seconds_total=Sum("approval_seconds"),
+            )
+            .order_by(group)
+        )
+        return [
+            {
+                "key": row[group],
+                "label": row["name"] or row[group],
+                "submissions": row["submissions_total"],
+                "first_reviews": row["first_reviews_total"],
+                "avg_hours_to_first_review": hours(row["first_review_seconds_total"], row["first_reviews_total"]),
+                "revision_rounds": row["revisions_total"],
+                "approvals": row["approvals_total"],
+                "avg_hours_to_approval": hours(row["approval_seconds_total"], row["approvals_total"]),
+            }
+            for row in rows
+        ]
@@ -0,0 +1,162 @@
+from collections import defaultdict
+from itertools import takewhile
+from datetime import timedelta
+from django.db import transaction
+from django.utils import timezone
+from jobs.services import JobService
+from proposals_node.models import ProposalStatusEvent
+from .models import ProposalTimeline, StatusRollup, RollupCursor
+
+COUNTERS = ["submissions", "first_reviews", "first_review_seconds", "revisions", "approvals", "approval_seconds"]
+REVIEW_STATUSES = {"for_revision", "for_approval"}
+
+
+class StatusRollupService:
+    CURSOR = "status_events"
+
+    DELAY = timedelta(seconds=30)
+    # a transition that took its event id before a later one but commits after it would be skipped once the
+    # cursor moved past it, so events younger than this are left for the next run
+    LAG = timedelta(seconds=30)
+
+    # at most one rollup job per minute no matter how many transitions happen, the key is the minute the job
+    # runs in and is picked once the transition has committed, so the job always starts after that commit
+    @staticmethod
+    def schedule():
+        transaction.on_commit(StatusRollupService.enqueue_next)
+
+    @staticmethod
+    def enqueue_next():
+        now = timezone.now()
+        slot = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        JobService.enqueue(
+            "analytics.rollup",
+            idempotency_key=f"analytics-rollup-{slot:%Y%m%d%H%M}",
+            delay=slot + StatusRollupService.DELAY - now,
+        )
+
+    @staticmethod
+    def has_new_events():
+        cursor = RollupCursor.objects.filter(name=StatusRollupService.CURSOR).values_list("last_event_id", flat=True).first()
+        return ProposalStatusEvent.objects.filter(id__gt=cursor or 0).exists()
+
+    @staticmethod
+    def load_events(after, batch):
+        return list(
+            ProposalStatusEvent.objects
+            .filter(id__gt=after)
+            .order_by("id")
+            .values(
+                "id", "proposal_id", "from_status", "to_status", "actor_id", "created_at",
+                "proposal__user__profile__campus", "actor__profile__name",
+            )[:batch]
+        )
+
+    # walks the new events in order, moves each proposal timeline forward and returns the counter
+    # increments per (dimension, key, day)
+    @staticmethod
+    def apply_events(events, timelines):
+        deltas = defaultdict(lambda: defaultdict(int))
+        labels = {}
+        for event in events:
+            timeline = timelines.get(event["proposal_id"])
+            if timeline is None:
+                timeline = timelines[event["proposal_id"]] = ProposalTimeline(
+                    proposal_id=event["proposal_id"], campus=event["proposal__user__profile__campus"] or ""
+                )
+            at = event["created_at"]
+            day = timezone.localdate(at)
+            buckets = [("day", "", day), ("campus", timeline.campus, day)]
+            reviewer = None
+            if event["actor_id"] and event["to_status"] in REVIEW_STATUSES:
+                reviewer = ("reviewer", str(event["actor_id"]), day)
+                labels[reviewer] = event["actor__profile__name"] or ""
+
+            if event["to_status"] == "for_review" and timeline.submitted_at is None:
+                timeline.submitted_at = at
+                for bucket in buckets:
+                    deltas[bucket]["submissions"] += 1
+
+            if event["to_status"] in REVIEW_STATUSES and timeline.submitted_at and timeline.first_reviewed_at is None:
+                timeline.first_reviewed_at = at
+                seconds = int((at - timeline.submitted_at).total_seconds())
+                for bucket in buckets + ([reviewer] if reviewer else []):
+                    deltas[bucket]["first_reviews"] += 1
+                    deltas[bucket]["first_review_seconds"] += seconds
+
+            if event["to_status"] == "for_revision":
+                timeline.revision_rounds += 1
+                for bucket in buckets + ([reviewer] if reviewer else []):
+                    deltas[bucket]["revisions"] += 1
+
+            if event["to_status"] == "approved" and timeline.submitted_at and timeline.approved_at is None:
+                timeline.approved_at = at
+                seconds = int((at - timeline.submitted_at).total_seconds())
+                for bucket in buckets:
+                    deltas[bucket]["approvals"] += 1
+                    deltas[bucket]["approval_seconds"] += seconds
+        return deltas, labels
+
+    @staticmethod
+    def save_rollups(deltas, labels):
+        existing = {
+            (row.dimension, row.key, row.day): row
+            for row in StatusRollup.objects.filter(
+                day__in={day for _, _, day in deltas}, dimension__in={dimension for dimension, _, _ in deltas}
+            )
+        }
+        created = []
+        for bucket, counters in deltas.items():
+            row = existing.get(bucket)
+            if row is None:
+                dimension, key, day = bucket
+                row = StatusRollup(dimension=dimension, key=key, day=day)
+                created.append(row)
+            for counter, value in counters.items():
+                setattr(row, counter, getattr(row, counter) + value)
+            if bucket in labels:
+                row.label = labels[bucket]
+        StatusRollup.objects.bulk_update([row for row in existing.values() if (row.dimension, row.key, row.day) in deltas], COUNTERS + ["label"])
+        StatusRollup.objects.bulk_create(created)
+
+    # only events after the cursor are read, the cursor row lock keeps two workers from
+    # counting the same batch, the batch stops at the first event still inside the lag
+    @staticmethod
+    def process_batch(batch=5000, lag=None):
+        lag = StatusRollupService.LAG if lag is None else lag
+        with transaction.atomic():
+            RollupCursor.objects.get_or_create(name=StatusRollupService.CURSOR)
+            cursor = RollupCursor.objects.select_for_update().get(name=StatusRollupService.CURSOR)
+            events = StatusRollupService.load_events(cursor.last_event_id, batch)
+            settled = timezone.now() - lag
+            events = list(takewhile(lambda event: event["created_at"] < settled, events))
+            if not events:
+                return 0
+
+            timelines = {
+                timeline.proposal_id: timeline
+                for timeline in ProposalTimeline.objects.filter(proposal_id__in={event["proposal_id"] for event in events})
+            }
+            known = set(timelines)
+            deltas, labels = StatusRollupService.apply_events(events, timelines)
+
+            ProposalTimeline.objects.bulk_update(
+                [timelines[proposal_id] for proposal_id in known],
+                ["submitted_at", "first_reviewed_at", "approved_at", "revision_rounds"],
+            )
+            ProposalTimeline.objects.bulk_create([timeline for proposal_id, timeline in timelines.items() if proposal_id not in known])
+            StatusRollupService.save_rollups(deltas, labels)
+
+            cursor.last_event_id = events[-1]["id"]
+            cursor.save(update_fields=["last_event_id", "updated_at"])
+            return len(events)
+
+    # a batch cut short by the lag ends the run too, the rest waits for the next job
+    @staticmethod
+    def process_new_events(batch=5000, lag=None):
+        total = 0
+        while True:
+            processed = StatusRollupService.process_batch(batch, lag)
+            total += processed
+            if processed < batch:
+                return total
@@ -0,0 +1,11 @@
+from jobs.registry import task
+from .services import StatusRollupService
+
+
+# enqueued at most once a minute by status transitions, only reads events past the cursor,
+# events it could not take yet get the next minute's job
+@task("analytics.rollup")
+def rollup_status_events():
+    StatusRollupService.process_new_events()
+    if StatusRollupService.has_new_events():
+        StatusRollupService.enqueue_next()
@@ -0,0 +1,59 @@
+from datetime import timedelta
+from django.db import DatabaseError, transaction
+from django.test import TestCase
+from rest_framework.test import APIClient
+from benchmarks.factory import SyntheticDataFactory, SCALES
+from proposals_node.models import Proposal, ProposalStatusEvent
+from proposals_node.services import ProposalStatusService
+from .models import ProposalTimeline, StatusRollup
+from .services import StatusRollupService
+
+# Create your tests here.
+class StatusRollupTest(TestCase):
+
+    def test_rollups_only_count_new_events(self):
+        data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        program, other = data.programs
+        reviewer = data.reviewers[0]
+        Proposal.objects.filter(id__in=[program.proposal_id, other.proposal_id]).update(status="draft")
+
+        ProposalStatusService.transition([program.proposal_id, other.proposal_id], "for_review", notify=False)
+        ProposalStatusService.transition([program.proposal_id], "for_revision", actor=reviewer, notify=False)
+        ProposalStatusService.transition([program.proposal_id], "for_review", notify=False)
+        ProposalStatusService.transition([program.proposal_id], "for_revision", actor=reviewer, notify=False)
+        self.assertEqual(StatusRollupService.process_new_events(lag=timedelta(0)), 5)
+
+        ProposalStatusService.transition([program.proposal_id], "for_approval", actor=reviewer, notify=False)
+        ProposalStatusService.transition([program.proposal_id], "approved", notify=False)
+        self.assertEqual(StatusRollupService.process_new_events(lag=timedelta(0)), 2)
+        self.assertEqual(StatusRollupService.process_new_events(lag=timedelta(0)), 0)
+
+        day = StatusRollup.objects.get(dimension="day")
+        self.assertEqual((day.submissions, day.first_reviews, day.revisions, day.approvals), (2, 1, 2, 1))
+        by_reviewer = StatusRollup.objects.get(dimension="reviewer")
+        self.assertEqual((by_reviewer.key, by_reviewer.first_reviews, by_reviewer.revisions), (str(reviewer.id), 1, 2))
+        timeline = ProposalTimeline.objects.get(proposal_id=program.proposal_id)
+        self.assertEqual(timeline.revision_rounds, 2)
+        self.assertIsNotNone(timeline.approved_at)
+
+        client = APIClient()
+        client.force_authenticate(data.admin)
+        with self.assertNumQueries(1):
+            response = client.get("/api/admin/analytics/turnaround/campus/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sum(row["submissions"] for row in response.data), 2)
+        self.assertEqual(client.get("/api/admin/analytics/turnaround/year/").status_code, 400)
+
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            ProposalStatusEvent.objects.filter(proposal_id=program.proposal_id).update(note="edited")
+
+    def test_events_inside_the_lag_wait_for_the_next_run(self):
+        data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        program = data.programs[0]
+        Proposal.objects.filter(id=program.proposal_id).update(status="draft")
+        ProposalStatusService.transition([program.proposal_id], "for_review", notify=False)
+
+        self.assertEqual(StatusRollupService.process_new_events(lag=timedelta(hours=1)), 0)
+        self.assertTrue(StatusRollupService.has_new_events())
+        self.assertEqual(StatusRollupService.process_new_events(lag=timedelta(0)), 1)
+        self.assertFalse(StatusRollupService.has_new_events())
@@ -0,0 +1,9 @@
+from django.urls import path
+from rest_framework.urlpatterns import format_suffix_patterns
+from .views import AdminTurnaroundView
+
+urlpatterns = [
+    path("admin/analytics/turnaround/<str:dimension>/", AdminTurnaroundView.as_view(), name="admin-analytics-turnaround"),
+]
+
+urlpatterns = format_suffix_patterns(urlpatterns)
@@ -0,0 +1,27 @@
+from django.utils.dateparse import parse_date
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from .models import StatusRollup
+from .selectors import TurnaroundSelectors
+
+# Create your views here.
+# ADMIN VIEWS turnaround per day, campus or reviewer, read from the rollups only
+class AdminTurnaroundView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, dimension, format=None):
+        if dimension not in dict(StatusRollup.DIMENSION_CHOICES):
+            return Response({"error": "Invalid dimension"}, status=status.HTTP_400_BAD_REQUEST)
+
+        dates = {}
+        for param in ("from", "to"):
+            value = request.query_params.get(param)
+            if value:
+                dates[param] = parse_date(value)
+                if dates[param] is None:
+                    return Response({param: ["Use YYYY-MM-DD."]}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = TurnaroundSelectors.turnaround(dimension, dates.get("from"), dates.get("to"))
+        return Response(data, status=status.HTTP_200_OK)
@@ -0,0 +1,6 @@
+from django.contrib import admin
+from .models import ArchivedRecord, YearArchive
+
+admin.site.register(ArchivedRecord)
+admin.site.register(YearArchive)
+# Register your models here.
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class ArchivesConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'archives'
+
+    def ready(self):
+        import archives.tasks
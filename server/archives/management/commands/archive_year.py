@@ -0,0 +1,20 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from archives.services import YearArchiveService
+
+
+class Command(BaseCommand):
+    help = "Move a locked past year's proposals, histories, reviews and notifications into the archive table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("year", type=int)
+        parser.add_argument("--batch", type=int, default=YearArchiveService.BATCH, help="program trees per transaction")
+        parser.add_argument("--vacuum", action="store_true", help="VACUUM ANALYZE the hot tables before measuring again")
+
+    def handle(self, *args, **options):
+        try:
+            archive = YearArchiveService.archive_year(options["year"], batch_size=options["batch"], vacuum=options["vacuum"])
+        except ValueError as e:
+            raise CommandError(str(e))
+        self.stdout.write(json.dumps(archive.report["archive"], indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Archived {archive.archived_rows} rows of {archive.year} in {archive.batches} batches."))
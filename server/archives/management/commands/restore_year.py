@@ -0,0 +1,19 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from archives.services import YearArchiveService
+
+
+class Command(BaseCommand):
+    help = "Move an archived year back into the hot tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("year", type=int)
+        parser.add_argument("--vacuum", action="store_true", help="VACUUM ANALYZE the hot tables before measuring again")
+
+    def handle(self, *args, **options):
+        try:
+            archive = YearArchiveService.restore_year(options["year"], vacuum=options["vacuum"])
+        except ValueError as e:
+            raise CommandError(str(e))
+        self.stdout.write(json.dumps(archive.report["restore"], indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Restored {archive.year}."))
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:58
+
+import archives.models
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='YearArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField(unique=True)),
+                ('status', models.CharField(choices=[('archiving', 'Archiving'), ('archived', 'Archived'), ('restored', 'Restored')], default='archiving', max_length=20)),
+                ('batches', models.IntegerField(default=0)),
+                ('archived_rows', models.IntegerField(default=0)),
+                ('report', models.JSONField(blank=True, default=dict)),
+                ('archived_at', models.DateTimeField(blank=True, null=True)),
+                ('restored_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField()),
+                ('batch', models.BigIntegerField()),
+                ('position', models.IntegerField()),
+                ('model', models.CharField(max_length=100)),
+                ('object_pk', models.BigIntegerField()),
+                ('data', models.JSONField(encoder=archives.models.ArchiveJSONEncoder)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['year', 'batch', 'position'], name='archived_record_batch_idx'), django.contrib.postgres.indexes.GinIndex(fields=['data'], name='archived_record_data_gin_idx', opclasses=['jsonb_path_ops'])],
+                'constraints': [models.UniqueConstraint(fields=('model', 'object_pk'), name='unique_archived_record')],
+            },
+        ),
+    ]
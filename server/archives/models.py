@@ -0,0 +1,58 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+import datetime
+
+
+# DjangoJSONEncoder cuts datetimes to milliseconds, archived rows must come back exactly as they were
+class ArchiveJSONEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+# Create your models here.
+# one archived row of any hot table, stored as its serialized fields so it can be read back or restored as is
+class ArchivedRecord(models.Model):
+    year = models.IntegerField()
+    # id of the first row the batch was started from, rows of one batch are restored together
+    batch = models.BigIntegerField()
+    # parents come before children so a restore can insert in this order
+    position = models.IntegerField()
+    model = models.CharField(max_length=100)
+    object_pk = models.BigIntegerField()
+    data = models.JSONField(encoder=ArchiveJSONEncoder)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['model', 'object_pk'], name='unique_archived_record')
+        ]
+        indexes = [
+            models.Index(fields=['year', 'batch', 'position'], name='archived_record_batch_idx'),
+            GinIndex(fields=['data'], opclasses=['jsonb_path_ops'], name='archived_record_data_gin_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.object_pk} ({self.year})"
+
+
+# one row per archived year with the before and after table sizes and query timings
+class YearArchive(models.Model):
+    STATUS_CHOICES = [
+        ('archiving', 'Archiving'),
+        ('archived', 'Archived'),
+        ('restored', 'Restored'),
+    ]
+
+    year = models.IntegerField(unique=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='archiving')
+    batches = models.IntegerField(default=0)
+    archived_rows = models.IntegerField(default=0)
+    report = models.JSONField(default=dict, blank=True)
+    archived_at = models.DateTimeField(null=True, blank=True)
+    restored_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.year} {self.status}"
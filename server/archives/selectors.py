@@ -0,0 +1,51 @@
+from django.core import serializers
+from django.db import models
+from django.http import Http404
+from .models import ArchivedRecord
+
+
+class ArchiveSelectors:
+
+    # archived rows come back as unsaved model instances marked archived, lookups go through the gin index,
+    # model instances in the lookup are attached to the results so serializers never query for them
+    @staticmethod
+    def filter(model, **lookup):
+        records = ArchivedRecord.objects.filter(model=model._meta.label_lower)
+        related = {}
+        data = {}
+        for name, value in lookup.items():
+            if name in ("pk", "id"):
+                records = records.filter(object_pk=value)
+            elif isinstance(value, models.Model):
+                related[name] = value
+                data[name] = value.pk
+            else:
+                data[name] = value
+        if data:
+            records = records.filter(data__contains=data)
+
+        objects = []
+        for record in records.order_by("object_pk"):
+            obj = next(serializers.deserialize(
+                "python", [{"model": record.model, "pk": record.object_pk, "fields": record.data}]
+            )).object
+            obj.archived = True
+            for name, value in related.items():
+                setattr(obj, name, value)
+            objects.append(obj)
+        return objects
+
+    @staticmethod
+    def get(model, **lookup):
+        objects = ArchiveSelectors.filter(model, **lookup)
+        return objects[0] if objects else None
+
+    # the hot row when it exists, else the archived copy, else 404
+    @staticmethod
+    def get_live_or_archived(model, **lookup):
+        obj = model.objects.filter(**lookup).first()
+        if obj is None:
+            obj = ArchiveSelectors.get(model, **lookup)
+        if obj is None:
+            raise Http404(f"No {model._meta.object_name} matches the given query.")
+        return obj
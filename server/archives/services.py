@@ -0,0 +1,219 @@
+import statistics
+import time
+from django.contrib.admin.utils import NestedObjects
+from django.core import serializers
+from django.db import DEFAULT_DB_ALIAS, connection, transaction
+from django.utils import timezone
+from jobs.services import JobService
+from notifications.models import Notification
+from proposals_node.models import Proposal, YearConfig
+from proposals_node.services import ProposalStatusService, OverviewService
+from .models import ArchivedRecord, YearArchive
+
+# derived rows, rebuilt by the search reindex job after a restore instead of being archived
+SKIP_MODELS = {"search.proposalsearchdocument"}
+
+HOT_TABLES = [
+    "proposals_node_proposal",
+    "proposals_node_proposalstatusevent",
+    "program_proposal_programproposal",
+    "program_proposal_programproposalhistory",
+    "project_proposal_projectproposal",
+    "project_proposal_projectproposalhistory",
+    "activity_proposal_activityproposal",
+    "activity_proposal_activityproposalhistory",
+    "reviewer_proposalreviewer",
+    "reviews_proposalreview",
+    "reviews_reviewcomment",
+    "notifications_notification",
+]
+
+
+class YearArchiveService:
+    BATCH = 200
+
+    @staticmethod
+    def archivable(year):
+        return year < timezone.localdate().year and YearConfig.objects.filter(year=year, is_locked=True).exists()
+
+    @staticmethod
+    def serialize(collector):
+        collector.sort()
+        # collector order is delete order, children first, a restore needs it the other way around
+        records = []
+        for position, (model, instances) in enumerate(reversed(list(collector.data.items()))):
+            if model._meta.label_lower in SKIP_MODELS:
+                continue
+            for row in serializers.serialize("python", instances):
+                records.append((position, row))
+        return records
+
+    # copies the rows and everything that cascades from them into the archive, then deletes them
+    @staticmethod
+    def move(year, batch, objects):
+        collector = NestedObjects(using=DEFAULT_DB_ALIAS)
+        collector.collect(objects)
+        records = YearArchiveService.serialize(collector)
+        ArchivedRecord.objects.bulk_create([
+            ArchivedRecord(year=year, batch=batch, position=position, model=row["model"], object_pk=row["pk"], data=row["fields"])
+            for position, row in records
+        ])
+        collector.delete()
+        return len(records)
+
+    # program roots of the year, each batch takes whole trees so no project or activity is left without its program,
+    # skip locked so a second worker on the same year takes the next roots instead of waiting
+    @staticmethod
+    @transaction.atomic
+    def archive_proposal_batch(year, size):
+        roots = list(
+            Proposal.objects.select_for_update(skip_locked=True)
+            .filter(created_at__year=year, proposal_type="Program")
+            .order_by("id")
+            .values_list("id", flat=True)[:size]
+        )
+        if not roots:
+            return None
+        ids = ProposalStatusService.subtree_ids(roots)
+        return YearArchiveService.move(year, roots[0], list(Proposal.objects.filter(id__in=ids)))
+
+    @staticmethod
+    @transaction.atomic
+    def archive_notification_batch(year, size):
+        notifications = list(
+            Notification.objects.select_for_update(skip_locked=True).filter(created_at__year=year).order_by("id")[:size]
+        )
+        if not notifications:
+            return None
+        return YearArchiveService.move(year, notifications[0].id, notifications)
+
+    @staticmethod
+    def archive_year(year, batch_size=None, vacuum=False):
+        batch_size = batch_size or YearArchiveService.BATCH
+        if not YearArchiveService.archivable(year):
+            raise ValueError(f"{year} is not a closed year, lock it in the year config first.")
+
+        archive, _ = YearArchive.objects.get_or_create(year=year)
+        before = YearArchiveService.measure()
+        batches = 0
+        archived = 0
+        for archive_batch, size in (
+            (YearArchiveService.archive_proposal_batch, batch_size),
+            (YearArchiveService.archive_notification_batch, batch_size * 10),
+        ):
+            while (moved := archive_batch(year, size)) is not None:
+                archived += moved
+                batches += 1
+
+        if vacuum:
+            YearArchiveService.vacuum()
+        OverviewService.invalidate_series(year)
+        archive.status = "archived"
+        archive.batches += batches
+        archive.archived_rows += archived
+        archive.archived_at = timezone.now()
+        archive.report = {"archive": YearArchiveService.compare(before, YearArchiveService.measure())}
+        archive.save()
+        return archive
+
+    @staticmethod
+    @transaction.atomic
+    def restore_batch(year, batch):
+        records = ArchivedRecord.objects.filter(year=year, batch=batch).order_by("position", "model", "id")
+        proposal_ids = []
+        group = None
+        rows = []
+        # one bulk insert per model, positions keep parents ahead of their children
+        for record in records.iterator():
+            if group is not None and (record.position, record.model) != group:
+                YearArchiveService.insert(rows)
+                rows = []
+            group = (record.position, record.model)
+            obj = next(serializers.deserialize("python", [{"model": record.model, "pk": record.object_pk, "fields": record.data}])).object
+            if record.model == "proposals_node.proposal":
+                proposal_ids.append(record.object_pk)
+            rows.append(obj)
+        YearArchiveService.insert(rows)
+        restored = records.delete()[0]
+        if proposal_ids:
+            JobService.enqueue("search.reindex_many", {"proposal_ids": proposal_ids})
+        return restored
+
+    # a raw insert like loaddata, bulk_create would stamp auto_now fields with the restore time, and no save signals
+    # run since the budget lines, comments and events they would write are restored from the archive as well
+    @staticmethod
+    def insert(rows):
+        if not rows:
+            return
+        model = type(rows[0])
+        for start in range(0, len(rows), 500):
+            model._base_manager._insert(rows[start:start + 500], fields=model._meta.local_concrete_fields, raw=True)
+
+    @staticmethod
+    def restore_year(year, vacuum=False):
+        archive = YearArchive.objects.filter(year=year).first()
+        if archive is None:
+            raise ValueError(f"{year} was never archived.")
+        before = YearArchiveService.measure()
+        batches = ArchivedRecord.objects.filter(year=year).values_list("batch", flat=True).distinct().order_by("batch")
+        restored = sum(YearArchiveService.restore_batch(year, batch) for batch in list(batches))
+        if vacuum:
+            YearArchiveService.vacuum()
+
+        OverviewService.invalidate_series(year)
+        archive.status = "restored"
+        archive.archived_rows -= restored
+        archive.restored_at = timezone.now()
+        archive.report = {**archive.report, "restore": YearArchiveService.compare(before, YearArchiveService.measure())}
+        archive.save()
+        return archive
+
+    # hot table row counts and sizes plus the median time of the queries every dashboard runs
+    @staticmethod
+    def measure(repeat=5):
+        tables = {}
+        with connection.cursor() as cursor:
+            for table in HOT_TABLES:
+                # summed over the partition tree, a partitioned parent has no storage of its own
+                cursor.execute(
+                    f"SELECT count(*), (SELECT sum(pg_total_relation_size(relid))::bigint FROM pg_partition_tree(%s)) "
+                    f"FROM {connection.ops.quote_name(table)}",
+                    [table],
+                )
+                rows, size = cursor.fetchone()
+                tables[table] = {"rows": rows, "bytes": size}
+
+        queries = {
+            "admin_program_list": lambda: list(Proposal.objects.filter(proposal_type="Program").values_list("id", "status")),
+            "overview_status_counts": lambda: OverviewService().get_status_counts(None),
+            "latest_notifications": lambda: list(Notification.objects.order_by("-created_at")[:50]),
+        }
+        latency = {}
+        for name, query in queries.items():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                query()
+                timings.append((time.perf_counter() - start) * 1000)
+            latency[name] = round(statistics.median(timings), 3)
+        return {"tables": tables, "latency_ms": latency}
+
+    @staticmethod
+    def compare(before, after):
+        return {
+            "tables": {
+                table: {"before": before["tables"][table], "after": after["tables"][table]}
+                for table in HOT_TABLES
+            },
+            "latency_ms": {
+                name: {"before": before["latency_ms"][name], "after": after["latency_ms"][name]}
+                for name in before["latency_ms"]
+            },
+        }
+
+    # VACUUM cannot run inside a transaction, so it is only run by the commands once the batches are done
+    @staticmethod
+    def vacuum():
+        with connection.cursor() as cursor:
+            for table in HOT_TABLES:
+                cursor.execute(f"VACUUM ANALYZE {connection.ops.quote_name(table)}")
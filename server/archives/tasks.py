@@ -0,0 +1,9 @@
+from jobs.registry import task
+from .services import YearArchiveService
+
+
+# enqueued when an admin locks a past year, the batches run one transaction each
+@task("archives.year")
+def archive_year(year):
+    if YearArchiveService.archivable(year):
+        YearArchiveService.archive_year(year)
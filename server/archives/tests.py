@@ -0,0 +1,51 @@
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from benchmarks.factory import SyntheticDataFactory, SCALES
+from notifications.models import Notification
+from proposals_node.models import Proposal, YearConfig
+from reviews.models import ReviewComment
+from .models import ArchivedRecord
+from .services import YearArchiveService
+
+# Create your tests here.
+class YearArchiveTest(TestCase):
+
+    def test_archive_keeps_detail_and_history_readable_and_restore_brings_rows_back(self):
+        data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        year = timezone.localdate().year - 1
+        Proposal.objects.update(created_at=timezone.now().replace(year=year))
+        Notification.objects.update(created_at=timezone.now().replace(year=year))
+        program, project, activity = data.programs[0], data.projects[0], data.activities[0]
+
+        client = APIClient()
+        client.force_authenticate(data.admin)
+        urls = [
+            f"/api/program-proposal/{program.id}/",
+            f"/api/program-proposal/{program.proposal_id}/history-list/",
+            f"/api/project-proposal/{project.id}/",
+            f"/api/project-proposal/{project.proposal_id}/history-list/",
+            f"/api/activity-proposal/{activity.id}/",
+            f"/api/activity-proposal/{activity.proposal_id}/history-list/",
+        ]
+        before = [client.get(url).json() for url in urls]
+        counts = (Proposal.objects.count(), ReviewComment.objects.count(), Notification.objects.count())
+
+        with self.assertRaises(ValueError):
+            YearArchiveService.archive_year(year)
+        YearConfig.objects.create(year=year, is_locked=True)
+        archive = YearArchiveService.archive_year(year, batch_size=1)
+
+        self.assertEqual((Proposal.objects.count(), ReviewComment.objects.count(), Notification.objects.count()), (0, 0, 0))
+        self.assertEqual(archive.archived_rows, ArchivedRecord.objects.count())
+        self.assertEqual(archive.report["archive"]["tables"]["proposals_node_proposal"]["after"]["rows"], 0)
+        for url, expected in zip(urls, before):
+            response = client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            self.assertEqual(response.json(), expected)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            YearArchiveService.restore_year(year)
+        self.assertEqual((Proposal.objects.count(), ReviewComment.objects.count(), Notification.objects.count()), counts)
+        self.assertFalse(ArchivedRecord.objects.exists())
+        self.assertEqual([client.get(url).json() for url in urls], before)
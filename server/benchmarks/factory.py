@@ -0,0 +1,207 @@
+import random
+from dataclasses import dataclass, field
+from datetime import date
+from django.contrib.auth.models import User
+from users.models import UserProfile
+from proposals_node.models import Proposal
+from program_proposal.models import ProgramProposal, ProgramProposalHistory
+from project_proposal.models import ProjectProposal, ProjectProposalHistory
+from activity_proposal.models import ActivityProposal, ActivityProposalHistory
+from reviewer.models import ProposalReviewer
+from reviews.models import ProposalReview, ReviewComment
+from notifications.models import Notification
+
+CAMPUSES = ["Iba", "Botolan", "Masinloc", "Candelaria", "Sta. Cruz", "Castillejos", "San Marcelino"]
+DEPARTMENTS = ["CCIT", "CTE", "CEA", "CBAPA", "CAS", "CON", "CIT"]
+WORDS = (
+    "community extension livelihood training farmers fisherfolk literacy health nutrition water "
+    "sanitation disaster preparedness climate resilience mangrove coastal barangay youth women "
+    "entrepreneurship digital skills seminar workshop module assessment evaluation partnership "
+    "agriculture aquaculture tourism heritage culture education teachers learners school research"
+).split()
+# reviewers rarely comment on every section, each synthetic round touches a few of them
+COMMENTS_PER_ROUND = 5
+
+SCALES = {
+    "tiny": dict(implementors=2, reviewers=3, programs=2, projects=2, activities=2, reviewers_per_program=2, history_rounds=1, notifications=3),
+    "small": dict(implementors=10, reviewers=10, programs=20, projects=3, activities=3, reviewers_per_program=2, history_rounds=2, notifications=20),
+    "medium": dict(implementors=50, reviewers=40, programs=200, projects=5, activities=4, reviewers_per_program=3, history_rounds=3, notifications=50),
+    "large": dict(implementors=200, reviewers=150, programs=1000, projects=10, activities=8, reviewers_per_program=3, history_rounds=3, notifications=200),
+}
+
+
+@dataclass
+class SyntheticDataset:
+    admin: User = None
+    implementors: list = field(default_factory=list)
+    reviewers: list = field(default_factory=list)
+    programs: list = field(default_factory=list)
+    projects: list = field(default_factory=list)
+    activities: list = field(default_factory=list)
+    assignments: list = field(default_factory=list)
+
+
+# deterministic proposal trees for benchmarks and load tests, everything is inserted with bulk_create
+class SyntheticDataFactory:
+
+    def __init__(self, seed=42, prefix="bench", **scale):
+        self.rng = random.Random(seed)
+        self.prefix = prefix
+        self.scale = {**SCALES["small"], **scale}
+
+    def words(self, count):
+        return " ".join(self.rng.choice(WORDS) for _ in range(count))
+
+    def document_fields(self):
+        return {
+            "implementing_agency": [self.words(3)],
+            "cooperating_agencies": [self.words(3) for _ in range(2)],
+            "extension_sites": [{"country": "Philippines", "region": "III", "province": "Zambales", "municipality": self.rng.choice(CAMPUSES), "barangay": self.words(1)}],
+            "tags": self.rng.sample(WORDS, 2),
+            "clusters": self.rng.sample(WORDS, 1),
+            "agendas": self.rng.sample(WORDS, 2),
+            "sdg_addressed": f"SDG {self.rng.randint(1, 17)}",
+            "sdg_goals": [],
+            "mandated_academic_program": self.words(3),
+            "rationale": self.words(300),
+            "significance": self.words(150),
+            "expected_output_6ps": {key: self.words(8) for key in ("publications", "patents", "products", "people", "places", "partnerships")},
+            "sustainability_plan": self.words(100),
+            "org_and_staffing": [{"name": self.words(2), "role": self.words(3)} for _ in range(5)],
+            "budget_requirements": [
+                {"item": self.words(2), "qty": qty, "cost": cost, "amount": qty * cost}
+                for qty, cost in ((self.rng.randint(1, 50), self.rng.randint(50, 2000)) for _ in range(10))
+            ],
+        }
+
+    def create_users(self, role, count):
+        users = User.objects.bulk_create([
+            User(username=f"{self.prefix}-{role}-{i}", email=f"{self.prefix}-{role}-{i}@example.com", is_staff=role == "admin")
+            for i in range(count)
+        ])
+        UserProfile.objects.bulk_create([
+            UserProfile(user=user, name=user.username, role=role, campus=self.rng.choice(CAMPUSES), department=self.rng.choice(DEPARTMENTS))
+            for user in users
+        ])
+        return users
+
+    def create_nodes(self, users, proposal_type, titles):
+        return Proposal.objects.bulk_create([
+            Proposal(user=user, title=title, proposal_type=proposal_type, status="under_review", version_no=self.scale["history_rounds"] + 1)
+            for user, title in zip(users, titles)
+        ])
+
+    def build(self):
+        s = self.scale
+        data = SyntheticDataset()
+        data.admin = self.create_users("admin", 1)[0]
+        data.implementors = self.create_users("implementor", s["implementors"])
+        data.reviewers = self.create_users("reviewer", s["reviewers"])
+
+        # programs
+        owners = [self.rng.choice(data.implementors) for _ in range(s["programs"])]
+        titles = [f"Program {i} {self.words(3)}" for i in range(s["programs"])]
+        nodes = self.create_nodes(owners, "Program", titles)
+        data.programs = ProgramProposal.objects.bulk_create([
+            ProgramProposal(
+                proposal=node, program_title=node.title, program_leader=self.words(2),
+                project_list=[{"project_title": f"Project {j}"} for j in range(s["projects"])],
+                general_objectives=self.words(60), specific_objectives=self.words(80), methodology=self.words(120),
+                workplan=[{"activity": self.words(4), "months": [self.rng.randint(1, 12)]} for _ in range(12)],
+                **self.document_fields()
+            )
+            for node in nodes
+        ])
+
+        # projects
+        parents = [program for program in data.programs for _ in range(s["projects"])]
+        nodes = self.create_nodes([p.proposal.user for p in parents], "Project", [f"Project {self.words(3)}" for _ in parents])
+        data.projects = ProjectProposal.objects.bulk_create([
+            ProjectProposal(
+                proposal=node, program_proposal=program, project_title=node.title, project_leader=self.words(2),
+                members=[self.words(2) for _ in range(4)], duration_months=12,
+                start_date=date(2026, 1, 1), end_date=date(2026, 12, 31),
+                general_objectives=self.words(60), specific_objectives=self.words(80), methodology=self.words(120),
+                workplan=[{"activity": self.words(4), "months": [self.rng.randint(1, 12)]} for _ in range(12)],
+                **self.document_fields()
+            )
+            for node, program in zip(nodes, parents)
+        ])
+
+        # activities
+        parents = [project for project in data.projects for _ in range(s["activities"])]
+        nodes = self.create_nodes([p.proposal.user for p in parents], "Activity", [f"Activity {self.words(3)}" for _ in parents])
+        data.activities = ActivityProposal.objects.bulk_create([
+            ActivityProposal(
+                proposal=node, project_proposal=project, activity_title=node.title, project_leader=self.words(2),
+                members=[self.words(2) for _ in range(3)], activity_duration_hours=8, activity_date=date(2026, 6, 1),
+                objectives_of_activity=self.words(60), methodology=self.words(20),
+                plan_of_activity={"activity_title": node.title, "rows": [{"time": "08:00", "activity": self.words(4)} for _ in range(6)]},
+                **self.document_fields()
+            )
+            for node, project in zip(nodes, parents)
+        ])
+
+        self.create_history(data)
+        self.create_assignments(data)
+        self.create_notifications(data)
+        return data
+
+    def create_history(self, data):
+        rounds = range(1, self.scale["history_rounds"] + 1)
+        copies = [
+            (ProgramProposalHistory, data.programs, ["program_title", "program_leader", "project_list", "general_objectives", "specific_objectives", "workplan"]),
+            (ProjectProposalHistory, data.projects, ["project_title", "project_leader", "members", "duration_months", "start_date", "end_date", "general_objectives", "specific_objectives", "workplan"]),
+            (ActivityProposalHistory, data.activities, ["activity_title", "project_leader", "members", "activity_duration_hours", "activity_date", "objectives_of_activity", "methodology", "plan_of_activity"]),
+        ]
+        shared = ["implementing_agency", "cooperating_agencies", "extension_sites", "tags", "clusters", "agendas", "sdg_addressed",
+                  "mandated_academic_program", "rationale", "significance", "expected_output_6ps", "sustainability_plan",
+                  "org_and_staffing", "budget_requirements"]
+        for model, documents, fields in copies:
+            model.objects.bulk_create([
+                model(proposal=document.proposal, version=version, **{f: getattr(document, f) for f in fields + shared})
+                for document in documents
+                for version in rounds
+            ], batch_size=2000)
+
+    def create_assignments(self, data):
+        per_program = min(self.scale["reviewers_per_program"], len(data.reviewers))
+        projects_by_program = {}
+        for project in data.projects:
+            projects_by_program.setdefault(project.program_proposal_id, []).append(project)
+        activities_by_project = {}
+        for activity in data.activities:
+            activities_by_project.setdefault(activity.project_proposal_id, []).append(activity)
+
+        rows = []
+        for program in data.programs:
+            for reviewer in self.rng.sample(data.reviewers, per_program):
+                rows.append(ProposalReviewer(proposal=program.proposal, reviewer=reviewer, assigned_by=data.admin, proposal_type="program", is_review=True))
+                for project in projects_by_program.get(program.id, []):
+                    rows.append(ProposalReviewer(proposal=project.proposal, reviewer=reviewer, assigned_by=data.admin, proposal_type="project", is_review=True))
+                    for activity in activities_by_project.get(project.id, []):
+                        rows.append(ProposalReviewer(proposal=activity.proposal, reviewer=reviewer, assigned_by=data.admin, proposal_type="activity", is_review=True))
+        data.assignments = ProposalReviewer.objects.bulk_create(rows, batch_size=2000)
+
+        reviews = ProposalReview.objects.bulk_create([
+            ProposalReview(
+                proposal_reviewer=assignment, proposal_node=assignment.proposal, proposal_type=assignment.proposal_type,
+                decision="needs_revision", review_round=self.scale["history_rounds"] + 1
+            )
+            for assignment in data.assignments
+        ], batch_size=2000)
+
+        sections = list(ReviewComment.SECTION_FIELDS)
+        comments = []
+        for review in reviews:
+            for review_round in range(ReviewComment.CURRENT_ROUND, self.scale["history_rounds"] + 1):
+                for section in self.rng.sample(sections, COMMENTS_PER_ROUND):
+                    comments.append(ReviewComment(review=review, section=section, review_round=review_round, comment=self.words(30)))
+        ReviewComment.objects.bulk_create(comments, batch_size=5000)
+
+    def create_notifications(self, data):
+        Notification.objects.bulk_create([
+            Notification(user=user, message=f"Notification {i}: {self.words(12)}", is_read=self.rng.random() < 0.7)
+            for user in [data.admin, *data.implementors, *data.reviewers]
+            for i in range(self.scale["notifications"])
+        ], batch_size=5000)
@@ -0,0 +1,260 @@
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from urllib import request as urlrequest
+from urllib.error import HTTPError, URLError
+from django.core.signals import got_request_exception
+from django.db import IntegrityError, OperationalError
+from django.db.models import Count
+from django.test.testcases import LiveServerThread, _StaticFilesHandler
+from rest_framework_simplejwt.tokens import AccessToken
+from project_proposal.models import ProjectProposal, ProjectProposalHistory
+from activity_proposal.models import ActivityProposal, ActivityProposalHistory
+from reviewer.models import ProposalReviewer
+from reviews.models import ProposalReview, ReviewComment
+from .runner import percentile
+
+# postgres sqlstates worth calling out in the report
+DEADLOCK = "40P01"
+SERIALIZATION_FAILURE = "40001"
+
+
+@dataclass
+class HotNode:
+    kind: str
+    document_id: int
+    proposal_id: int
+    owner: object
+    assignments: list = field(default_factory=list)
+
+
+class LiveServer:
+
+    def __init__(self, host="localhost", port=0):
+        self.thread = LiveServerThread(host, _StaticFilesHandler, port=port)
+        self.thread.daemon = True
+
+    def __enter__(self):
+        self.thread.start()
+        self.thread.is_ready.wait()
+        if self.thread.error:
+            raise self.thread.error
+        return f"http://{self.thread.host}:{self.thread.port}"
+
+    def __exit__(self, *exc):
+        self.thread.terminate()
+
+
+# counts the exceptions the server swallowed into 500 responses, keyed by sqlstate where there is one
+class ServerErrors:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = defaultdict(int)
+
+    def __enter__(self):
+        got_request_exception.connect(self.record)
+        return self
+
+    def __exit__(self, *exc):
+        got_request_exception.disconnect(self.record)
+
+    def record(self, sender, request=None, **kwargs):
+        error = sys.exc_info()[1]
+        pgcode = getattr(getattr(error, "__cause__", None), "pgcode", None)
+        if pgcode == DEADLOCK:
+            key = "deadlock"
+        elif pgcode == SERIALIZATION_FAILURE:
+            key = "serialization_failure"
+        elif isinstance(error, IntegrityError):
+            key = "integrity_error"
+        elif isinstance(error, OperationalError):
+            key = "operational_error"
+        else:
+            key = type(error).__name__
+        with self.lock:
+            self.counts[key] += 1
+
+
+# the busiest review week: reviewers submit and update reviews while implementors push revisions
+# that move those reviews into history, all against the same hot set of projects and activities
+class ReviewWorkloadLoadTest:
+
+    def __init__(self, data, hot=10, reviewers=8, implementors=2, duration=10.0, think=0.0, seed=42, fresh_reviews=0.5):
+        self.rng = random.Random(seed)
+        self.reviewer_workers = reviewers
+        self.implementor_workers = implementors
+        self.duration = duration
+        self.think = think
+
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.accepted_reviews = []
+        self.accepted_revisions = []
+        self.has_review = set()
+        self.tokens = {}
+        self.nodes = self.prepare(data, hot, fresh_reviews)
+
+    def token(self, user):
+        if user.id not in self.tokens:
+            self.tokens[user.id] = str(AccessToken.for_user(user))
+        return self.tokens[user.id]
+
+    # open every hot node for review, with a share of the assignments not reviewed at all yet
+    def prepare(self, data, hot, fresh_reviews):
+        nodes = [HotNode("project", p.id, p.proposal_id, p.proposal.user) for p in data.projects[:hot]]
+        nodes += [HotNode("activity", a.id, a.proposal_id, a.proposal.user) for a in data.activities[:hot]]
+        by_proposal = {node.proposal_id: node for node in nodes}
+
+        assignments = list(ProposalReviewer.objects.filter(proposal_id__in=by_proposal).select_related("reviewer"))
+        for assignment in assignments:
+            by_proposal[assignment.proposal_id].assignments.append(assignment)
+        ProposalReviewer.objects.filter(id__in=[a.id for a in assignments]).update(is_review=False)
+
+        fresh = [a.id for a in assignments if self.rng.random() < fresh_reviews]
+        ProposalReview.objects.filter(proposal_reviewer_id__in=fresh).delete()
+        self.has_review = {a.id for a in assignments} - set(fresh)
+        for assignment in assignments:
+            self.token(assignment.reviewer)
+        for node in nodes:
+            self.token(node.owner)
+        return nodes
+
+    def call(self, name, method, url, user, payload):
+        body = json.dumps(payload).encode()
+        req = urlrequest.Request(url, data=body, method=method, headers={
+            "Authorization": f"Bearer {self.tokens[user.id]}",
+            "Content-Type": "application/json",
+        })
+        started = time.perf_counter()
+        try:
+            with urlrequest.urlopen(req, timeout=60) as response:
+                code = response.status
+                response.read()
+        except HTTPError as error:
+            code = error.code
+            error.read()
+        except URLError:
+            code = 0
+        elapsed = (time.perf_counter() - started) * 1000
+        with self.lock:
+            self.latencies[name].append(elapsed)
+            self.statuses[name][code] += 1
+        return code
+
+    def submit_review(self, base_url, node, assignment):
+        marker = f"lt-review-{uuid.uuid4().hex}"
+        payload = {
+            "proposal_reviewer": assignment.id,
+            "proposal_node": node.proposal_id,
+            "proposal_type": node.kind,
+            "decision": "needs_revision",
+            "rationale_feedback": marker,
+        }
+        if assignment.id in self.has_review:
+            code = self.call("review-update", "PUT", f"{base_url}/api/proposal-review-update/{node.proposal_id}/{assignment.id}/", assignment.reviewer, payload)
+        else:
+            code = self.call("review-create", "POST", f"{base_url}/api/proposal-review/", assignment.reviewer, payload)
+            if code == 201:
+                with self.lock:
+                    self.has_review.add(assignment.id)
+        if 200 <= code < 300:
+            with self.lock:
+                self.accepted_reviews.append(marker)
+
+    def submit_revision(self, base_url, node):
+        marker = f"lt-revision-{uuid.uuid4().hex}"
+        url = f"{base_url}/api/{node.kind}-proposal/{node.document_id}/update-{node.kind}-save-history/"
+        code = self.call(f"{node.kind}-revision", "PUT", url, node.owner, {"proposal": node.proposal_id, "rationale": marker})
+        if 200 <= code < 300:
+            with self.lock:
+                self.accepted_revisions.append((node.kind, node.proposal_id, marker))
+
+    def reviewer_loop(self, base_url, deadline, rng):
+        while time.monotonic() < deadline:
+            node = rng.choice(self.nodes)
+            if node.assignments:
+                self.submit_review(base_url, node, rng.choice(node.assignments))
+            if self.think:
+                time.sleep(rng.random() * self.think)
+
+    def implementor_loop(self, base_url, deadline, rng):
+        while time.monotonic() < deadline:
+            self.submit_revision(base_url, rng.choice(self.nodes))
+            if self.think:
+                time.sleep(rng.random() * self.think)
+
+    def run(self, base_url):
+        deadline = time.monotonic() + self.duration
+        threads = [
+            threading.Thread(target=self.reviewer_loop, args=(base_url, deadline, random.Random(self.rng.random())))
+            for _ in range(self.reviewer_workers)
+        ] + [
+            threading.Thread(target=self.implementor_loop, args=(base_url, deadline, random.Random(self.rng.random())))
+            for _ in range(self.implementor_workers)
+        ]
+        started = time.perf_counter()
+        with ServerErrors() as server_errors:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        elapsed = time.perf_counter() - started
+        return self.report(elapsed, server_errors.counts)
+
+    # every accepted write has to survive somewhere, either in the current row or in history
+    def anomalies(self):
+        proposal_ids = [node.proposal_id for node in self.nodes]
+        review_texts = set(
+            ReviewComment.objects.filter(review__proposal_node_id__in=proposal_ids, section="rationale").values_list("comment", flat=True)
+        )
+        revision_texts = set()
+        for model in (ProjectProposal, ProjectProposalHistory, ActivityProposal, ActivityProposalHistory):
+            revision_texts |= set(model.objects.filter(proposal_id__in=proposal_ids).values_list("rationale", flat=True))
+
+        def duplicates(queryset, *fields):
+            return queryset.values(*fields).annotate(n=Count("id")).filter(n__gt=1).count()
+
+        return {
+            "lost_review_updates": sum(1 for marker in self.accepted_reviews if marker not in review_texts),
+            "lost_revisions": sum(1 for _, _, marker in self.accepted_revisions if marker not in revision_texts),
+            "duplicate_review_rounds": duplicates(
+                ReviewComment.objects.filter(review__proposal_node_id__in=proposal_ids), "review", "section", "review_round"
+            ),
+            "duplicate_history_versions": duplicates(
+                ProjectProposalHistory.objects.filter(proposal_id__in=proposal_ids), "proposal", "version"
+            ) + duplicates(
+                ActivityProposalHistory.objects.filter(proposal_id__in=proposal_ids), "proposal", "version"
+            ),
+        }
+
+    def report(self, elapsed, server_errors):
+        operations = {}
+        everything = []
+        for name, values in sorted(self.latencies.items()):
+            everything += values
+            operations[name] = {
+                "requests": len(values),
+                "statuses": dict(sorted(self.statuses[name].items())),
+                "p50_ms": round(percentile(values, 0.50), 2),
+                "p95_ms": round(percentile(values, 0.95), 2),
+                "p99_ms": round(percentile(values, 0.99), 2),
+            }
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "requests": len(everything),
+            "throughput_rps": round(len(everything) / elapsed, 2) if elapsed else 0,
+            "p50_ms": round(percentile(everything, 0.50), 2) if everything else None,
+            "p95_ms": round(percentile(everything, 0.95), 2) if everything else None,
+            "p99_ms": round(percentile(everything, 0.99), 2) if everything else None,
+            "operations": operations,
+            "server_errors": dict(server_errors),
+            "deadlocks": server_errors.get("deadlock", 0),
+            "anomalies": self.anomalies(),
+        }
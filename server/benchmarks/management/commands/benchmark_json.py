@@ -0,0 +1,59 @@
+import gzip
+import io
+import json
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from benchmarks.factory import SyntheticDataFactory, SCALES
+from config.compression import brotli
+from config.parsers import ORJSONParser
+from config.renderers import ORJSONRenderer
+from program_proposal.serializers import ProgramProposalSerializer
+from reviews.selectors import ProposalReviewSelectors
+
+
+class Command(BaseCommand):
+    help = "Compare stdlib and orjson render/parse time and compressed sizes on the largest program documents."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", choices=SCALES.keys(), default="small")
+        parser.add_argument("--documents", type=int, default=10, help="largest program documents to use")
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def timed(self, fn, repeat):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        return (time.perf_counter() - started) / repeat * 1000
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            data = SyntheticDataFactory(seed=42, **SCALES[options["scale"]]).build()
+            payloads = {
+                "program-document": [ProgramProposalSerializer(program).data for program in data.programs],
+                "program-reviews": [ProposalReviewSelectors.proposal_reviews_mapper(p.proposal_id, "program") for p in data.programs],
+            }
+            transaction.set_rollback(True)
+
+        stdlib, fast = JSONRenderer(), ORJSONRenderer()
+        stdlib_parser, fast_parser = JSONParser(), ORJSONParser()
+        for name, documents in payloads.items():
+            largest = sorted(documents, key=lambda d: len(stdlib.render(d)), reverse=True)[:options["documents"]]
+            body = stdlib.render(largest)
+            assert json.loads(fast.render(largest)) == json.loads(body)
+
+            render_std = self.timed(lambda: stdlib.render(largest), options["repeat"])
+            render_fast = self.timed(lambda: fast.render(largest), options["repeat"])
+            parse_std = self.timed(lambda: stdlib_parser.parse(io.BytesIO(body)), options["repeat"])
+            parse_fast = self.timed(lambda: fast_parser.parse(io.BytesIO(body)), options["repeat"])
+            gzipped = len(gzip.compress(body, compresslevel=6))
+            brotlied = len(brotli.compress(body, quality=5)) if brotli else None
+
+            self.stdout.write(
+                f"{name}: {len(largest)} documents, {len(body)} bytes, gzip {gzipped} bytes"
+                + (f", br {brotlied} bytes" if brotlied else "")
+            )
+            self.stdout.write(f"  render  stdlib {render_std:8.3f}ms  orjson {render_fast:8.3f}ms  ({render_std / render_fast:.1f}x)")
+            self.stdout.write(f"  parse   stdlib {parse_std:8.3f}ms  orjson {parse_fast:8.3f}ms  ({parse_std / parse_fast:.1f}x)")
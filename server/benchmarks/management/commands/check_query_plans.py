@@ -0,0 +1,44 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from benchmarks.factory import SyntheticDataFactory, SCALES
+from benchmarks.plans import check_plans
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a synthetic dataset into a throwaway test database and fail when a critical query "
+        "plan falls back to a seq scan or goes over its cost budget."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", choices=SCALES.keys(), default="medium")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--force-index", action="store_true", help="disable seq scans to check an index exists at all")
+        parser.add_argument("--output", help="write the plans summary to this JSON file")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("query plan checks need postgresql")
+
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            self.stdout.write(f"seeding {options['scale']} dataset")
+            data = SyntheticDataFactory(seed=options["seed"], **SCALES[options["scale"]]).build()
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE")
+            results = check_plans(data, force_index=options["force_index"])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        for r in results:
+            status = "; ".join(r["problems"]) or "ok"
+            self.stdout.write(f"{r['name']:32} {r['node']:20} cost={r['cost']:10.2f} rows={r['rows']:6} {status}")
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(results, f, indent=2)
+
+        failed = [r["name"] for r in results if r["problems"]]
+        if failed:
+            raise CommandError(f"query plan regressions: {', '.join(failed)}")
@@ -0,0 +1,76 @@
+import json
+import platform
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from benchmarks.factory import SyntheticDataFactory, SCALES
+from benchmarks.runner import build_cases, run_case, compare
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a deterministic synthetic dataset into a throwaway test database, time the hot endpoints "
+        "through the DRF test client and write or compare a JSON baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", choices=SCALES.keys(), default="small")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--only", nargs="*", help="run only these benchmark names")
+        parser.add_argument("--output", help="write the results to this JSON file")
+        parser.add_argument("--compare", help="fail when results regress against this JSON baseline")
+        parser.add_argument("--threshold", type=float, default=0.25, help="allowed latency and memory growth")
+        parser.add_argument("--keepdb", action="store_true", help="reuse the test database between runs")
+        for key in SCALES["small"]:
+            parser.add_argument(f"--{key.replace('_', '-')}", type=int, dest=key, help=f"override the scale {key}")
+
+    def handle(self, *args, **options):
+        scale = {**SCALES[options["scale"]]}
+        scale.update({key: options[key] for key in scale if options.get(key) is not None})
+
+        setup_test_environment(debug=True)
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options["keepdb"])
+        try:
+            self.stdout.write(f"seeding {options['scale']} dataset {scale}")
+            data = SyntheticDataFactory(seed=options["seed"], **scale).build()
+
+            results = {}
+            for case in build_cases(data):
+                if options["only"] and case.name not in options["only"]:
+                    continue
+                results[case.name] = run_case(case, repeat=options["repeat"])
+                r = results[case.name]
+                self.stdout.write(
+                    f"{case.name:36} {r['status']} median={r['median_ms']:8.2f}ms p95={r['p95_ms']:8.2f}ms "
+                    f"queries={r['queries']:5} peak={r['peak_kb']:9.1f}KB bytes={r['bytes']}"
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        report = {
+            "meta": {
+                "scale": options["scale"],
+                "dataset": scale,
+                "seed": options["seed"],
+                "repeat": options["repeat"],
+                "database": connection.vendor,
+                "python": platform.python_version(),
+                "django": django.get_version(),
+            },
+            "results": results,
+        }
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f"wrote {options['output']}")
+
+        if options["compare"]:
+            with open(options["compare"]) as f:
+                baseline = json.load(f)["results"]
+            regressions = compare(results, baseline, options["threshold"])
+            if regressions:
+                raise CommandError("benchmark regressions:\n" + "\n".join(regressions))
+            self.stdout.write("no regressions against baseline")
@@ -0,0 +1,71 @@
+import json
+import logging
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+from benchmarks.factory import SyntheticDataFactory, SCALES
+from benchmarks.loadtest import LiveServer, ReviewWorkloadLoadTest
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive concurrent review submissions and implementor revisions against an in-process threaded server "
+        "on a throwaway test database, then report throughput, latency percentiles, deadlocks and lost updates."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", choices=SCALES.keys(), default="small")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--duration", type=float, default=10.0, help="seconds to keep the workers busy")
+        parser.add_argument("--reviewers", type=int, default=8, help="concurrent reviewer workers")
+        parser.add_argument("--implementors", type=int, default=2, help="concurrent implementor workers")
+        parser.add_argument("--hot", type=int, default=10, help="projects and activities the workers contend on")
+        parser.add_argument("--think", type=float, default=0.0, help="max random pause between requests, in seconds")
+        parser.add_argument("--port", type=int, default=0)
+        parser.add_argument("--output", help="write the report to this JSON file")
+        parser.add_argument("--fail-on-anomaly", action="store_true", help="exit non-zero on deadlocks or lost updates")
+
+    def handle(self, *args, **options):
+        # expected 400s and the 500s counted in the report would otherwise flood the output
+        logging.getLogger("django.request").setLevel(logging.CRITICAL)
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            self.stdout.write(f"seeding {options['scale']} dataset")
+            data = SyntheticDataFactory(seed=options["seed"], **SCALES[options["scale"]]).build()
+            load_test = ReviewWorkloadLoadTest(
+                data,
+                hot=options["hot"],
+                reviewers=options["reviewers"],
+                implementors=options["implementors"],
+                duration=options["duration"],
+                think=options["think"],
+                seed=options["seed"],
+            )
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "localhost", "127.0.0.1"]):
+                with LiveServer(port=options["port"]) as base_url:
+                    self.stdout.write(f"running {options['reviewers']} reviewer and {options['implementors']} implementor workers against {base_url}")
+                    report = load_test.run(base_url)
+        finally:
+            connection.close()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        self.stdout.write(
+            f"{report['requests']} requests in {report['elapsed_s']}s, {report['throughput_rps']} req/s, "
+            f"p50={report['p50_ms']}ms p95={report['p95_ms']}ms p99={report['p99_ms']}ms"
+        )
+        for name, op in report["operations"].items():
+            self.stdout.write(
+                f"  {name:20} n={op['requests']:6} p50={op['p50_ms']:8.2f}ms p95={op['p95_ms']:8.2f}ms "
+                f"p99={op['p99_ms']:8.2f}ms statuses={op['statuses']}"
+            )
+        self.stdout.write(f"server errors: {report['server_errors'] or 'none'}")
+        self.stdout.write(f"anomalies: {report['anomalies']}")
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f"wrote {options['output']}")
+
+        if options["fail_on_anomaly"] and (report["deadlocks"] or any(report["anomalies"].values())):
+            raise CommandError("load test found deadlocks or lost updates")
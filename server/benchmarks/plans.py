@@ -0,0 +1,84 @@
+import json
+from dataclasses import dataclass
+from django.db import connection, transaction
+from notifications.models import Notification
+from proposals_node.models import Proposal
+from program_proposal.models import ProgramProposalHistory
+from project_proposal.models import ProjectProposal, ProjectProposalHistory
+from activity_proposal.models import ActivityProposalHistory
+from reviewer.models import ProposalReviewer
+from reviews.models import ReviewComment
+from reviews.selectors import ProposalReviewSelectors
+
+
+@dataclass
+class PlanCheck:
+    name: str
+    queryset: object
+    max_cost: float
+
+
+# the querysets behind the hot read paths, resolved against one synthetic dataset
+# max_cost is the planner's total cost on the medium dataset with some headroom
+def critical_queries(data):
+    program = data.programs[0]
+    project = next(p for p in data.projects if p.program_proposal_id == program.id)
+    activity = next(a for a in data.activities if a.project_proposal_id == project.id)
+    implementor = program.proposal.user
+    reviewer = next(a for a in data.assignments if a.proposal_id == program.proposal_id).reviewer
+
+    return [
+        PlanCheck("review-comments-current", ProposalReviewSelectors.review_comments(program.proposal_id, ReviewComment.CURRENT_ROUND), 100),
+        PlanCheck("review-comments-by-round", ProposalReviewSelectors.review_comments(program.proposal_id, 1), 100),
+        PlanCheck("notifications-by-user", Notification.objects.filter(user=implementor).order_by("-created_at"), 50),
+        PlanCheck("reviewer-program-assignments", ProposalReviewer.objects.filter(reviewer=reviewer, proposal_type="program"), 100),
+        PlanCheck(
+            "reviewer-project-assignments",
+            ProposalReviewer.objects.filter(reviewer=reviewer, proposal_type="project", proposal__project_details__program_proposal__id=program.id),
+            100,
+        ),
+        PlanCheck(
+            "reviewer-activity-assignments",
+            ProposalReviewer.objects.filter(reviewer=reviewer, proposal_type="activity", proposal__activity_details__project_proposal__id=project.id),
+            100,
+        ),
+        PlanCheck("implementor-proposals", Proposal.objects.filter(user=implementor, proposal_type="Program"), 100),
+        PlanCheck("program-projects", ProjectProposal.objects.filter(program_proposal_id=program.id), 100),
+        PlanCheck("program-latest-history", ProgramProposalHistory.objects.filter(proposal_id=program.proposal_id).order_by("-version")[:1], 50),
+        PlanCheck("project-latest-history", ProjectProposalHistory.objects.filter(proposal_id=project.proposal_id).order_by("-version")[:1], 50),
+        PlanCheck("activity-latest-history", ActivityProposalHistory.objects.filter(proposal_id=activity.proposal_id).order_by("-version")[:1], 50),
+    ]
+
+
+def explain(queryset, force_index=False):
+    with transaction.atomic():
+        if force_index:
+            # seq scans only survive this when no index can serve the query
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        return json.loads(queryset.explain(format="json"))[0]["Plan"]
+
+
+def seq_scans(plan):
+    found = [plan["Relation Name"]] if plan["Node Type"] == "Seq Scan" else []
+    for child in plan.get("Plans", []):
+        found += seq_scans(child)
+    return found
+
+
+def check_plans(data, force_index=False):
+    results = []
+    for check in critical_queries(data):
+        plan = explain(check.queryset, force_index)
+        problems = [f"seq scan on {table}" for table in seq_scans(plan)]
+        # disabled seq scans inflate the cost, so the budget only applies to real plans
+        if not force_index and plan["Total Cost"] > check.max_cost:
+            problems.append(f"cost {plan['Total Cost']} over budget {check.max_cost}")
+        results.append({
+            "name": check.name,
+            "cost": plan["Total Cost"],
+            "rows": plan["Plan Rows"],
+            "node": plan["Node Type"],
+            "problems": problems,
+        })
+    return results
@@ -0,0 +1,207 @@
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from program_proposal.models import ProgramProposalHistory
+from proposals_node.models import YearConfig
+from reviewer.models import ProposalReviewer
+from reviews.models import ReviewComment
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    method: str
+    path: str
+    user: object
+    data: dict = None
+    setup: object = None
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))
+    return ordered[index]
+
+
+# the hot endpoints, resolved against one synthetic dataset
+def build_cases(data):
+    program = data.programs[0]
+    project = next(p for p in data.projects if p.program_proposal_id == program.id)
+    activity = next(a for a in data.activities if a.project_proposal_id == project.id)
+    implementor = program.proposal.user
+    assignment = next(a for a in data.assignments if a.proposal_id == program.proposal_id)
+    reviewer = assignment.reviewer
+    year = program.proposal.created_at.year
+
+    def mark_reviewed(proposal_id):
+        return lambda: ProposalReviewer.objects.filter(proposal_id=proposal_id).update(is_review=True)
+
+    # remove the pair so every repeat assigns from scratch
+    spare_reviewer = data.reviewers[-1]
+    def unassign_spare():
+        ProposalReviewer.objects.filter(reviewer=spare_reviewer, proposal__in=[
+            program.proposal_id,
+            *[p.proposal_id for p in data.projects if p.program_proposal_id == program.id],
+            *[a.proposal_id for a in data.activities if a.project_proposal.program_proposal_id == program.id],
+        ]).delete()
+
+    # an open draft with a stale rationale, every autosave rewrites one section
+    def open_draft():
+        ProposalReviewer.objects.filter(id=assignment.id).update(is_review=False)
+        ReviewComment.objects.filter(
+            review__proposal_reviewer=assignment, review_round=ReviewComment.CURRENT_ROUND, section="rationale"
+        ).delete()
+
+    return [
+        BenchmarkCase("proposal-list", "get", "/api/proposals-node/Program/", implementor),
+        BenchmarkCase("admin-proposal-list", "get", "/api/admin/proposals-node/Program/", data.admin),
+        BenchmarkCase("admin-overview", "get", f"/api/admin/overview-proposals/{year}/", data.admin),
+        BenchmarkCase("admin-overview-series", "get", f"/api/admin/overview-proposals/series/month/?year_from={year - 2}&year_to={year}", data.admin),
+        BenchmarkCase("reviewer-program-proposal-list", "get", "/api/reviewer-proposals/program/", reviewer),
+        BenchmarkCase("reviewer-project-proposal-list", "get", f"/api/reviewer-proposals/project/{program.id}/", reviewer),
+        BenchmarkCase("reviewer-activity-proposal-list", "get", f"/api/reviewer-proposals/activity/{project.id}/", reviewer),
+        BenchmarkCase("proposal-review-by-proposal", "get", f"/api/proposal-review/proposal/{program.proposal_id}/program/", reviewer),
+        BenchmarkCase("program-proposal-history-list", "get", f"/api/program-proposal/{program.proposal_id}/history-list/", implementor),
+        BenchmarkCase("project-list-history", "get", f"/api/project-proposal/{project.proposal_id}/history-list/", implementor),
+        BenchmarkCase("activity-proposal-history-list", "get", f"/api/activity-proposal/{activity.proposal_id}/history-list/", implementor),
+        BenchmarkCase(
+            "program-proposal-revision", "put", f"/api/program-proposal/{program.id}/", implementor,
+            data={"proposal": program.proposal_id, "title": program.program_title, "program_title": program.program_title, "rationale": "Revised rationale"},
+            setup=mark_reviewed(program.proposal_id),
+        ),
+        BenchmarkCase(
+            "update-project-save-history", "put", f"/api/project-proposal/{project.id}/update-project-save-history/", implementor,
+            data={"proposal": project.proposal_id, "rationale": "Revised rationale"},
+            setup=mark_reviewed(project.proposal_id),
+        ),
+        BenchmarkCase(
+            "update-activity-save-history", "put", f"/api/activity-proposal/{activity.id}/update-activity-save-history/", implementor,
+            data={"proposal": activity.proposal_id, "rationale": "Revised rationale"},
+            setup=mark_reviewed(activity.proposal_id),
+        ),
+        BenchmarkCase(
+            "assign-reviewer", "post", "/api/assign-reviewer/", data.admin,
+            data={"proposal": program.proposal_id, "reviewer": spare_reviewer.id},
+            setup=unassign_spare,
+        ),
+        BenchmarkCase(
+            "program-tree-create", "post", "/api/program-proposal/tree/", implementor,
+            data={
+                "title": "Benchmark tree",
+                "program_title": "Benchmark tree",
+                "projects": [
+                    {"project_title": f"Project {p}", "activities": [{"activity_title": f"Activity {p}.{a}"} for a in range(8)]}
+                    for p in range(10)
+                ],
+            },
+        ),
+        BenchmarkCase(
+            "review-draft-autosave", "patch", f"/api/proposal-review-draft/{assignment.id}/", reviewer,
+            data={"sections": {"rationale": {"comment": "Draft rationale feedback", "version": None}}},
+            setup=open_draft,
+        ),
+    ]
+
+
+# one read per GET route, used to hold every endpoint to its query budget
+def read_cases(data):
+    program = data.programs[0]
+    project = next(p for p in data.projects if p.program_proposal_id == program.id)
+    activity = next(a for a in data.activities if a.project_proposal_id == project.id)
+    implementor = program.proposal.user
+    assignment = next(a for a in data.assignments if a.proposal_id == program.proposal_id)
+    reviewer = assignment.reviewer
+    year = program.proposal.created_at.year
+    history = ProgramProposalHistory.objects.filter(proposal_id=program.proposal_id).first()
+    YearConfig.objects.get_or_create(year=year, defaults={"total_budget": 1000000})
+
+    return [
+        BenchmarkCase("my-profile", "get", "/api/users/profile/me/", implementor),
+        BenchmarkCase("user-detail", "get", f"/api/users/profile/{implementor.id}/", data.admin),
+        BenchmarkCase("admin-user-list", "get", "/api/users/admin/", data.admin),
+        BenchmarkCase("admin-user-detail", "get", f"/api/users/admin/{implementor.id}/", data.admin),
+        BenchmarkCase("admin-overview-users", "get", "/api/users/admin/overview-users/", data.admin),
+        BenchmarkCase("admin-proposal-facets", "get", "/api/admin/proposals-node/Program/facets/", data.admin),
+        BenchmarkCase("admin-get-year-config", "get", f"/api/admin/get-year-config/{year}/", data.admin),
+        BenchmarkCase("admin-overview-series-weekly", "get", f"/api/admin/overview-proposals/series/week/?year_from={year - 2}&year_to={year}", data.admin),
+        BenchmarkCase("program-proposal-detail", "get", f"/api/program-proposal/{program.id}/", implementor),
+        BenchmarkCase("program-proposal-projects", "get", f"/api/program-proposal/{program.id}/projects/", implementor),
+        BenchmarkCase("project-proposal-detail", "get", f"/api/project-proposal/{project.id}/", implementor),
+        BenchmarkCase("project-proposal-activities", "get", f"/api/project-proposal/{project.id}/activities/", implementor),
+        BenchmarkCase("global-stats", "get", "/api/global-stats/", implementor),
+        BenchmarkCase("activity-proposal-detail", "get", f"/api/activity-proposal/{activity.id}/", implementor),
+        BenchmarkCase("assign-reviewer-list", "get", "/api/assign-reviewer/", data.admin),
+        BenchmarkCase("assigned-reviewer-detail", "get", f"/api/assigned-reviewer/{program.proposal_id}/", data.admin),
+        BenchmarkCase("reviewer-list", "get", "/api/reviewers/", data.admin),
+        BenchmarkCase("reviewer-workload", "get", "/api/reviewers/workload/", data.admin),
+        BenchmarkCase("assigned-reviewer-proposal-list", "get", f"/api/reviewer-proposal-list/{program.proposal_id}/", data.admin),
+        BenchmarkCase("proposal-check-reviews", "get", f"/api/proposal/{program.proposal_id}/check-reviews/", implementor),
+        BenchmarkCase("proposal-cover-list", "get", "/api/proposal-cover/", data.admin),
+        BenchmarkCase("notification-list", "get", "/api/notifications/", implementor),
+        BenchmarkCase("proposal-review-detail", "get", f"/api/proposal-review/{program.proposal_id}/", reviewer),
+        BenchmarkCase("proposal-review-draft", "get", f"/api/proposal-review-draft/{assignment.id}/", reviewer),
+        BenchmarkCase(
+            "proposal-review-history-by-proposal-history", "get",
+            f"/api/proposal-review/proposal-history/{program.proposal_id}/{history.id}/{history.version}/program/", implementor,
+        ),
+        BenchmarkCase("proposal-diff", "get", f"/api/proposal-diff/{program.proposal_id}/{history.version}/current/", reviewer),
+        BenchmarkCase("admin-budget-report", "get", "/api/admin/budget-report/campus/", data.admin),
+        BenchmarkCase("admin-analytics-turnaround", "get", "/api/admin/analytics/turnaround/campus/", data.admin),
+        BenchmarkCase("proposal-search", "get", "/api/search/?q=community", data.admin),
+    ] + [case for case in build_cases(data) if case.method == "get"]
+
+
+def request(client, case):
+    if case.setup:
+        case.setup()
+    client.force_authenticate(case.user)
+    return getattr(client, case.method)(case.path, case.data, format="json")
+
+
+# timed repeats first, then one extra pass under tracemalloc and query capture
+def run_case(case, repeat=5):
+    client = APIClient()
+    timings = []
+    response = None
+    for _ in range(repeat):
+        if case.setup:
+            case.setup()
+        client.force_authenticate(case.user)
+        started = time.perf_counter()
+        response = getattr(client, case.method)(case.path, case.data, format="json")
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    with CaptureQueriesContext(connection) as queries:
+        response = request(client, case)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "status": response.status_code,
+        "median_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(percentile(timings, 0.95), 2),
+        "min_ms": round(min(timings), 2),
+        "queries": len(queries),
+        "peak_kb": round(peak / 1024, 1),
+        "bytes": len(response.content),
+    }
+
+
+def compare(results, baseline, threshold=0.25):
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if result["queries"] > before["queries"]:
+            regressions.append(f"{name}: queries {before['queries']} -> {result['queries']}")
+        if result["median_ms"] > before["median_ms"] * (1 + threshold):
+            regressions.append(f"{name}: median {before['median_ms']}ms -> {result['median_ms']}ms")
+        if result["peak_kb"] > before["peak_kb"] * (1 + threshold):
+            regressions.append(f"{name}: peak memory {before['peak_kb']}KB -> {result['peak_kb']}KB")
+    return regressions
@@ -0,0 +1,47 @@
+from django.test import TestCase, LiveServerTestCase
+from .factory import SyntheticDataFactory, SCALES
+from django.urls import resolve
+from rest_framework.test import APIClient
+from metrics.testing import QueryBudgetMixin
+from .runner import build_cases, read_cases, run_case
+from .plans import check_plans
+from .loadtest import ReviewWorkloadLoadTest
+
+class BenchmarkSuiteTest(TestCase):
+
+    def test_every_benchmark_endpoint_succeeds_on_tiny_dataset(self):
+        data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        for case in build_cases(data):
+            result = run_case(case, repeat=1)
+            self.assertLess(result["status"], 300, case.name)
+
+
+class QueryBudgetTest(QueryBudgetMixin, TestCase):
+
+    def test_read_endpoints_stay_within_query_budget(self):
+        data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        for case in read_cases(data):
+            client = APIClient()
+            client.force_authenticate(case.user)
+            path = case.path.split("?")[0]
+            with self.subTest(case.name), self.assertQueryBudget(f"GET {resolve(path).route}"):
+                response = client.get(case.path)
+            self.assertEqual(response.status_code, 200, case.name)
+
+
+class QueryPlanTest(TestCase):
+
+    def test_critical_queries_have_an_index(self):
+        data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        for result in check_plans(data, force_index=True):
+            self.assertEqual(result["problems"], [], result["name"])
+
+
+class ReviewWorkloadLoadTestTest(LiveServerTestCase):
+
+    def test_short_run_reports_latency_and_anomalies(self):
+        data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        report = ReviewWorkloadLoadTest(data, hot=2, reviewers=2, implementors=1, duration=1).run(self.live_server_url)
+        self.assertGreater(report["requests"], 0)
+        self.assertIn("review-create", report["operations"])
+        self.assertEqual(set(report["anomalies"]), {"lost_review_updates", "lost_revisions", "duplicate_review_rounds", "duplicate_history_versions"})
@@ -0,0 +1,5 @@
+from django.contrib import admin
+from .models import BudgetLineItem
+
+admin.site.register(BudgetLineItem)
+# Register your models here.
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('proposals_node', '0008_alter_proposal_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BudgetLineItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('proposal_type', models.CharField(choices=[('Program', 'Program'), ('Project', 'Project'), ('Activity', 'Activity')], max_length=20)),
+                ('version', models.IntegerField(blank=True, null=True)),
+                ('is_current', models.BooleanField(default=True)),
+                ('year', models.IntegerField()),
+                ('campus', models.CharField(blank=True, max_length=100, null=True)),
+                ('category', models.CharField(blank=True, max_length=100, null=True)),
+                ('item', models.CharField(blank=True, max_length=255, null=True)),
+                ('quantity', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('unit_cost', models.DecimalField(blank=True, decimal_places=2, max_digits=14, null=True)),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('proposal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='budget_line_items', to='proposals_node.proposal')),
+            ],
+            options={
+                'ordering': ['proposal', 'version', 'position'],
+                'indexes': [models.Index(fields=['proposal', 'version'], name='budget_proposal_version_idx'), models.Index(fields=['is_current', 'year', 'proposal_type'], name='budget_current_year_type_idx'), models.Index(fields=['is_current', 'year', 'campus'], name='budget_current_year_campus_idx'), models.Index(fields=['is_current', 'year', 'category'], name='budget_current_year_cat_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,64 @@
+from django.db import migrations
+
+from budgets.services import BudgetLineItemService
+
+
+SOURCES = [
+    ("program_proposal", "ProgramProposal", "Program", False),
+    ("program_proposal", "ProgramProposalHistory", "Program", True),
+    ("project_proposal", "ProjectProposal", "Project", False),
+    ("project_proposal", "ProjectProposalHistory", "Project", True),
+    ("activity_proposal", "ActivityProposal", "Activity", False),
+    ("activity_proposal", "ActivityProposalHistory", "Activity", True),
+]
+
+
+def backfill_line_items(apps, schema_editor):
+    BudgetLineItem = apps.get_model("budgets", "BudgetLineItem")
+    UserProfile = apps.get_model("users", "UserProfile")
+    campus_by_user = dict(UserProfile.objects.values_list("user_id", "campus"))
+
+    for app_label, model_name, proposal_type, is_history in SOURCES:
+        model = apps.get_model(app_label, model_name)
+        documents = (
+            model.objects
+            .select_related("proposal")
+            .exclude(budget_requirements__isnull=True)
+            .iterator(chunk_size=500)
+        )
+        items = []
+        for document in documents:
+            version = document.version if is_history else None
+            for position, raw in enumerate(document.budget_requirements or []):
+                parsed = BudgetLineItemService.parse_item(raw)
+                if parsed is None:
+                    continue
+                items.append(BudgetLineItem(
+                    proposal_id=document.proposal_id,
+                    proposal_type=proposal_type,
+                    version=version,
+                    is_current=version is None,
+                    year=document.proposal.created_at.year,
+                    campus=campus_by_user.get(document.proposal.user_id),
+                    position=position,
+                    **parsed
+                ))
+            if len(items) >= 1000:
+                BudgetLineItem.objects.bulk_create(items)
+                items = []
+        BudgetLineItem.objects.bulk_create(items)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budgets', '0001_initial'),
+        ('users', '0002_userprofile_name'),
+        ('program_proposal', '0007_alter_programproposal_methodology'),
+        ('project_proposal', '0007_alter_projectproposal_methodology'),
+        ('activity_proposal', '0005_activityproposalhistory_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_line_items, migrations.RunPython.noop),
+    ]
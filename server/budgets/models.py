@@ -0,0 +1,42 @@
+from django.db import models
+from proposals_node.models import Proposal
+
+# Create your models here.
+# one row per item inside the budget_requirements json of a program, project or activity
+# version is null for the current document and holds the history version otherwise
+class BudgetLineItem(models.Model):
+    PROPOSAL_TYPE_CHOICES = [
+        ('Program', 'Program'),
+        ('Project', 'Project'),
+        ('Activity', 'Activity'),
+    ]
+
+    proposal = models.ForeignKey(Proposal, on_delete=models.CASCADE, related_name="budget_line_items")
+    proposal_type = models.CharField(max_length=20, choices=PROPOSAL_TYPE_CHOICES)
+    version = models.IntegerField(null=True, blank=True)
+    is_current = models.BooleanField(default=True)
+
+    # copied from the proposal node so reports can group without joins
+    year = models.IntegerField()
+    campus = models.CharField(max_length=100, null=True, blank=True)
+
+    category = models.CharField(max_length=100, null=True, blank=True)
+    item = models.CharField(max_length=255, null=True, blank=True)
+    quantity = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    unit_cost = models.DecimalField(max_digits=14, decimal_places=2, null=True, blank=True)
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    position = models.PositiveIntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['proposal', 'version', 'position']
+        indexes = [
+            models.Index(fields=['proposal', 'version'], name='budget_proposal_version_idx'),
+            models.Index(fields=['is_current', 'year', 'proposal_type'], name='budget_current_year_type_idx'),
+            models.Index(fields=['is_current', 'year', 'campus'], name='budget_current_year_campus_idx'),
+            models.Index(fields=['is_current', 'year', 'category'], name='budget_current_year_cat_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.item} - {self.amount}"
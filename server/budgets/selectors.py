@@ -0,0 +1,56 @@
+from django.db.models import Sum, Count
+from .models import BudgetLineItem
+
+
+class BudgetReportSelectors:
+    GROUP_BY_FIELDS = {
+        "year": "year",
+        "campus": "campus",
+        "category": "category",
+        "proposal_type": "proposal_type",
+    }
+
+    @staticmethod
+    def current_line_items(year=None, proposal_type=None, campus=None):
+        queryset = BudgetLineItem.objects.filter(is_current=True)
+        if year:
+            queryset = queryset.filter(year=year)
+        if proposal_type:
+            queryset = queryset.filter(proposal_type=proposal_type)
+        if campus:
+            queryset = queryset.filter(campus=campus)
+        return queryset
+
+    # ONE grouped query per report, the proposals json is never loaded
+    @staticmethod
+    def totals_by(group_by, year=None, proposal_type=None, campus=None):
+        field = BudgetReportSelectors.GROUP_BY_FIELDS.get(group_by)
+        if field is None:
+            raise ValueError("Invalid group by")
+
+        rows = (
+            BudgetReportSelectors.current_line_items(year, proposal_type, campus)
+            .values(field)
+            .annotate(
+                total_amount=Sum('amount'),
+                line_items=Count('id'),
+                proposals=Count('proposal', distinct=True),
+            )
+            .order_by(field)
+        )
+        return [
+            {
+                "key": row[field],
+                "total_amount": row['total_amount'],
+                "line_items": row['line_items'],
+                "proposals": row['proposals'],
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def grand_total(year=None, proposal_type=None, campus=None):
+        return (
+            BudgetReportSelectors.current_line_items(year, proposal_type, campus)
+            .aggregate(total_amount=Sum('amount'), line_items=Count('id'))
+        )
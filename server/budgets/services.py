@@ -0,0 +1,92 @@
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from django.db import transaction
+from .models import BudgetLineItem
+
+
+class BudgetLineItemService:
+
+    # the budget json is free form, anything that is not a finite number fitting the column is dropped
+    # rather than failing the document save
+    @staticmethod
+    def to_decimal(value, field="amount"):
+        if value in (None, ""):
+            return None
+        try:
+            number = Decimal(str(value).replace(",", ""))
+        except (InvalidOperation, ValueError):
+            return None
+        return BudgetLineItemService.fit(number, field)
+
+    @staticmethod
+    def fit(number, field):
+        column = BudgetLineItem._meta.get_field(field)
+        if not number.is_finite():
+            return None
+        number = number.quantize(Decimal(1).scaleb(-column.decimal_places), rounding=ROUND_HALF_UP)
+        if abs(number) >= Decimal(10) ** (column.max_digits - column.decimal_places):
+            return None
+        return number
+
+    @staticmethod
+    def text(value, field):
+        if value in (None, ""):
+            return None
+        return str(value)[:BudgetLineItem._meta.get_field(field).max_length]
+
+    # the client sends either {item, amount} or the richer {item/label, qty, cost/unit_cost, amount}
+    @staticmethod
+    def parse_item(raw):
+        if not isinstance(raw, dict):
+            return None
+
+        quantity = BudgetLineItemService.to_decimal(raw.get("quantity", raw.get("qty")), "quantity")
+        unit_cost = BudgetLineItemService.to_decimal(raw.get("unit_cost", raw.get("cost")), "unit_cost")
+        amount = BudgetLineItemService.to_decimal(raw.get("amount", raw.get("total")))
+        if amount is None and quantity is not None and unit_cost is not None:
+            amount = BudgetLineItemService.fit(quantity * unit_cost, "amount")
+
+        return {
+            "category": BudgetLineItemService.text(raw.get("category"), "category"),
+            "item": BudgetLineItemService.text(raw.get("item") or raw.get("label"), "item"),
+            "quantity": quantity,
+            "unit_cost": unit_cost,
+            "amount": amount or Decimal("0"),
+        }
+
+    @staticmethod
+    def build_line_items(proposal, proposal_type, budget_requirements, version=None):
+        profile = getattr(proposal.user, "profile", None)
+        campus = profile.campus if profile else None
+        year = proposal.created_at.year
+
+        items = []
+        for position, raw in enumerate(budget_requirements or []):
+            parsed = BudgetLineItemService.parse_item(raw)
+            if parsed is None:
+                continue
+            items.append(BudgetLineItem(
+                proposal=proposal,
+                proposal_type=proposal_type,
+                version=version,
+                is_current=version is None,
+                year=year,
+                campus=campus,
+                position=position,
+                **parsed
+            ))
+        return items
+
+    # replace the line items of one document version (version=None for the current document)
+    @staticmethod
+    @transaction.atomic
+    def sync(proposal, proposal_type, budget_requirements, version=None):
+        existing = BudgetLineItem.objects.filter(proposal=proposal)
+        if version is None:
+            existing = existing.filter(is_current=True)
+        else:
+            existing = existing.filter(version=version)
+        existing.delete()
+
+        items = BudgetLineItemService.build_line_items(proposal, proposal_type, budget_requirements, version)
+        BudgetLineItem.objects.bulk_create(items)
+        return len(items)
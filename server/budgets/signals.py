@@ -0,0 +1,41 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from program_proposal.models import ProgramProposal, ProgramProposalHistory
+from project_proposal.models import ProjectProposal, ProjectProposalHistory
+from activity_proposal.models import ActivityProposal, ActivityProposalHistory
+from .services import BudgetLineItemService
+
+PROPOSAL_TYPE_BY_MODEL = {
+    ProgramProposal: "Program",
+    ProgramProposalHistory: "Program",
+    ProjectProposal: "Project",
+    ProjectProposalHistory: "Project",
+    ActivityProposal: "Activity",
+    ActivityProposalHistory: "Activity",
+}
+
+# keep the normalized budget line items in sync with the budget_requirements json on every save
+@receiver(post_save, sender=ProgramProposal)
+@receiver(post_save, sender=ProjectProposal)
+@receiver(post_save, sender=ActivityProposal)
+def sync_current_budget_line_items(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if update_fields and "budget_requirements" not in update_fields:
+        return
+    BudgetLineItemService.sync(
+        proposal=instance.proposal,
+        proposal_type=PROPOSAL_TYPE_BY_MODEL[sender],
+        budget_requirements=instance.budget_requirements,
+    )
+
+@receiver(post_save, sender=ProgramProposalHistory)
+@receiver(post_save, sender=ProjectProposalHistory)
+@receiver(post_save, sender=ActivityProposalHistory)
+def sync_history_budget_line_items(sender, instance, **kwargs):
+    BudgetLineItemService.sync(
+        proposal=instance.proposal,
+        proposal_type=PROPOSAL_TYPE_BY_MODEL[sender],
+        budget_requirements=instance.budget_requirements,
+        version=instance.version,
+    )
@@ -0,0 +1,55 @@
+from decimal import Decimal
+from django.test import TestCase
+from django.contrib.auth.models import User
+from users.models import UserProfile
+from proposals_node.models import Proposal
+from program_proposal.models import ProgramProposal, ProgramProposalHistory
+from .models import BudgetLineItem
+from .selectors import BudgetReportSelectors
+
+class BudgetLineItemTest(TestCase):
+
+    def test_line_items_follow_budget_requirements(self):
+        user = User.objects.create(username="testuser")
+        UserProfile.objects.create(user=user, role="implementor", campus="Iba", department="CCIT")
+        proposal = Proposal.objects.create(user=user, title="Test Proposal", proposal_type="Program")
+        program = ProgramProposal.objects.create(
+            proposal=proposal,
+            program_title="Test Proposal",
+            budget_requirements=[
+                {"item": "Snacks", "category": "meals", "qty": 10, "cost": "50"},
+                {"item": "Bus", "amount": 1500},
+            ]
+        )
+        ProgramProposalHistory.objects.create(
+            proposal=proposal,
+            version=1,
+            budget_requirements=[{"item": "Old", "amount": 10}]
+        )
+
+        self.assertEqual(BudgetLineItem.objects.filter(is_current=True).count(), 2)
+        self.assertEqual(BudgetLineItem.objects.filter(version=1).count(), 1)
+
+        program.budget_requirements = [{"item": "Bus", "amount": 2000}]
+        program.save()
+
+        rows = BudgetReportSelectors.totals_by("campus", year=proposal.created_at.year)
+        self.assertEqual(rows, [{"key": "Iba", "total_amount": Decimal("2000.00"), "line_items": 1, "proposals": 1}])
+
+    def test_malformed_budget_json_does_not_break_the_save(self):
+        user = User.objects.create(username="testuser")
+        proposal = Proposal.objects.create(user=user, title="Test Proposal", proposal_type="Program")
+        ProgramProposal.objects.create(
+            proposal=proposal,
+            program_title="Test Proposal",
+            budget_requirements=[
+                {"item": "Snacks", "amount": "NaN"},
+                {"item": "Bus", "amount": "1e20"},
+                {"item": "x" * 300, "category": "y" * 150, "qty": "Infinity", "cost": 5},
+            ]
+        )
+
+        rows = list(BudgetLineItem.objects.order_by("position").values_list("item", "category", "quantity", "amount"))
+        self.assertEqual(rows[0], ("Snacks", None, None, Decimal("0")))
+        self.assertEqual(rows[1], ("Bus", None, None, Decimal("0")))
+        self.assertEqual((len(rows[2][0]), len(rows[2][1]), rows[2][2]), (255, 100, None))
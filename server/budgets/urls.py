@@ -0,0 +1,10 @@
+from django.urls import path
+from rest_framework.urlpatterns import format_suffix_patterns
+from .views import AdminBudgetReportView
+
+urlpatterns = [
+    # admin budget reports
+    path("admin/budget-report/<str:group_by>/", AdminBudgetReportView.as_view(), name="admin-budget-report"),
+]
+
+urlpatterns = format_suffix_patterns(urlpatterns)
@@ -0,0 +1,27 @@
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from .selectors import BudgetReportSelectors
+# Create your views here.
+
+# ADMIN VIEWS budget totals grouped by year, campus, category or proposal type
+class AdminBudgetReportView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, group_by, format=None):
+        filters = {
+            "year": request.query_params.get("year"),
+            "proposal_type": request.query_params.get("proposal_type"),
+            "campus": request.query_params.get("campus"),
+        }
+        try:
+            rows = BudgetReportSelectors.totals_by(group_by, **filters)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "group_by": group_by,
+            "total": BudgetReportSelectors.grand_total(**filters),
+            "results": rows,
+        }, status=status.HTTP_200_OK)
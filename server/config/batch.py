@@ -0,0 +1,90 @@
+import json
+import logging
+from urllib.parse import urlsplit
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+logger = logging.getLogger(__name__)
+
+BATCH_PATH = "/api/batch/"
+
+
+# GET sub-requests to the existing api routes, run in process with the user the batch authenticated as,
+# so the JWT is decoded once and the middleware stack runs once for the whole screen
+class BatchView(APIView):
+    permission_classes = [IsAuthenticated]
+    MAX_REQUESTS = 20
+
+    def post(self, request, format=None):
+        items = request.data.get("requests") if isinstance(request.data, dict) else None
+        if not isinstance(items, list) or not items:
+            return Response({"requests": ["Send a non-empty list of {\"path\": \"/api/...\"} objects."]}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > self.MAX_REQUESTS:
+            return Response({"requests": [f"At most {self.MAX_REQUESTS} requests per batch."]}, status=status.HTTP_400_BAD_REQUEST)
+        if not all(isinstance(item, dict) and isinstance(item.get("path"), str) for item in items):
+            return Response({"requests": ["Every request needs a path."]}, status=status.HTTP_400_BAD_REQUEST)
+
+        # most views read request.user.profile, loaded once here and shared by every sub-request
+        try:
+            request.user.profile
+        except ObjectDoesNotExist:
+            pass
+
+        # a GET repeated within the batch is answered from the first run
+        done = {}
+        responses = []
+        for item in items:
+            method = str(item.get("method", "GET")).upper()
+            if method != "GET":
+                result = (status.HTTP_405_METHOD_NOT_ALLOWED, {"detail": "Only GET requests can be batched."})
+            elif item["path"] in done:
+                result = done[item["path"]]
+            else:
+                result = done[item["path"]] = self.run(request, item["path"])
+            responses.append({"id": item.get("id"), "path": item["path"], "status": result[0], "body": result[1]})
+        return Response({"responses": responses}, status=status.HTTP_200_OK)
+
+    def sub_request(self, request, path, query):
+        sub = HttpRequest()
+        sub.method = "GET"
+        sub.path = sub.path_info = path
+        sub.META = {
+            **{key: value for key, value in request.META.items() if key not in ("CONTENT_TYPE", "CONTENT_LENGTH")},
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+        }
+        sub.GET = QueryDict(query)
+        sub.COOKIES = request.COOKIES
+        # DRF authenticates a request carrying these as this user without decoding the token again
+        sub.user = request.user
+        sub._force_auth_user = request.user
+        sub._force_auth_token = request.auth
+        return sub
+
+    def run(self, request, path):
+        url = urlsplit(path)
+        if not url.path.startswith("/api/") or url.path == BATCH_PATH:
+            return status.HTTP_400_BAD_REQUEST, {"detail": "Only /api/ routes other than the batch endpoint can be batched."}
+        try:
+            match = resolve(url.path)
+        except Resolver404:
+            return status.HTTP_404_NOT_FOUND, {"detail": "Not found."}
+
+        try:
+            response = match.func(self.sub_request(request, url.path, url.query), *match.args, **match.kwargs)
+        except Exception:
+            logger.exception("batched GET %s failed", path)
+            return status.HTTP_500_INTERNAL_SERVER_ERROR, {"detail": "Internal server error."}
+
+        if hasattr(response, "data"):
+            return response.status_code, response.data
+        try:
+            return response.status_code, json.loads(response.content)
+        except ValueError:
+            return response.status_code, response.content.decode(response.charset or "utf-8", "replace")
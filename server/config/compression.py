@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# q-values of the codings the client accepts, a coding with q=0 is refused
+def accepted_encodings(header):
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+# compresses responses over COMPRESSION_MIN_BYTES with gzip, keeping django's BREACH mitigation of a random
+# length file name in the gzip header. brotli has no such slot, so it is only used when COMPRESSION_BROTLI is on
+class CompressionMiddleware(GZipMiddleware):
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.min_bytes = getattr(settings, "COMPRESSION_MIN_BYTES", 1024)
+        self.use_brotli = brotli is not None and getattr(settings, "COMPRESSION_BROTLI", False)
+        self.brotli_quality = getattr(settings, "COMPRESSION_BROTLI_QUALITY", 5)
+
+    def encoding(self, request):
+        accepted = accepted_encodings(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        fallback = accepted.get("*", 0.0)
+        offered = ["br", "gzip"] if self.use_brotli else ["gzip"]
+        # the first offered coding wins a tie
+        encoding = max(offered, key=lambda coding: accepted.get(coding, fallback))
+        return encoding if accepted.get(encoding, fallback) > 0 else None
+
+    def process_response(self, request, response):
+        if response.streaming or response.has_header("Content-Encoding") or len(response.content) < self.min_bytes:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = self.encoding(request)
+        if encoding is None:
+            return response
+
+        if encoding == "br":
+            compressed = brotli.compress(response.content, quality=self.brotli_quality)
+        else:
+            compressed = compress_string(response.content, max_random_bytes=self.max_random_bytes)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        response.headers["Content-Encoding"] = encoding
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        return response
@@ -11,7 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 from pathlib import Path
-from decouple import config
+from decouple import config, Csv
 from datetime import timedelta
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # third party
     'rest_framework',
@@ -56,11 +57,23 @@ INSTALLED_APPS = [
     'activity_proposal',
     'reviews',
     'notifications',
+    'budgets',
+    'search',
+    'metrics',
+    'benchmarks',
+    'jobs',
+    'analytics',
+    'archives',
+    'deletions',
     'corsheaders', 
 ]
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    'config.compression.CompressionMiddleware',
+    'metrics.middleware.MetricsMiddleware',
+    'metrics.nplusone.NPlusOneMiddleware',
+    'metrics.profiling.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -70,6 +83,32 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# per endpoint latency and query metrics exposed at /metrics, the middleware unloads itself when disabled
+METRICS_ENABLED = config('METRICS_ENABLED', default=False, cast=bool)
+
+# development and test only, flags query shapes repeated more than the threshold within one request
+NPLUSONE_DETECTION = config('NPLUSONE_DETECTION', default=False, cast=bool)
+NPLUSONE_THRESHOLD = config('NPLUSONE_THRESHOLD', default=5, cast=int)
+NPLUSONE_RAISE = config('NPLUSONE_RAISE', default=False, cast=bool)
+
+# admin triggered request profiling, a signed token from /metrics/profiles/token/ sent as the
+# X-Profile-Token header or ?_profile= profiles that request, the sample routes are profiled 1 in N
+PROFILING_ENABLED = config('PROFILING_ENABLED', default=False, cast=bool)
+PROFILING_DIR = config('PROFILING_DIR', default=str(BASE_DIR / 'profiles'))
+PROFILING_SAMPLE_ROUTES = config('PROFILING_SAMPLE_ROUTES', default='', cast=Csv())
+PROFILING_SAMPLE_EVERY = config('PROFILING_SAMPLE_EVERY', default=100, cast=int)
+PROFILING_KEEP = config('PROFILING_KEEP', default=200, cast=int)
+PROFILING_TOKEN_MAX_AGE = config('PROFILING_TOKEN_MAX_AGE', default=3600, cast=int)
+
+# notifications are partitioned by month, read ones older than the retention window are purged in batches
+# and identical messages to the same user are compacted into one row with a count
+NOTIFICATION_RETENTION_DAYS = config('NOTIFICATION_RETENTION_DAYS', default=90, cast=int)
+NOTIFICATION_PURGE_BATCH = config('NOTIFICATION_PURGE_BATCH', default=1000, cast=int)
+NOTIFICATION_PARTITION_MONTHS_AHEAD = config('NOTIFICATION_PARTITION_MONTHS_AHEAD', default=3, cast=int)
+
+# seconds a year of the overview series stays in the per process cache, keys of older generations expire with it
+OVERVIEW_SERIES_TIMEOUT = config('OVERVIEW_SERIES_TIMEOUT', default=86400, cast=int)
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -96,8 +135,22 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # orjson for the large proposal documents, the browsable api still pretty prints with the stdlib
+    "DEFAULT_RENDERER_CLASSES": (
+        "config.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "config.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
+# gzip for responses at least this big, brotli skips django's BREACH padding so it has to be turned on
+COMPRESSION_MIN_BYTES = config('COMPRESSION_MIN_BYTES', default=1024, cast=int)
+COMPRESSION_BROTLI = config('COMPRESSION_BROTLI', default=False, cast=bool)
+
 SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
     "ACCESS_TOKEN_LIFETIME": timedelta(days=1),
@@ -188,6 +241,9 @@ CORS_ALLOW_HEADERS = [
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
+    # retry-safe review submission and admin request profiling
+    'idempotency-key',
+    'x-profile-token',
 ]
 
 CORS_ALLOW_METHODS = [
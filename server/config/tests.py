@@ -0,0 +1,104 @@
+import datetime
+import gzip
+import io
+import json
+from decimal import Decimal
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from benchmarks.factory import SyntheticDataFactory, SCALES
+from .parsers import ORJSONParser
+from .renderers import ORJSONRenderer
+
+
+class ORJSONTest(TestCase):
+
+    def test_renders_like_the_stdlib_renderer(self):
+        data = {
+            "amount": Decimal("1250.50"),
+            "created_at": datetime.datetime(2026, 3, 1, 8, 30, 15, 120000, tzinfo=datetime.timezone.utc),
+            "date": datetime.date(2026, 3, 1),
+            "label": gettext_lazy("Program"),
+            "workplan": [{"months": [1, 2], "activity": "line\u2028break"}],
+            1: "int key",
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_parses_and_rejects_invalid_json(self):
+        parser = ORJSONParser()
+        self.assertEqual(parser.parse(io.BytesIO(b'{"title": "Program", "items": [1, 2.5]}')), {"title": "Program", "items": [1, 2.5]})
+        with self.assertRaises(Exception):
+            parser.parse(io.BytesIO(b'{"title": NaN}'))
+
+
+@override_settings(COMPRESSION_MIN_BYTES=10)
+class CompressionTest(TestCase):
+
+    def test_gzips_large_responses_when_accepted(self):
+        admin = User.objects.create(username="admin", is_staff=True)
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        plain = client.get("/api/admin/overview-proposals/2026/")
+        self.assertNotIn("Content-Encoding", plain)
+        self.assertIn("Accept-Encoding", plain["Vary"])
+
+        response = client.get("/api/admin/overview-proposals/2026/", HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(response.content)), json.loads(plain.content))
+        # django's BREACH mitigation, a random length file name in the gzip header
+        self.assertTrue(response.content[3] & 0x08)
+
+        refused = client.get("/api/admin/overview-proposals/2026/", HTTP_ACCEPT_ENCODING="gzip;q=0, deflate")
+        self.assertNotIn("Content-Encoding", refused)
+        wildcard = client.get("/api/admin/overview-proposals/2026/", HTTP_ACCEPT_ENCODING="*;q=0.5")
+        self.assertEqual(wildcard["Content-Encoding"], "gzip")
+
+
+
+class BatchTest(TestCase):
+
+    def test_runs_get_requests_in_process_with_per_item_status(self):
+        data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        program = data.programs[0]
+        client = APIClient()
+        client.force_authenticate(program.proposal.user)
+        paths = [
+            f"/api/program-proposal/{program.id}/",
+            f"/api/program-proposal/{program.proposal_id}/history-list/",
+            "/api/notifications/",
+        ]
+
+        response = client.post("/api/batch/", {"requests": [
+            *[{"id": i, "path": path} for i, path in enumerate(paths)],
+            {"path": "/api/admin/overview-proposals/2026/"},
+            {"path": "/api/nowhere/"},
+            {"path": "/api/batch/"},
+            {"path": paths[0], "method": "POST"},
+        ]}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["responses"]
+        for i, path in enumerate(paths):
+            self.assertEqual((results[i]["id"], results[i]["status"]), (i, 200))
+            self.assertEqual(results[i]["body"], client.get(path).json())
+        self.assertEqual([result["status"] for result in results[3:]], [403, 404, 400, 405])
+
+        def queries(requests):
+            with CaptureQueriesContext(connection) as captured:
+                client.post("/api/batch/", {"requests": requests}, format="json")
+            return len(captured)
+        self.assertEqual(queries([{"path": paths[0]}, {"path": paths[0]}]), queries([{"path": paths[0]}]))
+
+    def test_rejects_malformed_and_oversized_batches(self):
+        client = APIClient()
+        client.force_authenticate(User.objects.create(username="implementor"))
+        self.assertEqual(client.post("/api/batch/", {"requests": []}, format="json").status_code, 400)
+        self.assertEqual(client.post("/api/batch/", {"requests": [{"url": "/api/notifications/"}]}, format="json").status_code, 400)
+        too_many = [{"path": "/api/notifications/"}] * 21
+        self.assertEqual(client.post("/api/batch/", {"requests": too_many}, format="json").status_code, 400)
+        self.assertEqual(APIClient().post("/api/batch/", {"requests": too_many[:1]}, format="json").status_code, 401)
@@ -16,9 +16,12 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from .batch import BatchView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    # several GET requests in one round trip
+    path('api/batch/', BatchView.as_view(), name='batch'),
     # auth
     path('api/users/', include('users.urls')),
     path('api/', include('proposals_node.urls')),
@@ -29,4 +32,10 @@ urlpatterns = [
     path('api/', include('proposal_cover.urls')),
     path('api/', include('notifications.urls')),
     path('api/', include('reviews.urls')),
+    path('api/', include('budgets.urls')),
+    path('api/', include('search.urls')),
+    path('api/', include('analytics.urls')),
+    path('api/', include('deletions.urls')),
+    # monitoring
+    path('', include('metrics.urls')),
 ]
@@ -0,0 +1,5 @@
+from django.contrib import admin
+from .models import DeletionRequest
+
+admin.site.register(DeletionRequest)
+# Register your models here.
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class DeletionsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'deletions'
+
+    def ready(self):
+        import deletions.tasks
@@ -0,0 +1,51 @@
+from django.db import models
+from django.db.models import Q
+from django.contrib.auth.models import User
+
+# Create your models here.
+# one background deletion of a user or a proposal tree, the target is kept as a plain id since the row goes away
+class DeletionRequest(models.Model):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    ACTIVE = [PENDING, RUNNING]
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+    TARGET_CHOICES = [
+        ('user', 'User'),
+        ('proposal', 'Proposal'),
+    ]
+
+    target = models.CharField(max_length=20, choices=TARGET_CHOICES)
+    target_id = models.BigIntegerField()
+    label = models.CharField(max_length=255, blank=True, default="")
+    # the proposal ids of the tree, fixed when requested since the links between them are deleted first
+    root_ids = models.JSONField(default=list)
+    requested_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name="deletion_requests")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+
+    # dry run counts per step when requested, then the rows removed per step so far
+    planned = models.JSONField(default=list, blank=True)
+    progress = models.JSONField(default=dict, blank=True)
+    deleted_rows = models.BigIntegerField(default=0)
+    batches = models.IntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['target', 'target_id'],
+                condition=Q(status__in=['pending', 'running']),
+                name='unique_active_deletion_request',
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.target} {self.target_id} ({self.status})"
@@ -0,0 +1,7 @@
+from rest_framework import serializers
+from .models import DeletionRequest
+
+class DeletionRequestSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = DeletionRequest
+        fields = '__all__'
@@ -0,0 +1,140 @@
+from django.contrib.auth.models import User
+from django.db import DEFAULT_DB_ALIAS, models, transaction
+from django.db.models import Subquery
+from django.db.models.deletion import get_candidate_relations_to_delete
+from django.utils import timezone
+from jobs.services import JobService
+from proposals_node.models import Proposal, ProposalStatusEvent
+from proposals_node.services import OverviewService, ProposalStatusService
+from .models import DeletionRequest
+
+TARGETS = {"user": User, "proposal": Proposal}
+
+
+class DeletionPlan:
+
+    # every table that cascades from the root model, children before their parents, with the lookup
+    # from that table back to the root ids, SET_NULL relations become updates, the root rows come last
+    @staticmethod
+    def steps(model, path="", seen=()):
+        steps = []
+        seen = seen + (model,)
+        for related in get_candidate_relations_to_delete(model._meta):
+            child, field = related.related_model, related.field
+            on_delete = field.remote_field.on_delete
+            child_path = f"{field.name}__{path}" if path else field.name
+            if on_delete is models.DO_NOTHING:
+                continue
+            if on_delete is models.SET_NULL:
+                steps.append((child, child_path, "set_null", field.name))
+            elif on_delete is models.CASCADE:
+                if child in seen:
+                    raise ValueError(f"{child._meta.label} cascades back into itself")
+                steps.extend(DeletionPlan.steps(child, child_path, seen))
+                steps.append((child, child_path, "delete", None))
+            else:
+                raise ValueError(f"{child._meta.label}.{field.name} blocks the deletion of {model._meta.label}")
+        if not path:
+            steps.append((model, "", "delete", None))
+        return steps
+
+    @staticmethod
+    def label(step):
+        model, path, action, _ = step
+        return f"{action} {model._meta.db_table} via {path or 'pk'}"
+
+    @staticmethod
+    def queryset(step, root_ids):
+        model, path, _, _ = step
+        return model._base_manager.filter(**{f"{path or 'pk'}__in": root_ids})
+
+
+class DeletionService:
+    BATCH = 1000
+    # batches per job, the job transaction holds the row locks of at most BATCH * BATCHES_PER_JOB rows
+    BATCHES_PER_JOB = 10
+
+    @staticmethod
+    def root_ids(target, obj):
+        if target == "proposal":
+            return sorted(ProposalStatusService.subtree_ids([obj.id]))
+        return [obj.id]
+
+    # rows every step would touch, nothing is changed
+    @staticmethod
+    def dry_run(target, root_ids):
+        counts = []
+        for step in DeletionPlan.steps(TARGETS[target]):
+            rows = DeletionPlan.queryset(step, root_ids).count()
+            if rows:
+                counts.append({"step": DeletionPlan.label(step), "rows": rows})
+        return counts
+
+    # hides the target right away, the rows are removed by background jobs in bounded batches
+    @staticmethod
+    @transaction.atomic
+    def request(target, obj, requested_by=None):
+        root_ids = DeletionService.root_ids(target, obj)
+        if target == "user":
+            User.objects.filter(id=obj.id).update(is_active=False)
+            proposals = Proposal.objects.filter(user_id=obj.id)
+            label = obj.username
+        else:
+            proposals = Proposal.objects.filter(id__in=root_ids)
+            label = obj.title
+        # the overview series counts the proposals by the year they were created and their status events by
+        # the year of the event, every one of those years loses rows
+        events = ProposalStatusEvent.objects.filter(proposal__in=proposals)
+        years = {day.year for day in proposals.datetimes("created_at", "year")}
+        years.update(day.year for day in events.datetimes("created_at", "year"))
+        proposals.update(deletion_pending=True)
+        if years:
+            OverviewService.invalidate_series(*years)
+
+        deletion = DeletionRequest.objects.create(
+            target=target,
+            target_id=obj.id,
+            label=label,
+            root_ids=root_ids,
+            requested_by=requested_by,
+            planned=DeletionService.dry_run(target, root_ids),
+        )
+        JobService.enqueue("deletions.run", {"request_id": deletion.id})
+        return deletion
+
+    # one bounded statement, rows are picked by primary key so postgres never deletes more than batch rows
+    @staticmethod
+    def run_step_batch(step, root_ids, batch):
+        model, _, action, field_name = step
+        pks = DeletionPlan.queryset(step, root_ids).values("pk")[:batch]
+        rows = model._base_manager.filter(pk__in=Subquery(pks))
+        if action == "set_null":
+            return rows.update(**{field_name: None})
+        return rows._raw_delete(DEFAULT_DB_ALIAS)
+
+    # works through the plan from the first step with rows left, returns True once the root rows are gone
+    @staticmethod
+    def run(deletion, batch=None, max_batches=None):
+        batch = batch or DeletionService.BATCH
+        max_batches = max_batches or DeletionService.BATCHES_PER_JOB
+        deletion.status = DeletionRequest.RUNNING
+        done = 0
+        for step in DeletionPlan.steps(TARGETS[deletion.target]):
+            label = DeletionPlan.label(step)
+            while done < max_batches:
+                rows = DeletionService.run_step_batch(step, deletion.root_ids, batch)
+                if rows:
+                    deletion.progress[label] = deletion.progress.get(label, 0) + rows
+                    deletion.deleted_rows += rows
+                    deletion.batches += 1
+                    done += 1
+                if rows < batch:
+                    break
+            else:
+                deletion.save(update_fields=["status", "progress", "deleted_rows", "batches"])
+                return False
+
+        deletion.status = DeletionRequest.DONE
+        deletion.finished_at = timezone.now()
+        deletion.save(update_fields=["status", "progress", "deleted_rows", "batches", "finished_at"])
+        return True
@@ -0,0 +1,12 @@
+from jobs.registry import task
+from jobs.services import JobService
+from .models import DeletionRequest
+from .services import DeletionService
+
+
+# a bounded number of batches per job, the job queues itself again until the root rows are gone
+@task("deletions.run")
+def run_deletion(request_id):
+    deletion = DeletionRequest.objects.select_for_update().filter(id=request_id, status__in=DeletionRequest.ACTIVE).first()
+    if deletion and not DeletionService.run(deletion):
+        JobService.enqueue("deletions.run", {"request_id": request_id})
@@ -0,0 +1,95 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from benchmarks.factory import SyntheticDataFactory, SCALES
+from jobs.services import JobService
+from notifications.models import Notification
+from project_proposal.models import ProjectProposal
+from proposals_node.models import Proposal
+from proposals_node.services import OverviewService
+from reviewer.models import ProposalReviewer
+from .models import DeletionRequest
+from .services import DeletionService
+
+
+# Create your tests here.
+class DeletionPipelineTest(TestCase):
+
+    def setUp(self):
+        self.data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        self.client = APIClient()
+        self.client.force_authenticate(self.data.admin)
+
+    # each job queues the next one on commit
+    def drain(self):
+        while True:
+            with self.captureOnCommitCallbacks(execute=True):
+                ran = JobService.run_pending(batch=1)
+            if not ran:
+                return
+
+    def test_user_is_hidden_at_once_and_removed_in_batches(self):
+        program = self.data.programs[0]
+        user = program.proposal.user
+        proposals = Proposal.objects.filter(user=user).count()
+
+        dry_run = self.client.delete(f"/api/users/admin/{user.id}/?dry_run=true")
+        self.assertEqual(dry_run.status_code, 200)
+        self.assertIn({"step": "delete proposals_node_proposal via user", "rows": proposals}, dry_run.json())
+        self.assertTrue(User.objects.filter(id=user.id).exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"/api/users/admin/{user.id}/")
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()["planned"], dry_run.json())
+        self.assertEqual(self.client.get(f"/api/users/admin/{user.id}/").status_code, 404)
+        self.assertNotIn(user.id, [row["id"] for row in self.client.get("/api/users/admin/").json()])
+        self.assertFalse(Proposal.objects.filter(user=user).exists())
+        self.assertEqual(Proposal.all_objects.filter(user=user).count(), proposals)
+
+        DeletionService.BATCH, DeletionService.BATCHES_PER_JOB = 2, 2
+        try:
+            self.drain()
+        finally:
+            DeletionService.BATCH, DeletionService.BATCHES_PER_JOB = 1000, 10
+
+        deletion = DeletionRequest.objects.get(id=response.json()["id"])
+        self.assertEqual(deletion.status, DeletionRequest.DONE)
+        self.assertGreater(deletion.batches, 2)
+        self.assertEqual(sum(deletion.progress.values()), deletion.deleted_rows)
+        self.assertFalse(User.objects.filter(id=user.id).exists())
+        self.assertFalse(Proposal.all_objects.filter(user_id=user.id).exists())
+        self.assertFalse(ProjectProposal.objects.filter(program_proposal_id=program.id).exists())
+        self.assertFalse(ProposalReviewer.objects.filter(proposal_id=program.proposal_id).exists())
+        self.assertFalse(Notification.objects.filter(user_id=user.id).exists())
+
+    def test_proposal_tree_is_removed_with_its_projects_and_activities(self):
+        program = self.data.programs[0]
+        root_ids = DeletionService.root_ids("proposal", program.proposal)
+        others = Proposal.objects.exclude(id__in=root_ids).count()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"/api/admin/proposal-delete/{program.proposal_id}/")
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(Proposal.objects.count(), others)
+        self.drain()
+
+        self.assertFalse(Proposal.all_objects.filter(id__in=root_ids).exists())
+        self.assertEqual(Proposal.all_objects.count(), others)
+        detail = self.client.get(f"/api/admin/deletions/{response.json()['id']}/").json()
+        self.assertEqual(detail["status"], "done")
+
+    def test_overview_series_is_dropped_for_every_year_the_tree_touches(self):
+        program = self.data.programs[0]
+        root_ids = DeletionService.root_ids("proposal", program.proposal)
+        year = timezone.localdate().year - 3
+        Proposal.objects.filter(id=program.proposal_id).update(created_at=timezone.now().replace(year=year))
+        cache.clear()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            DeletionService.request("proposal", program.proposal)
+
+        self.assertEqual(OverviewService.generations([year - 1, year]), {year - 1: 0, year: 1})
+        self.assertFalse(Proposal.objects.filter(id__in=root_ids).exists())
@@ -0,0 +1,10 @@
+from django.urls import path
+from rest_framework.urlpatterns import format_suffix_patterns
+from .views import AdminDeletionRequestList, AdminDeletionRequestDetail
+
+urlpatterns = [
+    path("admin/deletions/", AdminDeletionRequestList.as_view(), name="admin-deletion-list"),
+    path("admin/deletions/<int:pk>/", AdminDeletionRequestDetail.as_view(), name="admin-deletion-detail"),
+]
+
+urlpatterns = format_suffix_patterns(urlpatterns)
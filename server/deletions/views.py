@@ -0,0 +1,27 @@
+from django.shortcuts import get_object_or_404
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from .models import DeletionRequest
+from .serializers import DeletionRequestSerializer
+
+# Create your views here.
+# ADMIN VIEWS progress of the background deletions, the newest first
+class AdminDeletionRequestList(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, format=None):
+        deletions = DeletionRequest.objects.order_by('-created_at')
+        if request.query_params.get('status'):
+            deletions = deletions.filter(status=request.query_params['status'])
+        serializer = DeletionRequestSerializer(deletions[:100], many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class AdminDeletionRequestDetail(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, pk, format=None):
+        deletion = get_object_or_404(DeletionRequest, id=pk)
+        return Response(DeletionRequestSerializer(deletion).data, status=status.HTTP_200_OK)
@@ -0,0 +1,57 @@
+import signal
+import threading
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+from jobs.services import JobService
+
+
+class Command(BaseCommand):
+    help = "Run background job workers against the jobs table, several workers can run side by side."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=2, help="worker threads in this process")
+        parser.add_argument("--batch", type=int, default=10, help="jobs claimed per round trip")
+        parser.add_argument("--poll", type=float, default=1.0, help="seconds to sleep when the queue is empty")
+        parser.add_argument("--lease", type=int, default=300, help="seconds before a running job is considered abandoned")
+        parser.add_argument("--once", action="store_true", help="drain the queue and exit")
+        parser.add_argument("--purge-days", type=int, default=7, help="delete finished jobs older than this on startup")
+
+    def handle(self, *args, **options):
+        purged = JobService.purge_finished(options["purge_days"])
+        if purged:
+            self.stdout.write(f"purged {purged} finished jobs")
+        connection.close()
+
+        stop = threading.Event()
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+        lease = timedelta(seconds=options["lease"])
+        processed = []
+
+        def work():
+            worker_id = JobService.worker_id()
+            count = 0
+            try:
+                while not stop.is_set():
+                    close_old_connections()
+                    claimed = JobService.run_pending(worker_id, options["batch"], lease)
+                    count += claimed
+                    if claimed == 0:
+                        if options["once"]:
+                            break
+                        stop.wait(options["poll"])
+            finally:
+                connection.close()
+                processed.append(count)
+
+        threads = [threading.Thread(target=work, name=f"job-worker-{i}") for i in range(options["workers"])]
+        for thread in threads:
+            thread.start()
+        self.stdout.write(f"started {len(threads)} job workers")
+        # join with a timeout so the main thread keeps receiving signals
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=0.5)
+        self.stdout.write(f"stopped, {sum(processed)} jobs processed")
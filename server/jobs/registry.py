@@ -0,0 +1,11 @@
+TASKS = {}
+
+
+# registers a function as a background task, apps import their tasks module from ready()
+def task(name, max_attempts=5):
+    def register(func):
+        func.task_name = name
+        func.max_attempts = max_attempts
+        TASKS[name] = func
+        return func
+    return register
@@ -0,0 +1,89 @@
+import os
+import socket
+import threading
+import traceback
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from .models import Job
+from .registry import TASKS
+
+
+class JobService:
+
+    @staticmethod
+    def worker_id():
+        return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+    # the row is inserted once the surrounding transaction commits, so workers never see
+    # jobs for data that was rolled back, a duplicate idempotency key is silently dropped
+    @staticmethod
+    def enqueue(name, payload=None, idempotency_key=None, delay=None, max_attempts=None):
+        func = TASKS.get(name)
+        job = Job(
+            name=name,
+            payload=payload or {},
+            idempotency_key=idempotency_key,
+            max_attempts=max_attempts or getattr(func, "max_attempts", 5),
+            run_at=timezone.now() + (delay or timedelta()),
+        )
+        transaction.on_commit(lambda: Job.objects.bulk_create([job], ignore_conflicts=True))
+        return job
+
+    # exponential backoff, 2s 4s 8s ... capped at 10 minutes
+    @staticmethod
+    def backoff(attempts):
+        return timedelta(seconds=min(2 ** attempts, 600))
+
+    # running jobs whose lease ran out belong to a dead worker and are claimed again
+    @staticmethod
+    def claim(worker_id, batch=10, lease=timedelta(minutes=5)):
+        now = timezone.now()
+        with transaction.atomic():
+            jobs = list(
+                Job.objects.select_for_update(skip_locked=True)
+                .filter(Q(status=Job.QUEUED, run_at__lte=now) | Q(status=Job.RUNNING, locked_at__lt=now - lease))
+                .order_by("run_at", "id")[:batch]
+            )
+            Job.objects.filter(id__in=[job.id for job in jobs]).update(
+                status=Job.RUNNING, locked_at=now, locked_by=worker_id, attempts=F("attempts") + 1
+            )
+        for job in jobs:
+            job.status, job.locked_at, job.locked_by, job.attempts = Job.RUNNING, now, worker_id, job.attempts + 1
+        return jobs
+
+    @staticmethod
+    def execute(job):
+        finished = {"locked_at": None, "locked_by": None}
+        try:
+            func = TASKS.get(job.name)
+            if func is None:
+                raise LookupError(f"no task registered as {job.name}")
+            with transaction.atomic():
+                func(**job.payload)
+        except Exception:
+            finished["last_error"] = traceback.format_exc()[-4000:]
+            if job.attempts >= job.max_attempts:
+                finished.update(status=Job.FAILED, finished_at=timezone.now())
+            else:
+                finished.update(status=Job.QUEUED, run_at=timezone.now() + JobService.backoff(job.attempts))
+        else:
+            finished.update(status=Job.DONE, finished_at=timezone.now())
+
+        # a worker that lost its lease must not overwrite the new owner's result
+        Job.objects.filter(id=job.id, locked_by=job.locked_by).update(**finished)
+        return finished["status"]
+
+    @staticmethod
+    def run_pending(worker_id=None, batch=10, lease=timedelta(minutes=5)):
+        jobs = JobService.claim(worker_id or JobService.worker_id(), batch, lease)
+        for job in jobs:
+            JobService.execute(job)
+        return len(jobs)
+
+    @staticmethod
+    def purge_finished(days=7):
+        cutoff = timezone.now() - timedelta(days=days)
+        deleted, _ = Job.objects.filter(status=Job.DONE, finished_at__lt=cutoff).delete()
+        return deleted
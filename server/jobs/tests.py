@@ -0,0 +1,71 @@
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+from notifications.models import Notification
+from notifications.services import NotificationService
+from .models import Job
+from .registry import task
+from .services import JobService
+
+calls = []
+
+
+@task("tests.record")
+def record(value):
+    calls.append(value)
+
+
+@task("tests.explode", max_attempts=2)
+def explode():
+    raise RuntimeError("boom")
+
+
+class JobQueueTest(TestCase):
+
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueues_on_commit_and_drops_duplicate_keys(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            JobService.enqueue("tests.record", {"value": 1}, idempotency_key="once")
+            JobService.enqueue("tests.record", {"value": 2}, idempotency_key="once")
+            self.assertEqual(Job.objects.count(), 0)
+
+        self.assertEqual(JobService.run_pending("worker"), 1)
+        self.assertEqual(calls, [1])
+        self.assertEqual(Job.objects.get().status, Job.DONE)
+
+    def test_retries_with_backoff_then_fails(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            JobService.enqueue("tests.explode")
+
+        JobService.run_pending("worker")
+        job = Job.objects.get()
+        self.assertEqual((job.status, job.attempts), (Job.QUEUED, 1))
+        self.assertIn("boom", job.last_error)
+        self.assertEqual(JobService.run_pending("worker"), 0)
+
+        Job.objects.update(run_at=timezone.now() - timedelta(seconds=1))
+        JobService.run_pending("worker")
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.FAILED, 2))
+
+    def test_reclaims_jobs_with_an_expired_lease(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            JobService.enqueue("tests.record", {"value": 3})
+        JobService.claim("dead-worker")
+        self.assertEqual(JobService.run_pending("worker"), 0)
+
+        Job.objects.update(locked_at=timezone.now() - timedelta(minutes=10))
+        self.assertEqual(JobService.run_pending("worker"), 1)
+        self.assertEqual(calls, [3])
+
+    def test_notifications_are_written_by_the_worker(self):
+        user = User.objects.create(username="implementor")
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationService.notify_users([user.id], "Your proposal was reviewed")
+        self.assertFalse(Notification.objects.exists())
+
+        JobService.run_pending("worker")
+        self.assertEqual(Notification.objects.get().message, "Your proposal was reviewed")
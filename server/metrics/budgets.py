@@ -0,0 +1,50 @@
+# max queries per request, keyed by "METHOD route", measured against the tiny benchmark dataset
+# routes that still grow with the number of rows are budgeted at their current count so they can only go down
+QUERY_BUDGETS = {
+    "GET api/users/profile/me/": 1,
+    "GET api/users/profile/<int:pk>/": 2,
+    "GET api/users/admin/": 7,
+    "GET api/users/admin/<int:pk>/": 2,
+    "GET api/users/admin/overview-users/": 2,
+    "GET api/proposals-node/<str:proposal_type>/": 8,
+    "GET api/admin/proposals-node/<str:proposal_type>/": 15,
+    "GET api/admin/proposals-node/<str:proposal_type>/facets/": 1,
+    "GET api/admin/overview-proposals/<int:year>/": 3,
+    "GET api/admin/overview-proposals/series/<str:interval>/": 2,
+    "GET api/admin/get-year-config/<int:year>/": 1,
+    "GET api/program-proposal/<int:pk>/": 1,
+    "GET api/program-proposal/<int:program_proposal_id>/projects/": 4,
+    "GET api/program-proposal/<int:proposal_id>/history-list/": 3,
+    "GET api/project-proposal/<int:pk>/": 1,
+    "GET api/project-proposal/<int:project_proposal_id>/activities/": 4,
+    "GET api/project-proposal/<int:proposal_id>/history-list/": 3,
+    "GET api/global-stats/": 4,
+    "GET api/activity-proposal/<int:pk>/": 1,
+    "GET api/activity-proposal/<int:proposal_id>/history-list/": 3,
+    "GET api/assign-reviewer/": 57,
+    "GET api/assigned-reviewer/<int:proposal>/": 5,
+    "GET api/reviewers/": 4,
+    "GET api/reviewers/workload/": 1,
+    "GET api/reviewer-proposals/program/": 19,
+    "GET api/reviewer-proposals/project/<int:program_id>/": 19,
+    "GET api/reviewer-proposals/activity/<int:project_id>/": 19,
+    "GET api/reviewer-proposal-list/<int:proposal_id>/": 3,
+    "GET api/proposal/<int:proposal_id>/check-reviews/": 2,
+    "GET api/proposal-cover/": 1,
+    "GET api/notifications/": 1,
+    "GET api/proposal-review/<int:proposal>/": 2,
+    "GET api/proposal-review-draft/<int:assignment>/": 2,
+    "GET api/proposal-review/proposal/<int:proposal_id>/<str:proposal_type>/": 2,
+    "GET api/proposal-review/proposal-history/<int:proposal_id>/<int:history_id>/<int:version>/<str:proposal_type>/": 2,
+    "GET api/admin/budget-report/<str:group_by>/": 2,
+    "GET api/proposal-diff/<int:proposal_id>/<str:from_version>/<str:to_version>/": 3,
+    "GET api/admin/analytics/turnaround/<str:dimension>/": 1,
+    "GET api/search/": 2,
+}
+
+
+def budget_key(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return None
+    return f"{request.method} {match.route}"
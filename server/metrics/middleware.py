@@ -0,0 +1,55 @@
+import time
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from rest_framework.views import APIView
+from .registry import registry
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    # connection.execute_wrapper hook, times every statement of the request
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.count += 1
+
+
+# records latency, query count, sql time and response size for every DRF view, labeled by url name
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        if not getattr(settings, "METRICS_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    @staticmethod
+    def route_name(request):
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            return None
+        view_class = getattr(match.func, "cls", None) or getattr(match.func, "view_class", None)
+        if view_class is None or not issubclass(view_class, APIView):
+            return None
+        return match.view_name or match.route
+
+    def __call__(self, request):
+        stats = QueryStats()
+        started = time.perf_counter()
+        with connection.execute_wrapper(stats):
+            response = self.get_response(request)
+        duration = time.perf_counter() - started
+
+        route = self.route_name(request)
+        if route is None or route == "metrics":
+            return response
+
+        response_bytes = 0 if response.streaming else len(response.content)
+        labels = (route, request.method, f"{response.status_code // 100}xx")
+        registry.observe_request(labels, duration, stats.count, stats.seconds, response_bytes)
+        return response
@@ -0,0 +1,106 @@
+import logging
+import re
+import traceback
+from collections import Counter
+from dataclasses import dataclass
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from .budgets import QUERY_BUDGETS, budget_key
+
+logger = logging.getLogger("metrics.nplusone")
+
+LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+PLACEHOLDER_LISTS = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+WHITESPACE = re.compile(r"\s+")
+
+
+class NPlusOneError(AssertionError):
+    pass
+
+
+@dataclass
+class RepeatedQuery:
+    fingerprint: str
+    count: int
+    stack: str
+
+    def __str__(self):
+        return f"{self.count}x {self.fingerprint}\n{self.stack}"
+
+
+# same statement shape regardless of parameter values or IN list length
+def fingerprint(sql):
+    sql = LITERALS.sub("?", sql)
+    sql = PLACEHOLDER_LISTS.sub("(...)", sql)
+    return WHITESPACE.sub(" ", sql).strip()
+
+
+# only our own frames, django and drf internals are the same for every query
+def app_stack():
+    base_dir = str(settings.BASE_DIR)
+    frames = [
+        frame for frame in traceback.extract_stack()[:-2]
+        if frame.filename.startswith(base_dir) and "site-packages" not in frame.filename and not frame.filename.endswith("nplusone.py")
+    ]
+    return "".join(traceback.format_list(frames[-8:]))
+
+
+class QueryShapeRecorder:
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.counts = Counter()
+        self.stacks = {}
+
+    # connection.execute_wrapper hook, the stack is captured once the shape crosses the threshold
+    def __call__(self, execute, sql, params, many, context):
+        shape = fingerprint(sql)
+        self.counts[shape] += 1
+        if self.counts[shape] == self.threshold + 1:
+            self.stacks[shape] = app_stack()
+        return execute(sql, params, many, context)
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def repeated(self):
+        return [
+            RepeatedQuery(shape, count, self.stacks.get(shape, ""))
+            for shape, count in self.counts.most_common()
+            if count > self.threshold
+        ]
+
+
+def report(label, repeated):
+    return f"possible N+1 in {label}:\n" + "\n".join(str(query) for query in repeated)
+
+
+# opt in with NPLUSONE_DETECTION, logs repeated query shapes and blown query budgets per request
+# or raises with NPLUSONE_RAISE so the test suite fails
+class NPlusOneMiddleware:
+    def __init__(self, get_response):
+        if not getattr(settings, "NPLUSONE_DETECTION", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryShapeRecorder(getattr(settings, "NPLUSONE_THRESHOLD", 5))
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+
+        label = f"{request.method} {request.path}"
+        problems = []
+        repeated = recorder.repeated()
+        if repeated:
+            problems.append(report(label, repeated))
+        key = budget_key(request)
+        if key in QUERY_BUDGETS and recorder.total > QUERY_BUDGETS[key]:
+            problems.append(f"{label} ran {recorder.total} queries, budget for {key} is {QUERY_BUDGETS[key]}")
+
+        if problems:
+            message = "\n".join(problems)
+            if getattr(settings, "NPLUSONE_RAISE", False):
+                raise NPlusOneError(message)
+            logger.warning(message)
+        return response
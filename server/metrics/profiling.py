@@ -0,0 +1,152 @@
+import cProfile
+import io
+import itertools
+import json
+import pstats
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.urls import Resolver404, resolve
+
+TOKEN_SALT = "metrics.profiling"
+TOKEN_HEADER = "HTTP_X_PROFILE_TOKEN"
+TOKEN_PARAM = "_profile"
+
+
+def profile_dir():
+    return Path(getattr(settings, "PROFILING_DIR", settings.BASE_DIR / "profiles"))
+
+
+def issue_token(user):
+    return signing.dumps({"user": user.id}, salt=TOKEN_SALT)
+
+
+def token_valid(token):
+    try:
+        signing.loads(token, salt=TOKEN_SALT, max_age=getattr(settings, "PROFILING_TOKEN_MAX_AGE", 3600))
+    except signing.BadSignature:
+        return False
+    return True
+
+
+class SQLTimer:
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - started))
+
+
+class ProfileStore:
+
+    @staticmethod
+    def save(profiler, timer, request, route, response, duration, reason):
+        directory = profile_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        profile_id = f"{datetime.now():%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}"
+        profiler.dump_stats(directory / f"{profile_id}.prof")
+
+        output = io.StringIO()
+        stats = pstats.Stats(profiler, stream=output)
+        stats.sort_stats("cumulative").print_stats(25)
+
+        summary = {
+            "id": profile_id,
+            "created_at": datetime.now().isoformat(),
+            "reason": reason,
+            "method": request.method,
+            "path": request.path,
+            "route": route,
+            "status": response.status_code,
+            "duration_ms": round(duration * 1000, 2),
+            "query_count": len(timer.queries),
+            "query_ms": round(sum(seconds for _, seconds in timer.queries) * 1000, 2),
+            "slowest_queries": [
+                {"sql": sql, "ms": round(seconds * 1000, 2)}
+                for sql, seconds in sorted(timer.queries, key=lambda q: q[1], reverse=True)[:10]
+            ],
+            "top_functions": output.getvalue(),
+        }
+        (directory / f"{profile_id}.json").write_text(json.dumps(summary, indent=2))
+        ProfileStore.prune()
+        return profile_id
+
+    # keep only the newest PROFILING_KEEP profiles
+    @staticmethod
+    def prune():
+        keep = getattr(settings, "PROFILING_KEEP", 200)
+        summaries = sorted(profile_dir().glob("*.json"), reverse=True)
+        for old in summaries[keep:]:
+            old.unlink(missing_ok=True)
+            old.with_suffix(".prof").unlink(missing_ok=True)
+
+    @staticmethod
+    def recent(limit=50):
+        return [json.loads(path.read_text()) for path in sorted(profile_dir().glob("*.json"), reverse=True)[:limit]]
+
+    @staticmethod
+    def path(profile_id, suffix):
+        # ids are generated by save, anything else could walk out of the directory
+        if not profile_id.replace("-", "").replace("T", "").isalnum():
+            return None
+        path = profile_dir() / f"{profile_id}{suffix}"
+        return path if path.exists() else None
+
+
+# runs the request under cProfile when it carries a signed profile token, or for 1 in
+# PROFILING_SAMPLE_EVERY requests to the routes in PROFILING_SAMPLE_ROUTES
+class ProfilingMiddleware:
+    def __init__(self, get_response):
+        if not getattr(settings, "PROFILING_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_routes = set(getattr(settings, "PROFILING_SAMPLE_ROUTES", []))
+        self.sample_every = max(1, getattr(settings, "PROFILING_SAMPLE_EVERY", 100))
+        self.counter = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def route_name(self, request):
+        try:
+            return resolve(request.path_info).view_name
+        except Resolver404:
+            return None
+
+    def reason(self, request, route):
+        token = request.META.get(TOKEN_HEADER) or request.GET.get(TOKEN_PARAM)
+        if token and token_valid(token):
+            return "requested"
+        if route in self.sample_routes:
+            with self.lock:
+                if next(self.counter) % self.sample_every == 0:
+                    return "sampled"
+        return None
+
+    def __call__(self, request):
+        route = self.route_name(request)
+        reason = self.reason(request, route)
+        if reason is None:
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        timer = SQLTimer()
+        started = time.perf_counter()
+        with connection.execute_wrapper(timer):
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        duration = time.perf_counter() - started
+
+        response["X-Profile-Id"] = ProfileStore.save(profiler, timer, request, route, response, duration, reason)
+        return response
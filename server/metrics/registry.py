@@ -0,0 +1,106 @@
+import threading
+from bisect import bisect_left
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+RESPONSE_BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+# per process store of the request metrics, labeled by (route, method, status class)
+class MetricsRegistry:
+    HISTOGRAMS = {
+        "http_request_duration_seconds": ("Request latency in seconds.", LATENCY_BUCKETS),
+        "http_request_queries": ("SQL queries issued per request.", QUERY_COUNT_BUCKETS),
+        "http_response_size_bytes": ("Response body size in bytes.", RESPONSE_BYTES_BUCKETS),
+    }
+    COUNTERS = {
+        "http_requests_total": "Requests served.",
+        "http_request_sql_seconds_total": "Time spent executing SQL in seconds.",
+        "http_request_queries_total": "SQL queries issued.",
+        "http_response_bytes_total": "Response bytes sent.",
+    }
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.histograms = {name: {} for name in self.HISTOGRAMS}
+        self.counters = {name: {} for name in self.COUNTERS}
+
+    def observe_request(self, labels, duration, queries, sql_seconds, response_bytes):
+        with self.lock:
+            self._observe("http_request_duration_seconds", labels, duration)
+            self._observe("http_request_queries", labels, queries)
+            self._observe("http_response_size_bytes", labels, response_bytes)
+            self._increment("http_requests_total", labels, 1)
+            self._increment("http_request_sql_seconds_total", labels, sql_seconds)
+            self._increment("http_request_queries_total", labels, queries)
+            self._increment("http_response_bytes_total", labels, response_bytes)
+
+    def _observe(self, name, labels, value):
+        series = self.histograms[name]
+        if labels not in series:
+            series[labels] = Histogram(self.HISTOGRAMS[name][1])
+        series[labels].observe(value)
+
+    def _increment(self, name, labels, value):
+        series = self.counters[name]
+        series[labels] = series.get(labels, 0) + value
+
+    @staticmethod
+    def format_labels(labels, extra=None):
+        route, method, status = labels
+        pairs = [("route", route), ("method", method), ("status", status)]
+        if extra:
+            pairs.append(extra)
+        escaped = (
+            f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+            for key, value in pairs
+        )
+        return "{" + ",".join(escaped) + "}"
+
+    @staticmethod
+    def format_number(value):
+        if isinstance(value, float):
+            return repr(round(value, 6))
+        return str(value)
+
+    # prometheus text exposition format 0.0.4
+    def render(self):
+        lines = []
+        with self.lock:
+            for name, help_text in self.COUNTERS.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in sorted(self.counters[name].items()):
+                    lines.append(f"{name}{self.format_labels(labels)} {self.format_number(value)}")
+
+            for name, (help_text, buckets) in self.HISTOGRAMS.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in sorted(self.histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{self.format_labels(labels, ('le', bound))} {cumulative}")
+                    lines.append(f"{name}_bucket{self.format_labels(labels, ('le', '+Inf'))} {histogram.count}")
+                    lines.append(f"{name}_sum{self.format_labels(labels)} {self.format_number(histogram.sum)}")
+                    lines.append(f"{name}_count{self.format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
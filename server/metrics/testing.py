@@ -0,0 +1,32 @@
+from contextlib import contextmanager
+from django.db import connection
+from .budgets import QUERY_BUDGETS
+from .nplusone import QueryShapeRecorder, report
+
+
+# for TestCase subclasses, fails on repeated query shapes or on routes going over their query budget
+class QueryBudgetMixin:
+    query_budgets = QUERY_BUDGETS
+    nplusone_threshold = 5
+
+    @contextmanager
+    def assertNoNPlusOne(self, threshold=None, label="block"):
+        recorder = QueryShapeRecorder(threshold or self.nplusone_threshold)
+        with connection.execute_wrapper(recorder):
+            yield recorder
+        repeated = recorder.repeated()
+        if repeated:
+            raise self.failureException(report(label, repeated))
+
+    @contextmanager
+    def assertQueryBudget(self, route):
+        budget = self.query_budgets[route]
+        recorder = QueryShapeRecorder(self.nplusone_threshold)
+        with connection.execute_wrapper(recorder):
+            yield recorder
+        if recorder.total > budget:
+            message = f"{route} ran {recorder.total} queries, budget is {budget}"
+            repeated = recorder.repeated()
+            if repeated:
+                message += "\n" + report(route, repeated)
+            raise self.failureException(message)
@@ -0,0 +1,88 @@
+import tempfile
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from .registry import registry
+from .nplusone import NPlusOneError, fingerprint
+from .testing import QueryBudgetMixin
+
+@override_settings(METRICS_ENABLED=True)
+class MetricsTest(TestCase):
+
+    def test_records_drf_views_by_route_name(self):
+        registry.reset()
+        admin = User.objects.create(username="admin", is_staff=True)
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        self.assertEqual(client.get("/api/admin/overview-proposals/2026/").status_code, 200)
+        response = client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode()
+        self.assertIn('http_requests_total{route="admin-overview",method="GET",status="2xx"} 1', body)
+        self.assertIn('http_request_queries_bucket{route="admin-overview",method="GET",status="2xx",le="+Inf"} 1', body)
+        self.assertNotIn('route="metrics"', body)
+
+
+class NPlusOneDetectorTest(QueryBudgetMixin, TestCase):
+
+    def test_fingerprint_ignores_values_and_in_list_length(self):
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = 'a'"),
+            fingerprint("SELECT *  FROM t WHERE id IN (%s, %s) AND name = 'bb'"),
+        )
+
+    def test_flags_repeated_query_shapes(self):
+        users = [User.objects.create(username=f"user-{i}") for i in range(4)]
+        with self.assertRaises(AssertionError):
+            with self.assertNoNPlusOne(threshold=2):
+                for user in users:
+                    User.objects.get(id=user.id)
+
+    @override_settings(NPLUSONE_DETECTION=True, NPLUSONE_RAISE=True, NPLUSONE_THRESHOLD=1)
+    def test_middleware_raises_when_enabled(self):
+        admin = User.objects.create(username="admin", is_staff=True)
+        for i in range(3):
+            User.objects.create(username=f"user-{i}")
+        client = APIClient()
+        client.force_authenticate(admin)
+        with self.assertRaises(NPlusOneError):
+            client.get("/api/users/admin/")
+
+
+class ProfilingTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.admin = User.objects.create(username="admin", is_staff=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_signed_token_profiles_the_request(self):
+        with self.settings(PROFILING_ENABLED=True, PROFILING_DIR=self.directory.name):
+            token = self.client.post("/metrics/profiles/token/").data["token"]
+            self.assertNotIn("X-Profile-Id", self.client.get("/api/admin/overview-proposals/2026/"))
+            self.assertNotIn("X-Profile-Id", self.client.get("/api/admin/overview-proposals/2026/", HTTP_X_PROFILE_TOKEN="forged"))
+
+            response = self.client.get("/api/admin/overview-proposals/2026/", HTTP_X_PROFILE_TOKEN=token)
+            profile_id = response["X-Profile-Id"]
+
+            profiles = self.client.get("/metrics/profiles/").data
+            self.assertEqual([p["id"] for p in profiles], [profile_id])
+            self.assertEqual(profiles[0]["route"], "admin-overview")
+            self.assertEqual(profiles[0]["reason"], "requested")
+            self.assertGreater(profiles[0]["query_count"], 0)
+            self.assertEqual(self.client.get(f"/metrics/profiles/{profile_id}/download/").status_code, 200)
+            self.assertEqual(self.client.get("/metrics/profiles/..%2Fsettings/download/").status_code, 404)
+            self.assertEqual(self.client.get("/metrics/profiles/?limit=ten").status_code, 400)
+            self.assertEqual(self.client.get("/metrics/profiles/?limit=-1").status_code, 400)
+
+    def test_samples_one_in_n_requests_for_chosen_routes(self):
+        with self.settings(PROFILING_ENABLED=True, PROFILING_DIR=self.directory.name, PROFILING_SAMPLE_ROUTES=["admin-overview"], PROFILING_SAMPLE_EVERY=2):
+            for _ in range(4):
+                self.client.get("/api/admin/overview-proposals/2026/")
+            self.client.get("/api/users/admin/")
+            profiles = self.client.get("/metrics/profiles/").data
+        self.assertEqual([p["reason"] for p in profiles], ["sampled", "sampled"])
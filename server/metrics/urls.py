@@ -0,0 +1,10 @@
+from django.urls import path
+from .views import MetricsView, ProfileTokenView, ProfileListView, ProfileDetailView, ProfileDownloadView
+
+urlpatterns = [
+    path("metrics", MetricsView.as_view(), name="metrics"),
+    path("metrics/profiles/", ProfileListView.as_view(), name="profile-list"),
+    path("metrics/profiles/token/", ProfileTokenView.as_view(), name="profile-token"),
+    path("metrics/profiles/<str:profile_id>/", ProfileDetailView.as_view(), name="profile-detail"),
+    path("metrics/profiles/<str:profile_id>/download/", ProfileDownloadView.as_view(), name="profile-download"),
+]
@@ -0,0 +1,72 @@
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, Http404
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from .registry import registry
+from .profiling import ProfileStore, issue_token, TOKEN_PARAM
+# Create your views here.
+
+# ADMIN VIEWS prometheus scrape endpoint
+class MetricsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, format=None):
+        if not getattr(settings, "METRICS_ENABLED", False):
+            raise Http404
+        return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def profiling_enabled():
+    if not getattr(settings, "PROFILING_ENABLED", False):
+        raise Http404
+
+# ADMIN VIEWS signed token that turns on profiling for the requests carrying it
+class ProfileTokenView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, format=None):
+        profiling_enabled()
+        return Response({
+            "token": issue_token(request.user),
+            "header": "X-Profile-Token",
+            "param": TOKEN_PARAM,
+            "max_age": getattr(settings, "PROFILING_TOKEN_MAX_AGE", 3600),
+        }, status=status.HTTP_201_CREATED)
+
+# ADMIN VIEWS recent profile summaries, newest first
+class ProfileListView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, format=None):
+        profiling_enabled()
+        try:
+            limit = int(request.query_params.get("limit", 50))
+        except ValueError:
+            return Response({"error": "Limit must be a number"}, status=status.HTTP_400_BAD_REQUEST)
+        if limit < 1:
+            return Response({"error": "Limit must be at least 1"}, status=status.HTTP_400_BAD_REQUEST)
+        limit = min(limit, 200)
+        return Response(ProfileStore.recent(limit), status=status.HTTP_200_OK)
+
+class ProfileDetailView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, profile_id, format=None):
+        profiling_enabled()
+        path = ProfileStore.path(profile_id, ".json")
+        if path is None:
+            raise Http404
+        return HttpResponse(path.read_text(), content_type="application/json")
+
+# the raw cProfile dump, open with pstats or snakeviz
+class ProfileDownloadView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, profile_id, format=None):
+        profiling_enabled()
+        path = ProfileStore.path(profile_id, ".prof")
+        if path is None:
+            raise Http404
+        return FileResponse(path.open("rb"), as_attachment=True, filename=path.name)
@@ -0,0 +1,23 @@
+import json
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from notifications.services import NotificationRetentionService
+
+
+class Command(BaseCommand):
+    help = "Create upcoming notification partitions, purge old read notifications and compact repeated messages."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.NOTIFICATION_RETENTION_DAYS, help="keep read notifications this many days")
+        parser.add_argument("--batch", type=int, default=settings.NOTIFICATION_PURGE_BATCH, help="rows or groups per statement")
+        parser.add_argument("--months-ahead", type=int, default=settings.NOTIFICATION_PARTITION_MONTHS_AHEAD)
+        parser.add_argument("--dry-run", action="store_true", help="only count what would be removed")
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            pending = NotificationRetentionService.pending(NotificationRetentionService.cutoff(options["days"]))
+            self.stdout.write(json.dumps(pending, indent=2))
+            return
+        report = NotificationRetentionService.maintain(options["days"], options["batch"], options["months_ahead"])
+        self.stdout.write(json.dumps(report, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Purged {report['purged']} and compacted {report['compacted']} notifications."))
@@ -0,0 +1,79 @@
+from django.db import migrations
+
+# notifications become a table partitioned by month on created_at, postgres wants the partition key in the
+# primary key so it is (id, created_at), ids still come from one sequence so django keeps using id alone.
+# months before the first partition and after the last one land in the default partition
+PARTITION = """
+ALTER TABLE notifications_notification RENAME TO notifications_notification_flat;
+
+CREATE TABLE notifications_notification (
+    id bigint NOT NULL,
+    message text NOT NULL,
+    is_read boolean NOT NULL,
+    count integer NOT NULL CHECK (count >= 0),
+    created_at timestamp with time zone NOT NULL,
+    updated_at timestamp with time zone NOT NULL,
+    user_id integer NOT NULL
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE notifications_notification_default PARTITION OF notifications_notification DEFAULT;
+
+DO $$
+DECLARE
+    month date;
+BEGIN
+    FOR month IN
+        SELECT generate_series(
+            date_trunc('month', coalesce((SELECT min(created_at) FROM notifications_notification_flat), now())),
+            date_trunc('month', now() + interval '3 months'),
+            interval '1 month'
+        )::date
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF notifications_notification FOR VALUES FROM (%L) TO (%L)',
+            'notifications_notification_p' || to_char(month, 'YYYYMM'), month, (month + interval '1 month')::date
+        );
+    END LOOP;
+END $$;
+
+INSERT INTO notifications_notification (id, message, is_read, count, created_at, updated_at, user_id)
+SELECT id, message, is_read, count, created_at, updated_at, user_id FROM notifications_notification_flat;
+
+DROP TABLE notifications_notification_flat;
+
+CREATE SEQUENCE notifications_notification_id_seq OWNED BY notifications_notification.id;
+SELECT setval('notifications_notification_id_seq', coalesce((SELECT max(id) FROM notifications_notification), 0) + 1, false);
+ALTER TABLE notifications_notification ALTER COLUMN id SET DEFAULT nextval('notifications_notification_id_seq');
+
+ALTER TABLE notifications_notification ADD CONSTRAINT notifications_notification_pkey PRIMARY KEY (id, created_at);
+ALTER TABLE notifications_notification ADD CONSTRAINT notifications_notification_user_id_fk_auth_user_id
+    FOREIGN KEY (user_id) REFERENCES auth_user (id) DEFERRABLE INITIALLY DEFERRED;
+CREATE INDEX notification_user_created_idx ON notifications_notification (user_id, created_at DESC);
+"""
+
+UNPARTITION = """
+CREATE TABLE notifications_notification_flat (LIKE notifications_notification INCLUDING DEFAULTS INCLUDING CONSTRAINTS);
+INSERT INTO notifications_notification_flat SELECT * FROM notifications_notification;
+
+ALTER SEQUENCE notifications_notification_id_seq OWNED BY NONE;
+DROP TABLE notifications_notification;
+ALTER TABLE notifications_notification_flat RENAME TO notifications_notification;
+ALTER SEQUENCE notifications_notification_id_seq OWNED BY notifications_notification.id;
+
+ALTER TABLE notifications_notification ADD CONSTRAINT notifications_notification_pkey PRIMARY KEY (id);
+ALTER TABLE notifications_notification ADD CONSTRAINT notifications_notification_user_id_fk_auth_user_id
+    FOREIGN KEY (user_id) REFERENCES auth_user (id) DEFERRABLE INITIALLY DEFERRED;
+CREATE INDEX notifications_notification_user_id_idx ON notifications_notification (user_id);
+CREATE INDEX notification_user_created_idx ON notifications_notification (user_id, created_at DESC);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_notification_count'),
+    ]
+
+    operations = [
+        migrations.RunSQL(PARTITION, UNPARTITION),
+    ]
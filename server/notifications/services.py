@@ -1,6 +1,11 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
 from .serializers import NotificationSerializer
 from .models import Notification
 from django.contrib.auth.models import User
+from jobs.services import JobService
 
 class NotificationService:
     
@@ -9,10 +14,186 @@ class NotificationService:
         notification = Notification.objects.create(user=user, message=message)
         return NotificationSerializer(notification).data
     
-    # admin notifications
+    # admin notifications, written by a background worker after the request commits
     @staticmethod
     def admin_notifications(message):
-        user = User.objects.filter(is_superuser=True).first()
-        if user:
-            return NotificationService.create_notification(user, message)
-        return None
\ No newline at end of file
+        JobService.enqueue("notifications.admin", {"message": message})
+
+    @staticmethod
+    def notify_users(user_ids, message, idempotency_key=None):
+        JobService.enqueue("notifications.users", {"user_ids": list(user_ids), "message": message}, idempotency_key)
+
+    # a different message per user, still one job and one insert
+    @staticmethod
+    def notify_many(messages, idempotency_key=None):
+        JobService.enqueue("notifications.many", {"messages": [[user_id, message] for user_id, message in messages]}, idempotency_key)
+
+    # every reviewer assigned to the proposal, resolved by the worker
+    @staticmethod
+    def notify_proposal_reviewers(proposal_id, message, idempotency_key=None):
+        JobService.enqueue("notifications.proposal_reviewers", {"proposal_id": proposal_id, "message": message}, idempotency_key)
+
+
+class NotificationRetentionService:
+    TABLE = Notification._meta.db_table
+    DEFAULT_PARTITION = f"{TABLE}_default"
+
+    # at most one maintenance job per hour, queued behind the notifications that triggered it
+    @staticmethod
+    def schedule():
+        hour = timezone.now().strftime("%Y%m%d%H")
+        JobService.enqueue("notifications.maintenance", idempotency_key=f"notifications-maintenance-{hour}", delay=timedelta(minutes=10))
+
+    @staticmethod
+    def cutoff(days=None):
+        return timezone.now() - timedelta(days=days if days is not None else settings.NOTIFICATION_RETENTION_DAYS)
+
+    # partition bounds are utc month starts, the same ones the partitioning migration created
+    @staticmethod
+    def month_start(value, months=0):
+        index = value.year * 12 + value.month - 1 + months
+        return datetime(index // 12, index % 12 + 1, 1, tzinfo=dt_timezone.utc)
+
+    @staticmethod
+    def partitions():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = %s::regclass",
+                [NotificationRetentionService.TABLE],
+            )
+            names = [row[0] for row in cursor.fetchall()]
+        prefix = f"{NotificationRetentionService.TABLE}_p"
+        return {
+            datetime.strptime(name[len(prefix):], "%Y%m").replace(tzinfo=dt_timezone.utc): name
+            for name in names if name.startswith(prefix)
+        }
+
+    # rows that already fell into the default partition for the month are moved into the new one before it is attached
+    @staticmethod
+    @transaction.atomic
+    def create_partition(month):
+        table = NotificationRetentionService.TABLE
+        name = f"{table}_p{month:%Y%m}"
+        end = NotificationRetentionService.month_start(month, 1)
+        quote = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(f"CREATE TABLE {quote(name)} (LIKE {quote(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+            cursor.execute(
+                f"WITH moved AS (DELETE FROM {quote(NotificationRetentionService.DEFAULT_PARTITION)} "
+                f"WHERE created_at >= %s AND created_at < %s RETURNING *) "
+                f"INSERT INTO {quote(name)} SELECT * FROM moved",
+                [month, end],
+            )
+            cursor.execute(
+                f"ALTER TABLE {quote(table)} ATTACH PARTITION {quote(name)} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        return name
+
+    @staticmethod
+    def ensure_partitions(months_ahead=None):
+        months_ahead = months_ahead if months_ahead is not None else settings.NOTIFICATION_PARTITION_MONTHS_AHEAD
+        existing = NotificationRetentionService.partitions()
+        current = NotificationRetentionService.month_start(timezone.now())
+        created = []
+        for offset in range(months_ahead + 1):
+            month = NotificationRetentionService.month_start(current, offset)
+            if month not in existing:
+                created.append(NotificationRetentionService.create_partition(month))
+        return created
+
+    # a month older than the retention window only keeps unread rows, once those are gone the partition is dropped
+    @staticmethod
+    def drop_empty_partitions(cutoff):
+        quote = connection.ops.quote_name
+        dropped = []
+        for month, name in sorted(NotificationRetentionService.partitions().items()):
+            if NotificationRetentionService.month_start(month, 1) > cutoff:
+                continue
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {quote(name)})")
+                if cursor.fetchone()[0]:
+                    continue
+                cursor.execute(f"ALTER TABLE {quote(NotificationRetentionService.TABLE)} DETACH PARTITION {quote(name)}")
+                cursor.execute(f"DROP TABLE {quote(name)}")
+            dropped.append(name)
+        return dropped
+
+    # one bounded delete, the created_at predicate lets postgres prune the newer partitions
+    @staticmethod
+    def purge_batch(cutoff, batch=None):
+        batch = batch or settings.NOTIFICATION_PURGE_BATCH
+        ids = list(
+            Notification.objects.filter(is_read=True, created_at__lt=cutoff).order_by("id").values_list("id", flat=True)[:batch]
+        )
+        if not ids:
+            return 0
+        deleted, _ = Notification.objects.filter(id__in=ids, created_at__lt=cutoff).delete()
+        return deleted
+
+    # up to batch groups of identical (user, message, read state) rows become their newest row, which
+    # carries the summed count, the other rows of each group are deleted in the same statement
+    @staticmethod
+    def compact_batch(batch=None):
+        batch = batch or settings.NOTIFICATION_PURGE_BATCH
+        table = connection.ops.quote_name(NotificationRetentionService.TABLE)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH groups AS (
+                    SELECT user_id, message, is_read, max(id) AS keep_id, sum(count) AS total
+                    FROM {table}
+                    GROUP BY user_id, message, is_read
+                    HAVING count(*) > 1
+                    LIMIT %s
+                ), kept AS (
+                    UPDATE {table} AS n SET count = g.total, updated_at = now()
+                    FROM groups g WHERE n.id = g.keep_id
+                    RETURNING n.id
+                ), removed AS (
+                    DELETE FROM {table} AS n USING groups g
+                    WHERE n.user_id = g.user_id AND n.message = g.message AND n.is_read = g.is_read AND n.id <> g.keep_id
+                    RETURNING n.id
+                )
+                SELECT (SELECT count(*) FROM kept), (SELECT count(*) FROM removed)
+                """,
+                [batch],
+            )
+            return cursor.fetchone()
+
+    # what a maintenance run would remove, without touching anything
+    @staticmethod
+    def pending(cutoff):
+        table = connection.ops.quote_name(NotificationRetentionService.TABLE)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT count(*), coalesce(sum(dupes), 0) FROM (
+                    SELECT count(*) AS dupes FROM {table}
+                    GROUP BY user_id, message, is_read
+                    HAVING count(*) > 1
+                ) AS duplicates
+                """
+            )
+            groups, rows = cursor.fetchone()
+        return {
+            "purge": Notification.objects.filter(is_read=True, created_at__lt=cutoff).count(),
+            "compact_groups": groups,
+            "compact_rows": int(rows) - groups,
+        }
+
+    # runs every step until nothing is left, each batch commits on its own so locks stay short
+    @staticmethod
+    def maintain(days=None, batch=None, months_ahead=None):
+        batch = batch or settings.NOTIFICATION_PURGE_BATCH
+        cutoff = NotificationRetentionService.cutoff(days)
+        report = {"created_partitions": NotificationRetentionService.ensure_partitions(months_ahead), "purged": 0, "compacted": 0}
+        while (purged := NotificationRetentionService.purge_batch(cutoff, batch)):
+            report["purged"] += purged
+        while True:
+            groups, removed = NotificationRetentionService.compact_batch(batch)
+            report["compacted"] += removed
+            if groups < batch:
+                break
+        report["dropped_partitions"] = NotificationRetentionService.drop_empty_partitions(cutoff)
+        return report
@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from jobs.registry import task
+from jobs.services import JobService
+from reviewer.models import ProposalReviewer
+from .models import Notification
+from .services import NotificationRetentionService
+
+
+@task("notifications.admin")
+def admin_notification(message):
+    user = User.objects.filter(is_superuser=True).first()
+    if user:
+        Notification.objects.create(user=user, message=message)
+        NotificationRetentionService.schedule()
+
+
+@task("notifications.users")
+def notify_users(user_ids, message):
+    Notification.objects.bulk_create([Notification(user_id=user_id, message=message) for user_id in user_ids])
+    NotificationRetentionService.schedule()
+
+
+@task("notifications.proposal_reviewers")
+def notify_proposal_reviewers(proposal_id, message):
+    reviewer_ids = ProposalReviewer.objects.filter(proposal_id=proposal_id).values_list("reviewer_id", flat=True)
+    Notification.objects.bulk_create([Notification(user_id=reviewer_id, message=message) for reviewer_id in reviewer_ids])
+    NotificationRetentionService.schedule()
+
+
+@task("notifications.many")
+def notify_many(messages):
+    Notification.objects.bulk_create([Notification(user_id=user_id, message=message) for user_id, message in messages])
+    NotificationRetentionService.schedule()
+
+
+# one purge batch and one compaction batch per job so the job transaction stays short,
+# a full batch means more is left and the job queues itself again
+@task("notifications.maintenance")
+def maintain_notifications():
+    batch = settings.NOTIFICATION_PURGE_BATCH
+    cutoff = NotificationRetentionService.cutoff()
+    NotificationRetentionService.ensure_partitions()
+    purged = NotificationRetentionService.purge_batch(cutoff, batch)
+    groups, _ = NotificationRetentionService.compact_batch(batch)
+    if purged >= batch or groups >= batch:
+        JobService.enqueue("notifications.maintenance")
+    else:
+        NotificationRetentionService.drop_empty_partitions(cutoff)
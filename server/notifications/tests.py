@@ -1,3 +1,51 @@
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase
+from django.utils import timezone
+from .models import Notification
+from .services import NotificationRetentionService
 
 # Create your tests here.
+class NotificationRetentionTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="implementor", password="pass")
+
+    def partition_of(self, notification):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT tableoid::regclass::text FROM notifications_notification WHERE id = %s", [notification.id])
+            return cursor.fetchone()[0]
+
+    def test_purges_old_read_rows_and_compacts_repeated_messages(self):
+        old = timezone.now() - timedelta(days=120)
+        Notification.objects.bulk_create([Notification(user=self.user, message=f"old {i}", is_read=True) for i in range(5)])
+        Notification.objects.update(created_at=old)
+        unread_old = Notification.objects.create(user=self.user, message="still unread")
+        Notification.objects.filter(id=unread_old.id).update(created_at=old)
+        repeated = Notification.objects.bulk_create([Notification(user=self.user, message="Proposal submitted") for _ in range(4)])
+        read_repeat = Notification.objects.create(user=self.user, message="Proposal submitted", is_read=True)
+
+        cutoff = NotificationRetentionService.cutoff(90)
+        self.assertEqual(NotificationRetentionService.pending(cutoff), {"purge": 5, "compact_groups": 1, "compact_rows": 3})
+        report = NotificationRetentionService.maintain(days=90, batch=2)
+
+        self.assertEqual((report["purged"], report["compacted"]), (5, 3))
+        kept = Notification.objects.get(message="Proposal submitted", is_read=False)
+        self.assertEqual((kept.id, kept.count), (repeated[-1].id, 4))
+        self.assertEqual(Notification.objects.get(id=read_repeat.id).count, 1)
+        self.assertTrue(Notification.objects.filter(id=unread_old.id).exists())
+        self.assertEqual(NotificationRetentionService.pending(cutoff), {"purge": 0, "compact_groups": 0, "compact_rows": 0})
+
+    def test_new_partition_takes_rows_from_the_default_partition(self):
+        later = timezone.now() + timedelta(days=31 * 8)
+        notification = Notification.objects.create(user=self.user, message="scheduled")
+        Notification.objects.filter(id=notification.id).update(created_at=later)
+        self.assertEqual(self.partition_of(notification), NotificationRetentionService.DEFAULT_PARTITION)
+
+        created = NotificationRetentionService.ensure_partitions(months_ahead=9)
+
+        name = f"{NotificationRetentionService.TABLE}_p{later:%Y%m}"
+        self.assertIn(name, created)
+        self.assertEqual(self.partition_of(notification), name)
+        self.assertEqual(NotificationRetentionService.ensure_partitions(months_ahead=9), [])
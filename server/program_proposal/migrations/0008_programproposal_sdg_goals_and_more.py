@@ -0,0 +1,47 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:17
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+from proposals_node.services import ProposalFacetService
+
+
+def backfill_sdg_goals(apps, schema_editor):
+    ProgramProposal = apps.get_model("program_proposal", "ProgramProposal")
+    for document in ProgramProposal.objects.exclude(sdg_addressed__isnull=True).only("id", "sdg_addressed"):
+        ProgramProposal.objects.filter(id=document.id).update(
+            sdg_goals=ProposalFacetService.parse_sdg_goals(document.sdg_addressed)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('program_proposal', '0007_alter_programproposal_methodology'),
+        ('proposals_node', '0008_alter_proposal_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='programproposal',
+            name='sdg_goals',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='programproposal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tags'], name='program_tags_gin_idx', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='programproposal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['clusters'], name='program_clusters_gin_idx', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='programproposal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['agendas'], name='program_agendas_gin_idx', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='programproposal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['sdg_goals'], name='program_sdg_goals_gin_idx', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.RunPython(backfill_sdg_goals, migrations.RunPython.noop),
+    ]
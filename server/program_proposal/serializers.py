@@ -6,6 +6,7 @@ from .models import (
     ProgramProposalHistory
 )
 from project_proposal.models import ProjectProposal
+from activity_proposal.models import ActivityProposal
 from proposals_node.serializers import ProposalSerializer
 from project_proposal.serializers import (
     ProjectsListDataSerializer
@@ -182,4 +183,27 @@ class ProgramProposalHistorySerializer(serializers.ModelSerializer):
     class Meta:
         model = ProgramProposalHistory
         fields = "__all__"
-        
\ No newline at end of file
+        
+
+# validates a whole program tree, ProgramTreeService does the inserts ==========
+class ActivityTreeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ActivityProposal
+        exclude = ['proposal', 'project_proposal', 'sdg_goals']
+
+
+class ProjectTreeSerializer(serializers.ModelSerializer):
+    activities = ActivityTreeSerializer(many=True, required=False)
+
+    class Meta:
+        model = ProjectProposal
+        exclude = ['proposal', 'program_proposal', 'sdg_goals', 'activity_list']
+
+
+class ProgramTreeSerializer(serializers.ModelSerializer):
+    title = serializers.CharField(write_only=True)
+    projects = ProjectTreeSerializer(many=True, required=False)
+
+    class Meta:
+        model = ProgramProposal
+        exclude = ['proposal', 'sdg_goals', 'project_list']
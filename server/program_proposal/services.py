@@ -0,0 +1,197 @@
+from django.db import transaction
+# app
+from .models import ProgramProposal
+from proposals_node.models import Proposal
+from proposals_node.services import ProposalFacetService, OverviewService
+from project_proposal.models import ProjectProposal
+from activity_proposal.models import ActivityProposal
+from budgets.models import BudgetLineItem
+from budgets.services import BudgetLineItemService
+from jobs.services import JobService
+from proposal_cover.models import ProposalCoverPage
+from archives.selectors import ArchiveSelectors
+
+
+def iso(value):
+    return value.isoformat() if value else value
+
+
+class ProgramTreeService:
+
+    # the same summary shape the program and project forms send as project_list / activity_list
+    @staticmethod
+    def project_summary(project):
+        return {
+            "project_title": project.get("project_title"),
+            "project_leader": project.get("project_leader"),
+            "project_member": project.get("members") or [],
+            "project_duration": project.get("duration_months"),
+            "project_start_date": iso(project.get("start_date")),
+            "project_end_date": iso(project.get("end_date")),
+        }
+
+    @staticmethod
+    def activity_summary(activity):
+        return {
+            "activity_title": activity.get("activity_title"),
+            "project_leader": activity.get("project_leader"),
+            "project_member": activity.get("members") or [],
+            "activity_duration": activity.get("activity_duration_hours"),
+            "activity_date": iso(activity.get("activity_date")),
+        }
+
+    # a whole program with its projects and activities in one transaction and one insert per table,
+    # bulk_create skips the save signals so sdg goals, budget line items and the search reindex are done here
+    @staticmethod
+    @transaction.atomic
+    def create_tree(user, data):
+        data = dict(data)
+        title = data.pop("title")
+        projects = [dict(project) for project in data.pop("projects", [])]
+        activities = [project.pop("activities", []) for project in projects]
+
+        roots = [Proposal(user=user, title=title, proposal_type="Program")]
+        roots += [Proposal(user=user, title=project.get("project_title"), proposal_type="Project") for project in projects]
+        roots += [
+            Proposal(user=user, title=activity.get("activity_title"), proposal_type="Activity")
+            for group in activities for activity in group
+        ]
+        Proposal.objects.bulk_create(roots)
+        project_roots = roots[1:len(projects) + 1]
+        activity_roots = iter(roots[len(projects) + 1:])
+
+        for row in [data, *projects, *[activity for group in activities for activity in group]]:
+            row["sdg_goals"] = ProposalFacetService.parse_sdg_goals(row.get("sdg_addressed"))
+
+        program = ProgramProposal(
+            proposal=roots[0],
+            project_list=[ProgramTreeService.project_summary(project) for project in projects],
+            **data
+        )
+        ProgramProposal.objects.bulk_create([program])
+
+        project_rows = ProjectProposal.objects.bulk_create([
+            ProjectProposal(
+                proposal=root,
+                program_proposal=program,
+                activity_list=[ProgramTreeService.activity_summary(activity) for activity in group],
+                **project
+            )
+            for root, project, group in zip(project_roots, projects, activities)
+        ]) if projects else []
+
+        activity_rows = ActivityProposal.objects.bulk_create([
+            ActivityProposal(proposal=next(activity_roots), project_proposal=project_row, **activity)
+            for project_row, group in zip(project_rows, activities) for activity in group
+        ])
+
+        documents = [("Program", program), *[("Project", row) for row in project_rows], *[("Activity", row) for row in activity_rows]]
+        line_items = []
+        for proposal_type, document in documents:
+            line_items += BudgetLineItemService.build_line_items(document.proposal, proposal_type, document.budget_requirements)
+        BudgetLineItem.objects.bulk_create(line_items)
+
+        JobService.enqueue("search.reindex_many", {"proposal_ids": [root.id for root in roots]})
+        # bulk_create skips post_save, so the overview series is dropped here
+        OverviewService.invalidate_series()
+        return program, project_rows, activity_rows
+
+    # the document fields of a row, without its id, its links to the tree and its timestamps
+    @staticmethod
+    def copy_fields(obj, skip=("id", "proposal", "program_proposal", "project_proposal", "created_at")):
+        return {
+            field.attname: getattr(obj, field.attname)
+            for field in obj._meta.concrete_fields
+            if field.name not in skip
+        }
+
+    # the source tree, from the hot tables or from the archive when its year was closed
+    @staticmethod
+    def load_tree(program):
+        if getattr(program, "archived", False):
+            projects = ArchiveSelectors.filter(ProjectProposal, program_proposal=program)
+            activities = [
+                activity
+                for project in projects
+                for activity in ArchiveSelectors.filter(ActivityProposal, project_proposal=project)
+            ]
+            return projects, activities
+        projects = list(ProjectProposal.objects.filter(program_proposal=program).order_by("id"))
+        activities = list(ActivityProposal.objects.filter(project_proposal__program_proposal=program).order_by("id"))
+        return projects, activities
+
+    # a copy of the program with its projects, activities and cover pages as new draft proposals of the
+    # current year, one insert per table, no reviewers, version 1
+    @staticmethod
+    @transaction.atomic
+    def clone_tree(user, source, title=None):
+        fields = ProgramTreeService.copy_fields(source)
+        # the document carries the title too, a new one is written to both
+        if title:
+            fields["program_title"] = title
+        title = title or source.program_title
+        projects, activities = ProgramTreeService.load_tree(source)
+        source_ids = [source.proposal_id, *[project.proposal_id for project in projects], *[activity.proposal_id for activity in activities]]
+
+        roots = [Proposal(user=user, title=title, proposal_type="Program")]
+        roots += [Proposal(user=user, title=project.project_title or "", proposal_type="Project") for project in projects]
+        roots += [Proposal(user=user, title=activity.activity_title, proposal_type="Activity") for activity in activities]
+        Proposal.objects.bulk_create(roots)
+        new_root = dict(zip(source_ids, roots))
+
+        program = ProgramProposal(proposal=roots[0], **fields)
+        ProgramProposal.objects.bulk_create([program])
+        project_rows = ProjectProposal.objects.bulk_create([
+            ProjectProposal(proposal=new_root[project.proposal_id], program_proposal=program, **ProgramTreeService.copy_fields(project))
+            for project in projects
+        ]) if projects else []
+        new_project = {project.id: row for project, row in zip(projects, project_rows)}
+        activity_rows = ActivityProposal.objects.bulk_create([
+            ActivityProposal(
+                proposal=new_root[activity.proposal_id],
+                project_proposal=new_project[activity.project_proposal_id],
+                **ProgramTreeService.copy_fields(activity)
+            )
+            for activity in activities
+        ])
+
+        covers = list(ProposalCoverPage.objects.filter(proposal_id__in=source_ids))
+        if getattr(source, "archived", False):
+            covers += [cover for proposal_id in source_ids for cover in ArchiveSelectors.filter(ProposalCoverPage, proposal=proposal_id)]
+        ProposalCoverPage.objects.bulk_create([
+            ProposalCoverPage(proposal=new_root[cover.proposal_id], **ProgramTreeService.copy_fields(cover))
+            for cover in covers
+        ])
+
+        documents = [("Program", program), *[("Project", row) for row in project_rows], *[("Activity", row) for row in activity_rows]]
+        line_items = []
+        for proposal_type, document in documents:
+            line_items += BudgetLineItemService.build_line_items(document.proposal, proposal_type, document.budget_requirements)
+        BudgetLineItem.objects.bulk_create(line_items)
+
+        JobService.enqueue("search.reindex_many", {"proposal_ids": [root.id for root in roots]})
+        OverviewService.invalidate_series()
+        return program, project_rows, activity_rows
+
+    # ids only, the tree was just sent by the client
+    @staticmethod
+    def tree_data(program, projects, activities):
+        activities_by_project = {}
+        for activity in activities:
+            activities_by_project.setdefault(activity.project_proposal_id, []).append(
+                {"id": activity.id, "proposal_id": activity.proposal_id, "activity_title": activity.activity_title}
+            )
+        return {
+            "id": program.id,
+            "proposal_id": program.proposal_id,
+            "program_title": program.program_title,
+            "projects": [
+                {
+                    "id": project.id,
+                    "proposal_id": project.proposal_id,
+                    "project_title": project.project_title,
+                    "activities": activities_by_project.get(project.id, []),
+                }
+                for project in projects
+            ],
+        }
@@ -1,7 +1,19 @@
 from django.test import TestCase
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from users.models import UserProfile
+from activity_proposal.models import ActivityProposal
+from budgets.models import BudgetLineItem
+from jobs.models import Job
 from proposals_node.models import Proposal
 from program_proposal.models import ProgramProposal, ProgramProposalHistory
+from project_proposal.models import ProjectProposal
+from proposal_cover.models import ProposalCoverPage
+from proposals_node.services import ProposalStatusService
+from reviewer.models import ProposalReviewer
+from benchmarks.factory import SyntheticDataFactory, SCALES
 from .serializers import  ProgramProposalSerializer, ProgramProposalHistorySerializer, ProgramProposalHistoryListSerializer
 from .mapper import ProgramHistoryMapper
 
@@ -38,3 +50,73 @@ class ProposalTest(TestCase):
         data = ProgramHistoryMapper.history_list_mapper(proposal_serializers.data, history_serializers.data)
         print(data)
         self.assertEqual(history.count(), 2)
+
+
+class ProgramTreeTest(TestCase):
+
+    def test_creates_the_whole_tree_with_one_insert_per_table(self):
+        user = User.objects.create(username="implementor")
+        UserProfile.objects.create(user=user, name="Implementor", role="implementor", campus="Iba", department="CCIT")
+        client = APIClient()
+        client.force_authenticate(user)
+        payload = {
+            "title": "Coastal Livelihood",
+            "program_title": "Coastal Livelihood",
+            "sdg_addressed": "SDG 14",
+            "budget_requirements": [{"item": "Boats", "amount": 5000}],
+            "projects": [
+                {
+                    "project_title": f"Project {p}",
+                    "start_date": "2026-01-01",
+                    "activities": [{"activity_title": f"Activity {p}.{a}", "budget_requirements": [{"item": "Snacks", "amount": 100}]} for a in range(8)],
+                }
+                for p in range(10)
+            ],
+        }
+
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            response = client.post("/api/program-proposal/tree/", payload, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        inserts = [q["sql"] for q in queries.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertLessEqual(len(inserts), 8)
+        self.assertEqual(Proposal.objects.filter(user=user).count(), 91)
+        self.assertEqual(ActivityProposal.objects.filter(project_proposal__program_proposal__proposal__user=user).count(), 80)
+
+        program = ProgramProposal.objects.get(id=response.data["data"]["id"])
+        self.assertEqual(program.sdg_goals, [14])
+        self.assertEqual(program.project_list[0]["project_start_date"], "2026-01-01")
+        self.assertEqual(BudgetLineItem.objects.filter(proposal__user=user, is_current=True).count(), 81)
+        self.assertEqual(Job.objects.filter(name="search.reindex_many").count(), 1)
+
+
+class ProgramCloneTest(TestCase):
+
+    def test_clones_the_tree_as_a_new_draft_without_reviewers(self):
+        data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        source = data.programs[0]
+        owner = source.proposal.user
+        Proposal.objects.filter(id=source.proposal_id).update(status="approved", version_no=3)
+        ProposalCoverPage.objects.create(proposal=source.proposal, cover_page_body="Cover")
+        projects = ProjectProposal.objects.filter(program_proposal=source).count()
+        activities = ActivityProposal.objects.filter(project_proposal__program_proposal=source).count()
+
+        client = APIClient()
+        client.force_authenticate(data.implementors[1] if data.implementors[0] == owner else data.implementors[0])
+        self.assertEqual(client.post(f"/api/program-proposal/{source.id}/clone/").status_code, 403)
+
+        client.force_authenticate(owner)
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            response = client.post(f"/api/program-proposal/{source.id}/clone/", {"title": "Next year"}, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        inserts = [q["sql"] for q in queries.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertLessEqual(len(inserts), 8)
+        clone = ProgramProposal.objects.get(id=response.data["data"]["id"])
+        self.assertEqual((clone.proposal.title, clone.proposal.status, clone.proposal.version_no), ("Next year", "draft", 1))
+        self.assertEqual(clone.program_title, "Next year")
+        self.assertEqual(clone.rationale, source.rationale)
+        self.assertEqual(ProjectProposal.objects.filter(program_proposal=clone).count(), projects)
+        self.assertEqual(ActivityProposal.objects.filter(project_proposal__program_proposal=clone).count(), activities)
+        self.assertEqual(ProposalCoverPage.objects.get(proposal=clone.proposal).cover_page_body, "Cover")
+        self.assertFalse(ProposalReviewer.objects.filter(proposal_id__in=ProposalStatusService.subtree_ids([clone.proposal_id])).exists())
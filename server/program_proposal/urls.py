@@ -5,13 +5,17 @@ from .views import (
     ProgramProposalDetail,
     ProgramProjectsView,
     ProgramListHistoryView,
+    ProgramTreeCreateView,
+    ProgramTreeCloneView,
     #ProgramProposalHistoryDetails,
 )
 
 urlpatterns = [
     # implementor urls
     path("program-proposal/", ProgramProposalList.as_view(), name="program-proposal"),
+    path("program-proposal/tree/", ProgramTreeCreateView.as_view(), name="program-proposal-tree"),
     path("program-proposal/<int:pk>/", ProgramProposalDetail.as_view(), name="program-proposal-detail"),
+    path("program-proposal/<int:pk>/clone/", ProgramTreeCloneView.as_view(), name="program-proposal-clone"),
     path("program-proposal/<int:program_proposal_id>/projects/", ProgramProjectsView.as_view(), name="program-proposal-projects"),
     path("program-proposal/<int:proposal_id>/history-list/", ProgramListHistoryView.as_view(), name="program-proposal-history-list"),
     #path("program-proposal/<int:pk>/history-details/", ProgramProposalHistoryDetails.as_view(), name="program-proposal-history-detail"),
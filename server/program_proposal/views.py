@@ -12,15 +12,17 @@ from .serializers import (
     ProgramProposalSerializer,
     ProgramProjectsSerializer,
     ProgramProposalHistoryListSerializer,
-    ProgramProposalHistorySerializer
+    ProgramProposalHistorySerializer,
+    ProgramTreeSerializer
 )
 from .mapper import ProgramHistoryMapper
+from .services import ProgramTreeService
 from proposals_node.models import Proposal
 from proposals_node.services import YearConfigService
+from archives.selectors import ArchiveSelectors
 from notifications.services import NotificationService
 from reviewer.models import ProposalReviewer
 from reviewer.services import ProposalReviewerServices
-from notifications.models import Notification
 # Create your views here.
 
 # IMPLEMENTOR VIEWS CREATE proposal
@@ -62,6 +64,57 @@ class ProgramProposalList(APIView):
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
+# IMPLEMENTOR VIEWS CREATE a program with all its projects and activities in one request
+class ProgramTreeCreateView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        if YearConfigService.check_year_lock():
+            return Response({"message": "The creation of proposals is locked. You cannot submit a proposal until the admin unlock."}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = ProgramTreeSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        program, projects, activities = ProgramTreeService.create_tree(request.user, serializer.validated_data)
+        NotificationService.admin_notifications(
+            f"New program proposal submitted by {request.user.profile.name} with title '{program.program_title}'."
+        )
+        return Response(
+            {
+                "message": "Program proposal created successfully",
+                "data": ProgramTreeService.tree_data(program, projects, activities)
+            },
+            status=status.HTTP_201_CREATED
+        )
+
+# IMPLEMENTOR VIEWS copy one of my programs, archived years included, as a new draft for the current year
+class ProgramTreeCloneView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        if YearConfigService.check_year_lock():
+            return Response({"message": "The creation of proposals is locked. You cannot submit a proposal until the admin unlock."}, status=status.HTTP_400_BAD_REQUEST)
+
+        source = ArchiveSelectors.get_live_or_archived(ProgramProposal, id=pk)
+        proposal = ArchiveSelectors.get_live_or_archived(Proposal, id=source.proposal_id)
+        if proposal.user_id != request.user.id:
+            return Response({"message": "You can only clone your own proposals."}, status=status.HTTP_403_FORBIDDEN)
+
+        program, projects, activities = ProgramTreeService.clone_tree(
+            request.user, source, title=request.data.get("title") or proposal.title
+        )
+        NotificationService.admin_notifications(
+            f"New program proposal submitted by {request.user.profile.name} with title '{program.program_title}'."
+        )
+        return Response(
+            {
+                "message": "Program proposal cloned successfully",
+                "data": ProgramTreeService.tree_data(program, projects, activities)
+            },
+            status=status.HTTP_201_CREATED
+        )
+
 # get the program proposal details
 class ProgramProposalDetail(APIView):
     permission_classes = [IsAuthenticated]
@@ -73,8 +126,9 @@ class ProgramProposalDetail(APIView):
         )
         return program_proposal
     
+    # archived years stay readable
     def get(self, request, pk):
-        program_proposal = self.get_object(pk) 
+        program_proposal = ArchiveSelectors.get_live_or_archived(ProgramProposal, id=pk)
         serializer = ProgramProposalSerializer(program_proposal)
         return Response(serializer.data, status=status.HTTP_200_OK)
     
@@ -97,12 +151,12 @@ class ProgramProposalDetail(APIView):
             NotificationService.admin_notifications(
                 f"The program proposal titled '{serializer.data.get('program_title')}' has been updated by  {request.user.profile.name} and saved to history."
             )
-            # save notification for every reviewer that this proposal is already revised
-            for r in proposal_reviewer:
-                Notification.objects.create(
-                    user= r.reviewer,
-                    message=f"The proposal '{program_data.program_title}' has been revised by the implementor and is ready for your review."
-                )
+            # notify every reviewer that this proposal is already revised, once per version
+            NotificationService.notify_proposal_reviewers(
+                program_data.proposal_id,
+                f"The proposal '{program_data.program_title}' has been revised by the implementor and is ready for your review.",
+                idempotency_key=f"revision-notice-{program_data.proposal_id}-v{program_data.proposal.version_no}",
+            )
             # remove the reviewed indicator for reviewer
             proposal_reviewer.update(is_review=False)
             
@@ -125,9 +179,12 @@ class ProgramListHistoryView(APIView):
     permission_classes = [IsAuthenticated]
     def get(self, request, proposal_id):
         # serialize the object
-        proposal = get_object_or_404(Proposal, id=proposal_id)
-        program_proposal = get_object_or_404(ProgramProposal, proposal=proposal)
-        history = proposal.program_history.all()
+        proposal = ArchiveSelectors.get_live_or_archived(Proposal, id=proposal_id)
+        program_proposal = ArchiveSelectors.get_live_or_archived(ProgramProposal, proposal=proposal)
+        if getattr(proposal, "archived", False):
+            history = ArchiveSelectors.filter(ProgramProposalHistory, proposal=proposal)
+        else:
+            history = proposal.program_history.all()
         
         # serialize the object
         program_serializer = ProgramProposalSerializer(program_proposal)
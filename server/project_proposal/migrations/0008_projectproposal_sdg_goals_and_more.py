@@ -0,0 +1,48 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:17
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+from proposals_node.services import ProposalFacetService
+
+
+def backfill_sdg_goals(apps, schema_editor):
+    ProjectProposal = apps.get_model("project_proposal", "ProjectProposal")
+    for document in ProjectProposal.objects.exclude(sdg_addressed__isnull=True).only("id", "sdg_addressed"):
+        ProjectProposal.objects.filter(id=document.id).update(
+            sdg_goals=ProposalFacetService.parse_sdg_goals(document.sdg_addressed)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('program_proposal', '0008_programproposal_sdg_goals_and_more'),
+        ('project_proposal', '0007_alter_projectproposal_methodology'),
+        ('proposals_node', '0008_alter_proposal_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectproposal',
+            name='sdg_goals',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='projectproposal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tags'], name='project_tags_gin_idx', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='projectproposal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['clusters'], name='project_clusters_gin_idx', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='projectproposal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['agendas'], name='project_agendas_gin_idx', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='projectproposal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['sdg_goals'], name='project_sdg_goals_gin_idx', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.RunPython(backfill_sdg_goals, migrations.RunPython.noop),
+    ]
@@ -5,7 +5,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, AllowAny 
-from .models import ProjectProposal
+from .models import ProjectProposal, ProjectProposalHistory
 from .serializers import (
     ProjectProposalSerializer,
     ProjectProposalUpdateSaveHistorySerializer,
@@ -17,7 +17,7 @@ from notifications.services import NotificationService
 from reviewer.services import ProposalReviewerServices
 from proposals_node.models import Proposal
 from proposals_node.services import YearConfigService
-from notifications.models import Notification
+from archives.selectors import ArchiveSelectors
 from reviewer.models import ProposalReviewer
 # Create your views here.
 
@@ -57,8 +57,9 @@ class ProjectProposalDetail(APIView):
         )
         return project_proposal
     
+    # archived years stay readable
     def get(self, request, pk):
-        project_proposal = self.get_object(pk)
+        project_proposal = ArchiveSelectors.get_live_or_archived(ProjectProposal, id=pk)
         serializer = ProjectProposalSerializer(
             project_proposal,
             context={"request": request}
@@ -122,12 +123,12 @@ class UpdateProjectSaveHistoryView(APIView):
             )
             
             # notification for reviewer
-            # save notification for every reviewer that this proposal is already revised
-            for r in proposal_reviewer:
-                Notification.objects.create(
-                    user= r.reviewer,
-                    message=f"The proposal '{project_data.project_title}' has been revised by the implementor and is ready for your review."
-                )
+            # notify every reviewer that this proposal is already revised, once per version
+            NotificationService.notify_proposal_reviewers(
+                project_data.proposal_id,
+                f"The proposal '{project_data.project_title}' has been revised by the implementor and is ready for your review.",
+                idempotency_key=f"revision-notice-{project_data.proposal_id}-v{project_data.proposal.version_no}",
+            )
             # remove the reviewed indicator for reviewer
             proposal_reviewer.update(is_review=False)
             
@@ -155,9 +156,12 @@ class ProjectListHistoryView(APIView):
     def get(self, request, proposal_id):
         # serialize the object
         ...
-        proposal = get_object_or_404(Proposal, id=proposal_id)
-        project_proposals = get_object_or_404(ProjectProposal, proposal=proposal)
-        history = proposal.project_history.all()
+        proposal = ArchiveSelectors.get_live_or_archived(Proposal, id=proposal_id)
+        project_proposals = ArchiveSelectors.get_live_or_archived(ProjectProposal, proposal=proposal)
+        if getattr(proposal, "archived", False):
+            history = ArchiveSelectors.filter(ProjectProposalHistory, proposal=proposal)
+        else:
+            history = proposal.project_history.all()
         
         project_serializer = ProjectProposalSerializer(project_proposals)
         history_serializer = ProjectProposalHistoryListSerializer(history, many=True)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ProposalsNodeConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'proposals_node'
+
+    def ready(self):
+        import proposals_node.signals
+        import proposals_node.tasks
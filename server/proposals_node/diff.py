@@ -0,0 +1,72 @@
+import difflib
+import json
+import re
+
+WORDS = re.compile(r"\s+|\w+|[^\w\s]")
+
+
+def canonical(value):
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def matcher(old, new):
+    return difflib.SequenceMatcher(None, old, new, autojunk=False)
+
+
+# word level hunks, "at" is the word position in the old text
+def diff_text(old, new):
+    old_words = WORDS.findall(old)
+    new_words = WORDS.findall(new)
+    return {
+        "type": "text",
+        "hunks": [
+            {"op": op, "at": i1, "old": "".join(old_words[i1:i2]), "new": "".join(new_words[j1:j2])}
+            for op, i1, i2, j1, j2 in matcher(old_words, new_words).get_opcodes()
+            if op != "equal"
+        ],
+    }
+
+
+# list item level, items are matched by content so a reorder or an insert in the middle only reports those items
+def diff_list(old, new):
+    changes = []
+    for op, i1, i2, j1, j2 in matcher([canonical(v) for v in old], [canonical(v) for v in new]).get_opcodes():
+        if op == "equal":
+            continue
+        if op == "replace" and i2 - i1 == j2 - j1:
+            # same number of items edited in place, report what changed inside each one
+            for offset in range(i2 - i1):
+                changes.append({"op": "change", "index": j1 + offset, "diff": diff_value(old[i1 + offset], new[j1 + offset])})
+            continue
+        changes.append({"op": op, "old_index": i1, "new_index": j1, "old": old[i1:i2], "new": new[j1:j2]})
+    return {"type": "list", "changes": changes}
+
+
+def diff_dict(old, new):
+    return {
+        "type": "object",
+        "fields": {
+            key: diff_value(old.get(key), new.get(key))
+            for key in dict.fromkeys([*old, *new])
+            if canonical(old.get(key)) != canonical(new.get(key))
+        },
+    }
+
+
+def diff_value(old, new):
+    if isinstance(old, dict) and isinstance(new, dict):
+        return diff_dict(old, new)
+    if isinstance(old, list) and isinstance(new, list):
+        return diff_list(old, new)
+    if isinstance(old, str) and isinstance(new, str):
+        return diff_text(old, new)
+    return {"type": "value", "old": old, "new": new}
+
+
+# only the sections that changed between the two documents
+def diff_documents(old, new, fields):
+    return {
+        field: diff_value(old.get(field), new.get(field))
+        for field in fields
+        if canonical(old.get(field)) != canonical(new.get(field))
+    }
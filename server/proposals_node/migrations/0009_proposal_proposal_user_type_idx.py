@@ -0,0 +1,19 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals_node', '0008_alter_proposal_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['user', 'proposal_type'], name='proposal_user_type_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals_node', '0009_proposal_proposal_user_type_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProposalStatusEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(choices=[('draft', 'Draft'), ('for_review', 'For Review'), ('under_review', 'Under Review'), ('for_revision', 'For Revision'), ('for_approval', 'For Approval'), ('approved', 'Approved'), ('rejected', 'Rejected')], max_length=20)),
+                ('to_status', models.CharField(choices=[('draft', 'Draft'), ('for_review', 'For Review'), ('under_review', 'Under Review'), ('for_revision', 'For Revision'), ('for_approval', 'For Approval'), ('approved', 'Approved'), ('rejected', 'Rejected')], max_length=20)),
+                ('note', models.CharField(blank=True, default='', max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='status_events', to=settings.AUTH_USER_MODEL)),
+                ('proposal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='proposals_node.proposal')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['proposal', 'created_at'], name='status_event_proposal_idx')],
+            },
+        ),
+    ]
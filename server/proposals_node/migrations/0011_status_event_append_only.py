@@ -0,0 +1,30 @@
+from django.db import migrations
+
+# status events are history, postgres refuses to rewrite them, deletes still cascade with the proposal
+APPEND_ONLY = """
+CREATE OR REPLACE FUNCTION proposal_status_event_append_only() RETURNS trigger AS $$
+BEGIN
+    RAISE EXCEPTION 'proposal status events are append only';
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER proposal_status_event_no_update
+    BEFORE UPDATE ON proposals_node_proposalstatusevent
+    FOR EACH ROW EXECUTE FUNCTION proposal_status_event_append_only();
+"""
+
+DROP_APPEND_ONLY = """
+DROP TRIGGER IF EXISTS proposal_status_event_no_update ON proposals_node_proposalstatusevent;
+DROP FUNCTION IF EXISTS proposal_status_event_append_only();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals_node', '0010_proposalstatusevent'),
+    ]
+
+    operations = [
+        migrations.RunSQL(APPEND_ONLY, DROP_APPEND_ONLY),
+    ]
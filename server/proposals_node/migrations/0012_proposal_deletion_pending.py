@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-19 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals_node', '0011_status_event_append_only'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='proposal',
+            name='deletion_pending',
+            field=models.BooleanField(default=False),
+        ),
+    ]
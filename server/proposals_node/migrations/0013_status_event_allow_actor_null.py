@@ -0,0 +1,33 @@
+from django.db import migrations
+
+# deleting a user nulls the actor of their status events (SET_NULL), that one rewrite is let through
+ALLOW_ACTOR_NULL = """
+CREATE OR REPLACE FUNCTION proposal_status_event_append_only() RETURNS trigger AS $$
+BEGIN
+    IF OLD.actor_id IS NOT NULL AND NEW.actor_id IS NULL
+        AND (to_jsonb(NEW) - 'actor_id') = (to_jsonb(OLD) - 'actor_id') THEN
+        RETURN NEW;
+    END IF;
+    RAISE EXCEPTION 'proposal status events are append only';
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+APPEND_ONLY = """
+CREATE OR REPLACE FUNCTION proposal_status_event_append_only() RETURNS trigger AS $$
+BEGIN
+    RAISE EXCEPTION 'proposal status events are append only';
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals_node', '0012_proposal_deletion_pending'),
+    ]
+
+    operations = [
+        migrations.RunSQL(ALLOW_ACTOR_NULL, APPEND_ONLY),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.11 on 2026-10-19 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals_node', '0013_status_event_allow_actor_null'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OverviewSeriesGeneration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField(unique=True)),
+                ('generation', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
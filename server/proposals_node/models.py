@@ -3,6 +3,12 @@ from django.db import models
 from django.contrib.auth.models import User
 # Create your models here.
 
+# proposals waiting for the background deletion are hidden everywhere, all_objects still sees them
+class ProposalManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().filter(deletion_pending=False)
+
+
 class Proposal(models.Model):
 
     STATUS_CHOICES = [
@@ -14,6 +20,16 @@ class Proposal(models.Model):
         ('approved', 'Approved'),
         ('rejected', 'Rejected'),
     ]
+    # status -> the statuses it may move to, ProposalStatusService only applies these
+    STATUS_TRANSITIONS = {
+        'draft': ['for_review'],
+        'for_review': ['under_review', 'for_revision', 'for_approval', 'rejected'],
+        'under_review': ['for_revision', 'for_approval', 'rejected'],
+        'for_revision': ['for_review', 'for_approval', 'rejected'],
+        'for_approval': ['approved', 'for_revision', 'rejected'],
+        'approved': [],
+        'rejected': [],
+    }
     PROPOSAL_TYPE_CHOICES = [
         ('Program', 'Program'),
         ('Project', 'Project'),
@@ -38,8 +54,17 @@ class Proposal(models.Model):
     budget_approved = models.DecimalField(decimal_places=2, max_digits=10, null=True, blank=True, default=0)
     version_no = models.IntegerField(default=1)
     trigger_review_reset = models.BooleanField(default=False)
+    deletion_pending = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ProposalManager()
+    all_objects = models.Manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'proposal_type'], name='proposal_user_type_idx'),
+        ]
+
     def __str__(self):
         return self.title
     
@@ -52,3 +77,31 @@ class YearConfig(models.Model):
 
     def __str__(self):
         return str(self.year)
+
+
+# one row per applied status change, written in bulk by ProposalStatusService
+class ProposalStatusEvent(models.Model):
+    proposal = models.ForeignKey(Proposal, on_delete=models.CASCADE, related_name="status_events")
+    from_status = models.CharField(max_length=20, choices=Proposal.STATUS_CHOICES)
+    to_status = models.CharField(max_length=20, choices=Proposal.STATUS_CHOICES)
+    actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name="status_events")
+    note = models.CharField(max_length=255, blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['proposal', 'created_at'], name='status_event_proposal_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.proposal_id}: {self.from_status} -> {self.to_status}"
+
+
+# bumped whenever a year of the overview series changes, the cached series of a year is keyed by its
+# generation so every process sees an invalidation no matter which process holds the cache
+class OverviewSeriesGeneration(models.Model):
+    year = models.IntegerField(unique=True)
+    generation = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.year}: {self.generation}"
@@ -1,6 +1,102 @@
+from django.db import connection
+from program_proposal.models import ProgramProposal
+from project_proposal.models import ProjectProposal
+from activity_proposal.models import ActivityProposal
+from .services import ProposalFacetService
 
 class ProposalNodeSelectors:
     
     @staticmethod
     def proposal_mapper():
-        ...
\ No newline at end of file
+        ...
+
+
+class ProposalFacetSelectors:
+    DETAILS = {
+        "Program": ("program_details", ProgramProposal),
+        "Project": ("project_details", ProjectProposal),
+        "Activity": ("activity_details", ActivityProposal),
+    }
+    # query param -> json column on the details model
+    FACET_PARAMS = {
+        "tags": "tags",
+        "clusters": "clusters",
+        "agendas": "agendas",
+        "sdg": "sdg_goals",
+    }
+
+    # the views answer 400 with this before any lookup is built
+    @staticmethod
+    def params_error(params):
+        year = params.get("year")
+        if year and not year.isdigit():
+            return "Year must be a number"
+        return None
+
+    @staticmethod
+    def facet_lookups(params, details_prefix="", proposal_prefix=""):
+        lookups = {}
+        for param, field in ProposalFacetSelectors.FACET_PARAMS.items():
+            values = [v for v in params.getlist(param) if v != ""]
+            if not values:
+                continue
+            if field == "sdg_goals":
+                values = ProposalFacetService.parse_sdg_goals(" ".join(values))
+            # one @> check per column, served by the jsonb_path_ops gin index
+            lookups[f"{details_prefix}{field}__contains"] = values
+
+        if params.get("year"):
+            lookups[f"{proposal_prefix}created_at__year"] = params.get("year")
+        if params.get("status"):
+            lookups[f"{proposal_prefix}status"] = params.get("status")
+        return lookups
+
+    # filter a Proposal queryset of one proposal type
+    @staticmethod
+    def filter_proposals(queryset, proposal_type, params):
+        if proposal_type not in ProposalFacetSelectors.DETAILS:
+            return queryset
+        relation, _ = ProposalFacetSelectors.DETAILS[proposal_type]
+        return queryset.filter(**ProposalFacetSelectors.facet_lookups(params, details_prefix=f"{relation}__"))
+
+    # per value counts of every facet for the current filter in ONE aggregate query
+    @staticmethod
+    def facet_counts(proposal_type, params, user=None):
+        _, model = ProposalFacetSelectors.DETAILS[proposal_type]
+        details = model.objects.filter(
+            proposal__proposal_type=proposal_type,
+            **ProposalFacetSelectors.facet_lookups(params, proposal_prefix="proposal__")
+        )
+        if user is not None:
+            details = details.filter(proposal__user=user)
+
+        filtered_sql, filtered_params = (
+            details.values("id", *ProposalFacetService.FACET_FIELDS).query.sql_with_params()
+        )
+        facet_selects = " UNION ALL ".join(
+            f"SELECT '{field}' AS facet, element.value AS value, filtered.id AS document_id "
+            f"FROM filtered, jsonb_array_elements_text("
+            f"CASE WHEN jsonb_typeof(filtered.{field}) = 'array' THEN filtered.{field} ELSE '[]'::jsonb END"
+            f") AS element(value)"
+            for field in ProposalFacetService.FACET_FIELDS
+        )
+        sql = (
+            f"WITH filtered AS ({filtered_sql}) "
+            f"SELECT facet, value, COUNT(DISTINCT document_id) FROM ({facet_selects}) AS facets "
+            f"GROUP BY facet, value "
+            f"UNION ALL SELECT 'total', NULL, COUNT(*) FROM filtered"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, filtered_params)
+            rows = cursor.fetchall()
+
+        data = {field: [] for field in ProposalFacetService.FACET_FIELDS}
+        data["total"] = 0
+        for facet, value, total in rows:
+            if facet == "total":
+                data["total"] = total
+            else:
+                data[facet].append({"value": value, "count": total})
+        for field in ProposalFacetService.FACET_FIELDS:
+            data[field].sort(key=lambda item: (-item["count"], item["value"]))
+        return data
@@ -1,7 +1,19 @@
+import re
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
 from django.db.models import Count
-from .models import Proposal
-from program_proposal.models import ProgramProposal
-from django.db.models import Count, Q
+from django.http import Http404
+from .diff import diff_documents
+from .models import OverviewSeriesGeneration, Proposal, ProposalStatusEvent
+from program_proposal.models import ProgramProposal, ProgramProposalHistory
+from project_proposal.models import ProjectProposal, ProjectProposalHistory
+from activity_proposal.models import ActivityProposal, ActivityProposalHistory
+from notifications.services import NotificationService
+from analytics.services import StatusRollupService
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import ExtractYear, Trunc
+from django.utils import timezone
 from .models import YearConfig
 
 
@@ -71,6 +83,109 @@ class OverviewService:
         data['proposal'] = proposal
         data['status'] = status
         return data
+
+    SERIES_INTERVALS = ['month', 'week']
+    SERIES_KINDS = {'approved': 'approvals', 'for_revision': 'revisions'}
+
+    @staticmethod
+    def series_key(year, interval, generation=0):
+        return f"overview-series:{year}:{interval}:{generation}"
+
+    @staticmethod
+    def generations(years):
+        rows = dict(OverviewSeriesGeneration.objects.filter(year__in=years).values_list("year", "generation"))
+        return {year: rows.get(year, 0) for year in years}
+
+    # new proposals and status changes only touch their own year, older years stay cached. the year moves
+    # to a new generation on commit, a reader that computed the series from rows before the commit stores
+    # it under the old generation where nobody reads it again
+    @staticmethod
+    def invalidate_series(*years):
+        years = sorted(set(years or [timezone.localdate().year]))
+
+        # the counter lives in the database, the cache is per process and the archive job runs in the workers
+        def bump():
+            table = OverviewSeriesGeneration._meta.db_table
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {table} (year, generation) SELECT unnest(%s::integer[]), 1 "
+                    f"ON CONFLICT (year) DO UPDATE SET generation = {table}.generation + 1",
+                    [years],
+                )
+
+        transaction.on_commit(bump)
+
+    # submissions and status events grouped by period in one round trip, a union of two date_trunc GROUP BYs
+    @staticmethod
+    def series_rows(years, interval):
+        submissions = (
+            Proposal.objects.filter(created_at__year__in=years)
+            .annotate(
+                year=ExtractYear('created_at'),
+                period=Trunc('created_at', interval),
+                type=F('proposal_type'),
+                kind=Value('submissions'),
+            )
+            .values('year', 'period', 'type', 'kind')
+            .annotate(total=Count('id'))
+            .order_by()
+        )
+        events = (
+            ProposalStatusEvent.objects.filter(
+                created_at__year__in=years,
+                to_status__in=OverviewService.SERIES_KINDS,
+                proposal__deletion_pending=False,
+            )
+            .annotate(
+                year=ExtractYear('created_at'),
+                period=Trunc('created_at', interval),
+                type=F('proposal__proposal_type'),
+                kind=F('to_status'),
+            )
+            .values('year', 'period', 'type', 'kind')
+            .annotate(total=Count('id'))
+            .order_by()
+        )
+        rows = {year: [] for year in years}
+        for row in submissions.union(events, all=True):
+            rows[row['year']].append((
+                row['period'].date().isoformat(),
+                row['type'],
+                OverviewService.SERIES_KINDS.get(row['kind'], row['kind']),
+                row['total'],
+            ))
+        return rows
+
+    @staticmethod
+    def get_series(interval, year_from, year_to):
+        years = list(range(year_from, year_to + 1))
+        generations = OverviewService.generations(years)
+        keys = {year: OverviewService.series_key(year, interval, generations[year]) for year in years}
+        cached = cache.get_many(keys.values())
+        rows = {year: cached[key] for year, key in keys.items() if key in cached}
+
+        missing = [year for year in years if year not in rows]
+        if missing:
+            computed = OverviewService.series_rows(missing, interval)
+            cache.set_many({keys[year]: computed[year] for year in missing}, timeout=settings.OVERVIEW_SERIES_TIMEOUT)
+            rows.update(computed)
+
+        periods = {}
+        for year in years:
+            for period, proposal_type, kind, total in rows[year]:
+                point = periods.setdefault(period, {
+                    'period': period,
+                    'submissions': {},
+                    'approvals': {},
+                    'revisions': {},
+                })
+                point[kind][proposal_type] = point[kind].get(proposal_type, 0) + total
+        return {
+            'interval': interval,
+            'year_from': year_from,
+            'year_to': year_to,
+            'series': [periods[period] for period in sorted(periods)],
+        }
     
 class YearConfigService:
 
@@ -78,3 +193,139 @@ class YearConfigService:
     def check_year_lock():
         config = YearConfig.objects.order_by('-created_at').first()
         return config.is_locked if config else False
+
+
+class ProposalFacetService:
+    FACET_FIELDS = ['tags', 'clusters', 'agendas', 'sdg_goals']
+    SDG_NUMBER = re.compile(r"\b(\d{1,2})\b")
+
+    # "SDG 4: Quality Education, SDG 17" -> [4, 17]
+    @staticmethod
+    def parse_sdg_goals(sdg_addressed):
+        if not sdg_addressed:
+            return []
+        goals = []
+        for match in ProposalFacetService.SDG_NUMBER.findall(str(sdg_addressed)):
+            number = int(match)
+            if 1 <= number <= 17 and number not in goals:
+                goals.append(number)
+        return goals
+
+
+class ProposalDiffService:
+    DOCUMENTS = {
+        "Program": (ProgramProposal, ProgramProposalHistory),
+        "Project": (ProjectProposal, ProjectProposalHistory),
+        "Activity": (ActivityProposal, ActivityProposalHistory),
+    }
+    # bookkeeping columns, and sdg_goals which is derived from sdg_addressed
+    SKIP_FIELDS = {"id", "proposal", "version", "created_at", "sdg_goals", "program_proposal", "project_proposal"}
+    CURRENT = "current"
+
+    @staticmethod
+    def section_fields(current_model, history_model):
+        history_fields = {f.name for f in history_model._meta.concrete_fields}
+        return [
+            f.name for f in current_model._meta.concrete_fields
+            if f.name in history_fields and f.name not in ProposalDiffService.SKIP_FIELDS
+        ]
+
+    @staticmethod
+    def load(proposal, version, fields):
+        current_model, history_model = ProposalDiffService.DOCUMENTS[proposal.proposal_type]
+        if version == ProposalDiffService.CURRENT:
+            document = current_model.objects.filter(proposal=proposal).values(*fields).first()
+        else:
+            document = history_model.objects.filter(proposal=proposal, version=version).values(*fields).first()
+        if document is None:
+            raise Http404(f"Version {version} of this proposal does not exist.")
+        return document
+
+    # history versions never change, so a diff between two of them is cached for good, anything
+    # involving the live document is recomputed
+    @staticmethod
+    def diff(proposal, from_version, to_version):
+        cache_key = f"proposal-diff:{proposal.id}:{from_version}:{to_version}"
+        cacheable = ProposalDiffService.CURRENT not in (from_version, to_version)
+        if cacheable:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        fields = ProposalDiffService.section_fields(*ProposalDiffService.DOCUMENTS[proposal.proposal_type])
+        old = ProposalDiffService.load(proposal, from_version, fields)
+        new = ProposalDiffService.load(proposal, to_version, fields)
+        data = {
+            "proposal_id": proposal.id,
+            "proposal_type": proposal.proposal_type,
+            "from_version": from_version,
+            "to_version": to_version,
+            "changed": diff_documents(old, new, fields),
+        }
+        if cacheable:
+            cache.set(cache_key, data, timeout=None)
+        return data
+
+
+class ProposalStatusService:
+    STATUS_LABELS = dict(Proposal.STATUS_CHOICES)
+
+    @staticmethod
+    def allowed_from(to_status):
+        return [status for status, targets in Proposal.STATUS_TRANSITIONS.items() if to_status in targets]
+
+    # programs bring their projects and activities, projects bring their activities
+    @staticmethod
+    def subtree_ids(proposal_ids):
+        ids = set(proposal_ids)
+        ids.update(ProjectProposal.objects.filter(program_proposal__proposal_id__in=ids).values_list("proposal_id", flat=True))
+        ids.update(ActivityProposal.objects.filter(
+            Q(project_proposal__proposal_id__in=ids) | Q(project_proposal__program_proposal__proposal_id__in=ids)
+        ).values_list("proposal_id", flat=True))
+        return ids
+
+    # moves every proposal that may legally reach to_status with one UPDATE ... WHERE status IN (...),
+    # the rest are reported back with their current status
+    @staticmethod
+    @transaction.atomic
+    def transition(proposal_ids, to_status, actor=None, subtree=False, notify=True, note=""):
+        if to_status not in ProposalStatusService.STATUS_LABELS:
+            raise ValueError(f"Unknown status {to_status}")
+        roots = set(proposal_ids)
+        ids = ProposalStatusService.subtree_ids(roots) if subtree else roots
+        from_statuses = ProposalStatusService.allowed_from(to_status)
+
+        rows = list(
+            Proposal.objects.select_for_update()
+            .filter(id__in=ids)
+            .order_by("id")
+            .values_list("id", "status", "user_id", "title")
+        )
+        moved = [row for row in rows if row[1] in from_statuses]
+        if moved:
+            Proposal.objects.filter(id__in=[row[0] for row in moved], status__in=from_statuses).update(status=to_status)
+            ProposalStatusEvent.objects.bulk_create([
+                ProposalStatusEvent(proposal_id=proposal_id, from_status=status, to_status=to_status, actor=actor, note=note)
+                for proposal_id, status, _, _ in moved
+            ])
+            StatusRollupService.schedule()
+            if to_status in OverviewService.SERIES_KINDS:
+                OverviewService.invalidate_series()
+
+        if notify:
+            label = ProposalStatusService.STATUS_LABELS[to_status]
+            messages = [
+                (user_id, f"The status of your proposal '{title}' changed to {label}.")
+                for proposal_id, _, user_id, title in moved
+                if proposal_id in roots
+            ]
+            if messages:
+                NotificationService.notify_many(messages)
+
+        found = {row[0] for row in rows}
+        return {
+            "status": to_status,
+            "updated": [row[0] for row in moved],
+            "skipped": {row[0]: row[1] for row in rows if row[1] not in from_statuses},
+            "missing": sorted(roots - found),
+        }
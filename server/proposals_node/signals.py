@@ -0,0 +1,25 @@
+from django.db.models.signals import pre_save, post_save
+from django.dispatch import receiver
+
+from program_proposal.models import ProgramProposal
+from project_proposal.models import ProjectProposal
+from activity_proposal.models import ActivityProposal
+from .models import Proposal
+from .services import ProposalFacetService, OverviewService
+
+# keep the parsed sdg list in sync with the free text sdg_addressed so it can be filtered by the gin index
+@receiver(pre_save, sender=ProgramProposal)
+@receiver(pre_save, sender=ProjectProposal)
+@receiver(pre_save, sender=ActivityProposal)
+def sync_sdg_goals(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if update_fields and "sdg_addressed" not in update_fields:
+        return
+    instance.sdg_goals = ProposalFacetService.parse_sdg_goals(instance.sdg_addressed)
+
+
+# a new submission changes the dashboard series of its year
+@receiver(post_save, sender=Proposal)
+def invalidate_overview_series(sender, instance, created, **kwargs):
+    if created:
+        OverviewService.invalidate_series(instance.created_at.year)
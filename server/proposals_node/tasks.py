@@ -0,0 +1,10 @@
+from django.contrib.auth.models import User
+from jobs.registry import task
+from .services import ProposalStatusService
+
+
+# status changes a request only triggers as a side effect, the job takes the row locks instead of the request
+@task("proposals_node.transition")
+def transition_proposals(proposal_ids, to_status, actor_id=None, notify=False):
+    actor = User.objects.filter(id=actor_id).first() if actor_id else None
+    ProposalStatusService.transition(proposal_ids, to_status, actor=actor, notify=notify)
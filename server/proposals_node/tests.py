@@ -1,3 +1,161 @@
 from django.test import TestCase
+from django.http import QueryDict
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from benchmarks.factory import SyntheticDataFactory, SCALES
+from jobs.services import JobService
+from notifications.models import Notification
+from program_proposal.models import ProgramProposal, ProgramProposalHistory
+from .models import Proposal, ProposalStatusEvent
+from .services import OverviewService, ProposalStatusService
+from .selectors import ProposalFacetSelectors
 
-# Create your tests here.
+class ProposalFacetTest(TestCase):
+
+    def create_program(self, user, title, tags, sdg_addressed):
+        proposal = Proposal.objects.create(user=user, title=title, proposal_type="Program")
+        ProgramProposal.objects.create(proposal=proposal, program_title=title, tags=tags, sdg_addressed=sdg_addressed)
+        return proposal
+
+    def test_filter_and_facet_counts(self):
+        user = User.objects.create(username="testuser")
+        literacy = self.create_program(user, "Literacy", ["education", "youth"], "SDG 4: Quality Education")
+        self.create_program(user, "Mangroves", ["environment"], "SDG 13, SDG 14")
+
+        params = QueryDict("tags=education&sdg=4")
+        proposals = ProposalFacetSelectors.filter_proposals(Proposal.objects.all(), "Program", params)
+        self.assertEqual(list(proposals), [literacy])
+
+        facets = ProposalFacetSelectors.facet_counts("Program", QueryDict(""))
+        self.assertEqual(facets["total"], 2)
+        self.assertEqual(facets["sdg_goals"], [{"value": "13", "count": 1}, {"value": "14", "count": 1}, {"value": "4", "count": 1}])
+        self.assertIn({"value": "education", "count": 1}, facets["tags"])
+
+        admin = User.objects.create(username="admin", is_staff=True)
+        client = APIClient()
+        client.force_authenticate(admin)
+        for url in ("/api/proposals-node/Program/", "/api/admin/proposals-node/Program/", "/api/admin/proposals-node/Program/facets/"):
+            self.assertEqual(client.get(url, {"year": "abc"}).status_code, 400)
+
+
+class ProposalDiffTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create(username="implementor")
+        self.proposal = Proposal.objects.create(user=user, title="Literacy", proposal_type="Program")
+        document = {
+            "program_title": "Literacy",
+            "rationale": "Reading skills of grade school learners are low.",
+            "tags": ["education", "youth"],
+            "expected_output_6ps": {"people": "40 learners", "places": "Iba"},
+        }
+        ProgramProposalHistory.objects.create(proposal=self.proposal, version=1, **document)
+        ProgramProposal.objects.create(proposal=self.proposal, **{
+            **document,
+            "rationale": "Reading skills of grade four learners are very low.",
+            "tags": ["education", "literacy", "youth"],
+            "expected_output_6ps": {"people": "60 learners", "places": "Iba"},
+        })
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+    def test_returns_only_changed_sections_with_fine_grained_diffs(self):
+        response = self.client.get(f"/api/proposal-diff/{self.proposal.id}/1/current/")
+
+        self.assertEqual(response.status_code, 200)
+        changed = response.json()["changed"]
+        self.assertEqual(set(changed), {"rationale", "tags", "expected_output_6ps"})
+        self.assertEqual(
+            [(h["old"], h["new"]) for h in changed["rationale"]["hunks"]],
+            [("school", "four"), ("", "very ")],
+        )
+        self.assertEqual(changed["tags"]["changes"], [{"op": "insert", "old_index": 1, "new_index": 1, "old": [], "new": ["literacy"]}])
+        self.assertEqual(list(changed["expected_output_6ps"]["fields"]), ["people"])
+
+    def test_history_pairs_are_cached(self):
+        ProgramProposalHistory.objects.create(proposal=self.proposal, version=2, program_title="Literacy 2")
+        url = f"/api/proposal-diff/{self.proposal.id}/1/2/"
+        self.assertEqual(self.client.get(url).status_code, 200)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertEqual(self.client.get(f"/api/proposal-diff/{self.proposal.id}/1/9/").status_code, 404)
+
+
+class ProposalStatusTransitionTest(TestCase):
+
+    def test_moves_whole_subtrees_in_one_update_and_skips_illegal_moves(self):
+        data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        program, other = data.programs
+        Proposal.objects.filter(id=program.proposal_id).update(status="for_approval")
+        Proposal.objects.filter(id=other.proposal_id).update(status="draft")
+        tree = ProposalStatusService.subtree_ids([program.proposal_id])
+        Proposal.objects.filter(id__in=tree - {program.proposal_id}).update(status="for_approval")
+
+        client = APIClient()
+        client.force_authenticate(data.admin)
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            response = client.post(
+                "/api/admin/proposals-status/",
+                {"proposal_ids": [program.proposal_id, other.proposal_id], "status": "approved", "subtree": True},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data["updated"]), tree)
+        self.assertEqual(response.data["skipped"][other.proposal_id], "draft")
+        self.assertEqual(len([q for q in queries.captured_queries if q["sql"].startswith("UPDATE")]), 1)
+        self.assertEqual(Proposal.objects.filter(id__in=tree, status="approved").count(), len(tree))
+        self.assertEqual(ProposalStatusEvent.objects.filter(to_status="approved").count(), len(tree))
+
+        JobService.run_pending()
+        self.assertEqual(Notification.objects.filter(message__contains="changed to Approved").count(), 1)
+
+
+class OverviewSeriesTest(TestCase):
+
+    def test_series_is_cached_per_year_and_dropped_on_new_submissions(self):
+        cache.clear()
+        admin = User.objects.create(username="admin", is_staff=True)
+        program = Proposal.objects.create(user=admin, title="Literacy", proposal_type="Program", status="for_approval")
+        Proposal.objects.create(user=admin, title="Reading camp", proposal_type="Activity")
+        ProposalStatusService.transition([program.id], "approved", notify=False)
+        year = program.created_at.year
+        url = f"/api/admin/overview-proposals/series/month/?year_from={year - 1}&year_to={year}"
+
+        client = APIClient()
+        client.force_authenticate(admin)
+        # the generations of the years, then the series itself
+        with self.assertNumQueries(2):
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        [point] = response.data["series"]
+        self.assertEqual(point["submissions"], {"Program": 1, "Activity": 1})
+        self.assertEqual(point["approvals"], {"Program": 1})
+
+        with self.assertNumQueries(1):
+            client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Proposal.objects.create(user=admin, title="Coastal cleanup", proposal_type="Program")
+        response = client.get(url)
+        self.assertEqual(response.data["series"][0]["submissions"]["Program"], 2)
+        self.assertEqual(client.get("/api/admin/overview-proposals/series/day/").status_code, 400)
+
+    def test_series_computed_before_a_commit_is_not_served_after_it(self):
+        cache.clear()
+        admin = User.objects.create(username="admin", is_staff=True)
+        year = timezone.localdate().year
+        stale = OverviewService.series_key(year, "month", OverviewService.generations([year])[year])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Proposal.objects.create(user=admin, title="Literacy", proposal_type="Program")
+        # a reader that started before the commit stores what it saw under the generation it read
+        cache.set(stale, [], timeout=None)
+
+        series = OverviewService.get_series("month", year, year)["series"]
+        self.assertEqual(series[0]["submissions"], {"Program": 1})
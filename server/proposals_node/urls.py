@@ -3,11 +3,16 @@ from rest_framework.urlpatterns import format_suffix_patterns
 from .views import (
     ProposalList,
     AdminProposalList,
+    AdminProposalFacetsView,
     AdminOverviewView,
+    AdminOverviewSeriesView,
     AdminYearConfigView,
     AdminSetImplementorProposalBudgetView,
     ReviewerApproveProposalView,
-    UpdateProposalProgressView
+    UpdateProposalProgressView,
+    ProposalDiffView,
+    AdminProposalStatusView,
+    AdminProposalDeleteView
 )
 
 urlpatterns = [
@@ -15,10 +20,15 @@ urlpatterns = [
     path("proposals-node/<str:proposal_type>/", ProposalList.as_view(), name="proposal-list"),
     path("implementor/update-progress/<int:proposal_id>/", UpdateProposalProgressView.as_view(), name="update-proposal-progress"),
     # reviewer access proposal
+    path("proposal-diff/<int:proposal_id>/<str:from_version>/<str:to_version>/", ProposalDiffView.as_view(), name="proposal-diff"),
     path("reviewer-approve/<int:proposal_id>/", ReviewerApproveProposalView.as_view(), name="reviewer-approve-proposal"),
     # admin access proposal
     path("admin/proposals-node/<str:proposal_type>/", AdminProposalList.as_view(), name="admin-proposal-list"),
+    path("admin/proposals-node/<str:proposal_type>/facets/", AdminProposalFacetsView.as_view(), name="admin-proposal-facets"),
+    path("admin/proposal-delete/<int:proposal_id>/", AdminProposalDeleteView.as_view(), name="admin-proposal-delete"),
+    path("admin/proposals-status/", AdminProposalStatusView.as_view(), name="admin-proposal-status"),
     path("admin/overview-proposals/<int:year>/", AdminOverviewView.as_view(), name="admin-overview"),
+    path("admin/overview-proposals/series/<str:interval>/", AdminOverviewSeriesView.as_view(), name="admin-overview-series"),
     path("admin/set-year-config/",  AdminYearConfigView.as_view(), name="admin-set-year-config"),
     path("admin/get-year-config/<int:year>/",  AdminYearConfigView.as_view(), name="admin-get-year-config"),
     path("admin/set-proposal-budget/<int:proposal_id>/<int:budget>/",  AdminSetImplementorProposalBudgetView.as_view(), name="admin-set-implementor-proposal-budget"),
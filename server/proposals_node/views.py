@@ -6,13 +6,18 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from .models import Proposal, YearConfig
 from .serializers import (
     ProposalSerializer,
     YearConfigSerializer
 )
-from .services import OverviewService
+from .services import OverviewService, ProposalDiffService, ProposalStatusService
+from .selectors import ProposalFacetSelectors
 from notifications.services import NotificationService
+from jobs.services import JobService
+from deletions.serializers import DeletionRequestSerializer
+from deletions.services import DeletionService
 # Create your views here.
 
 # IMPLEMENTOR VIEWS get list of proposal
@@ -20,10 +25,14 @@ class ProposalList(APIView):
     permission_classes = [IsAuthenticated]
     
     def get(self, request, proposal_type, format=None):
+        error = ProposalFacetSelectors.params_error(request.query_params)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
         proposals = Proposal.objects.filter(
             user=request.user,
             proposal_type=proposal_type
         )
+        proposals = ProposalFacetSelectors.filter_proposals(proposals, proposal_type, request.query_params)
 
         serializer = ProposalSerializer(proposals, many=True)
         return Response(serializer.data)
@@ -60,14 +69,50 @@ class AdminOverviewView(APIView):
         data = service.get_status_counts(year)
         return Response(data, status=status.HTTP_200_OK)
     
+# monthly or weekly submission, approval and revision counts per proposal type, ?year_from=2024&year_to=2026
+class AdminOverviewSeriesView(APIView):
+    permission_classes = [IsAdminUser]
+    MAX_YEARS = 10
+
+    def get(self, request, interval, format=None):
+        if interval not in OverviewService.SERIES_INTERVALS:
+            return Response({"error": "Invalid interval"}, status=status.HTTP_400_BAD_REQUEST)
+        current = timezone.localdate().year
+        try:
+            year_to = int(request.query_params.get("year_to", current))
+            year_from = int(request.query_params.get("year_from", year_to))
+        except ValueError:
+            return Response({"error": "Years must be numbers"}, status=status.HTTP_400_BAD_REQUEST)
+        if year_from > year_to or year_to - year_from >= self.MAX_YEARS:
+            return Response({"error": f"Send a range of 1 to {self.MAX_YEARS} years"}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = OverviewService.get_series(interval, year_from, year_to)
+        return Response(data, status=status.HTTP_200_OK)
+
 # get the list of proposal
 class AdminProposalList(APIView):
     permission_classes = [IsAdminUser]
     def get(self, request, proposal_type, format=None):
+        error = ProposalFacetSelectors.params_error(request.query_params)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
         proposals = Proposal.objects.filter(proposal_type=proposal_type)
+        proposals = ProposalFacetSelectors.filter_proposals(proposals, proposal_type, request.query_params)
         serializer = ProposalSerializer(proposals, many=True)
         return Response(serializer.data)
 
+# get the tags, clusters, agendas and sdg counts for the current filter
+class AdminProposalFacetsView(APIView):
+    permission_classes = [IsAdminUser]
+    def get(self, request, proposal_type, format=None):
+        if proposal_type not in ProposalFacetSelectors.DETAILS:
+            return Response({"error": "Invalid proposal type"}, status=status.HTTP_400_BAD_REQUEST)
+        error = ProposalFacetSelectors.params_error(request.query_params)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+        data = ProposalFacetSelectors.facet_counts(proposal_type, request.query_params)
+        return Response(data, status=status.HTTP_200_OK)
+
 # set and get year config view 
 class AdminYearConfigView(APIView):
     permission_classes = [IsAdminUser]
@@ -84,6 +129,9 @@ class AdminYearConfigView(APIView):
                 year=serializer.validated_data['year'],
                 defaults=serializer.validated_data
             )
+            # a locked past year is closed, its rows move to the archive in the background
+            if config.is_locked and config.year < timezone.localdate().year:
+                JobService.enqueue("archives.year", {"year": config.year})
             return Response(YearConfigSerializer(config).data)
 
         return Response(serializer.errors, status=400) 
@@ -116,12 +164,65 @@ class AdminSetImplementorProposalBudgetView(APIView):
             )
 
     
+# ADMIN VIEWS move many proposals, or whole program trees, to another status at once
+class AdminProposalStatusView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, format=None):
+        proposal_ids = request.data.get("proposal_ids")
+        to_status = request.data.get("status")
+        if not isinstance(proposal_ids, list) or not proposal_ids or not all(isinstance(i, int) for i in proposal_ids):
+            return Response({"proposal_ids": ["Send a non empty list of proposal ids."]}, status=status.HTTP_400_BAD_REQUEST)
+        if to_status not in Proposal.STATUS_TRANSITIONS:
+            return Response({"status": [f"Unknown status {to_status}."]}, status=status.HTTP_400_BAD_REQUEST)
+
+        result = ProposalStatusService.transition(
+            proposal_ids,
+            to_status,
+            actor=request.user,
+            subtree=bool(request.data.get("subtree", False)),
+            note=str(request.data.get("note", ""))[:255],
+        )
+        return Response(result, status=status.HTTP_200_OK)
+
+
 # REVIEWER VIEWS APPROVE PROPOSAL ==========================================================================
 class ReviewerApproveProposalView(APIView):
     permission_classes = [IsAuthenticated]
 
     def put(self, request, proposal_id, format=None):
         proposal = get_object_or_404(Proposal, id=proposal_id)
-        proposal.status = 'for_approval'
-        proposal.save()
-        return Response({"message": "Proposal approved successfully"},status=status.HTTP_200_OK)
\ No newline at end of file
+        result = ProposalStatusService.transition([proposal.id], 'for_approval', actor=request.user, notify=False)
+        if proposal.id in result["skipped"] and proposal.status != 'for_approval':
+            return Response({"message": f"A proposal in status {proposal.status} cannot be approved."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"message": "Proposal approved successfully"},status=status.HTTP_200_OK)
+
+
+# compare two versions of a program, project or activity, either side can be "current" ======================
+class ProposalDiffView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, proposal_id, from_version, to_version, format=None):
+        versions = []
+        for version in (from_version, to_version):
+            if version != ProposalDiffService.CURRENT and not version.isdigit():
+                return Response({"detail": 'Versions are history numbers or "current".'}, status=status.HTTP_400_BAD_REQUEST)
+            versions.append(version if version == ProposalDiffService.CURRENT else int(version))
+
+        proposal = get_object_or_404(Proposal, id=proposal_id)
+        data = ProposalDiffService.diff(proposal, *versions)
+        return Response(data, status=status.HTTP_200_OK)
+
+
+# delete a proposal with its projects and activities, hidden at once and removed by background jobs,
+# ?dry_run=true only returns the row counts
+class AdminProposalDeleteView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def delete(self, request, proposal_id, format=None):
+        proposal = get_object_or_404(Proposal, id=proposal_id)
+        if request.query_params.get("dry_run") == "true":
+            root_ids = DeletionService.root_ids("proposal", proposal)
+            return Response(DeletionService.dry_run("proposal", root_ids), status=status.HTTP_200_OK)
+        deletion = DeletionService.request("proposal", proposal, requested_by=request.user)
+        return Response(DeletionRequestSerializer(deletion).data, status=status.HTTP_202_ACCEPTED)
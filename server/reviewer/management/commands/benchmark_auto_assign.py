@@ -0,0 +1,89 @@
+import random
+import time
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from proposals_node.models import Proposal
+from users.models import UserProfile
+from reviewer.models import ProposalReviewer
+from reviewer.services import ReviewerAutoAssignmentService
+
+CAMPUSES = ["Iba", "Botolan", "Masinloc", "Candelaria", "Sta. Cruz", "Castillejos", "San Marcelino"]
+DEPARTMENTS = ["CCIT", "CTE", "CEA", "CBAPA", "CAS", "CON", "CIT"]
+
+
+class Command(BaseCommand):
+    help = "Seed reviewers and program proposals inside a rolled back transaction and time the auto assignment."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reviewers", type=int, default=1000)
+        parser.add_argument("--proposals", type=int, default=10000)
+        parser.add_argument("--implementors", type=int, default=500)
+        parser.add_argument("--per-proposal", type=int, default=2)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def create_users(self, prefix, count, role, rng):
+        users = User.objects.bulk_create(
+            [User(username=f"{prefix}-{i}", email=f"{prefix}-{i}@example.com") for i in range(count)],
+            batch_size=5000,
+        )
+        UserProfile.objects.bulk_create(
+            [
+                UserProfile(
+                    user=user,
+                    name=user.username,
+                    role=role,
+                    campus=rng.choice(CAMPUSES),
+                    department=rng.choice(DEPARTMENTS),
+                )
+                for user in users
+            ],
+            batch_size=5000,
+        )
+        return users
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        with transaction.atomic():
+            admin = User.objects.create(username="benchmark-admin", is_staff=True)
+            reviewers = self.create_users("benchmark-reviewer", options["reviewers"], "reviewer", rng)
+            implementors = self.create_users("benchmark-implementor", options["implementors"], "implementor", rng)
+            proposals = Proposal.objects.bulk_create(
+                [
+                    Proposal(user=rng.choice(implementors), title=f"Program {i}", proposal_type="Program")
+                    for i in range(options["proposals"])
+                ],
+                batch_size=5000,
+            )
+            # an uneven backlog of open and finished reviews to balance against
+            history = [
+                ProposalReviewer(
+                    proposal=proposal,
+                    reviewer=rng.choice(reviewers[: len(reviewers) // 5]),
+                    proposal_type="program",
+                    is_review=rng.random() < 0.5,
+                )
+                for proposal in rng.sample(proposals, len(proposals) // 10)
+            ]
+            ProposalReviewer.objects.bulk_create(history, ignore_conflicts=True, batch_size=5000)
+
+            proposal_ids = [p.id for p in proposals]
+            for dry_run in (True, False):
+                queries_before = len(connection.queries)
+                started = time.perf_counter()
+                result = ReviewerAutoAssignmentService.auto_assign(
+                    proposal_ids,
+                    assigned_by=admin,
+                    reviewers_per_proposal=options["per_proposal"],
+                    dry_run=dry_run,
+                )
+                elapsed = time.perf_counter() - started
+                loads = ReviewerAutoAssignmentService.load_reviewers()
+                open_counts = [r["open_assignments"] for r in loads]
+                self.stdout.write(
+                    f"dry_run={dry_run} assignments={len(result['assignments'])} "
+                    f"unassigned={len(result['unassigned'])} created={result['created']} "
+                    f"time={elapsed:.2f}s queries={len(connection.queries) - queries_before} "
+                    f"open min/max after={min(open_counts)}/{max(open_counts)}"
+                )
+            transaction.set_rollback(True)
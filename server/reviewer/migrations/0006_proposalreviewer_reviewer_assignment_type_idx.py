@@ -0,0 +1,20 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals_node', '0009_proposal_proposal_user_type_idx'),
+        ('reviewer', '0005_alter_proposalreviewer_proposal_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='proposalreviewer',
+            index=models.Index(fields=['reviewer', 'proposal_type'], name='reviewer_assignment_type_idx'),
+        ),
+    ]
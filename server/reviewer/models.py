@@ -36,6 +36,9 @@ class ProposalReviewer(models.Model):
         constraints = [
             models.UniqueConstraint(fields=['proposal', 'reviewer'], name='unique_proposal_reviewer')
         ]
+        indexes = [
+            models.Index(fields=['reviewer', 'proposal_type'], name='reviewer_assignment_type_idx'),
+        ]
 
         
     def __str__(self):
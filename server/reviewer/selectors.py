@@ -7,6 +7,7 @@ from program_proposal.models import ProgramProposal
 from project_proposal.models import ProjectProposal
 from activity_proposal.models import ActivityProposal
 
+# assignments of proposals waiting for the background deletion are left out like the proposals themselves
 class ReviewerProposalSelector:
     
     @staticmethod
@@ -43,7 +44,7 @@ class ReviewerProposalSelector:
         
     def get_reviewer_assigned_program_proposals(user):
         data = []
-        proposal_reviewers = ProposalReviewer.objects.filter(reviewer=user, proposal_type='program')
+        proposal_reviewers = ProposalReviewer.objects.filter(reviewer=user, proposal_type='program', proposal__deletion_pending=False)
         serializer = ReviewerProposalSerializer(proposal_reviewers, many=True)
         for s in serializer.data:
             data.append(ReviewerProposalSelector.proposal_mapper(s, proposal_type="program"))
@@ -53,6 +54,7 @@ class ReviewerProposalSelector:
         proposal_reviewers = ProposalReviewer.objects.filter(
             reviewer=user,
             proposal_type='project',
+            proposal__deletion_pending=False,
             proposal__project_details__program_proposal__id=program_id
         )
         serializer = ReviewerProposalSerializer(proposal_reviewers, many=True)
@@ -65,6 +67,7 @@ class ReviewerProposalSelector:
         proposal_reviewers = ProposalReviewer.objects.filter(
             reviewer=user,
             proposal_type='activity',
+            proposal__deletion_pending=False,
             proposal__activity_details__project_proposal__id=project_id
         )
         serializer = ReviewerProposalSerializer(proposal_reviewers, many=True)
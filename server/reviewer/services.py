@@ -1,5 +1,10 @@
+import heapq
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Count, Q
 from django.shortcuts import get_object_or_404
 from proposals_node.models import Proposal
+from proposals_node.services import ProposalStatusService
 from .models import ProposalReviewer
 
 class ProposalReviewerServices:
@@ -13,4 +18,190 @@ class ProposalReviewerServices:
             is_review=False
         ).exists()
 
-        return not not_reviewed_exists
\ No newline at end of file
+        return not not_reviewed_exists
+
+class ReviewerAutoAssignmentService:
+    # every past assignment with the same implementor counts as this many open assignments
+    PAIRING_PENALTY = 1
+
+    # all reviewers with their open program assignment count in ONE query, the project and activity
+    # rows copied from a program assignment are the same piece of work and are not counted again
+    @staticmethod
+    def load_reviewers():
+        return list(
+            User.objects
+            .filter(profile__role='reviewer', is_active=True)
+            .annotate(open_assignments=Count(
+                'assigned_proposals',
+                filter=Q(assigned_proposals__is_review=False, assigned_proposals__proposal_type='program')
+            ))
+            .values('id', 'profile__name', 'profile__campus', 'profile__department', 'open_assignments')
+        )
+
+    # how many times each reviewer was already paired with each implementor
+    @staticmethod
+    def load_pairings(implementor_ids):
+        rows = (
+            ProposalReviewer.objects
+            .filter(proposal__user__in=implementor_ids, proposal_type='program')
+            .values('reviewer_id', 'proposal__user_id')
+            .annotate(total=Count('id'))
+        )
+        return {(row['reviewer_id'], row['proposal__user_id']): row['total'] for row in rows}
+
+    @staticmethod
+    def load_proposals(proposal_ids):
+        return list(
+            Proposal.objects
+            .filter(id__in=proposal_ids, proposal_type='Program')
+            .values('id', 'title', 'user_id', 'user__profile__campus', 'user__profile__department')
+            .order_by('id')
+        )
+
+    @staticmethod
+    def load_existing(proposal_ids):
+        existing = {}
+        for proposal_id, reviewer_id in (
+            ProposalReviewer.objects
+            .filter(proposal_id__in=proposal_ids)
+            .values_list('proposal_id', 'reviewer_id')
+        ):
+            existing.setdefault(proposal_id, set()).add(reviewer_id)
+        return existing
+
+    @staticmethod
+    def has_conflict(reviewer, proposal, avoid_same_campus=False):
+        if reviewer['id'] == proposal['user_id']:
+            return True
+        same_campus = (
+            reviewer['profile__campus'] is not None
+            and reviewer['profile__campus'] == proposal['user__profile__campus']
+        )
+        if avoid_same_campus:
+            return same_campus
+        return same_campus and reviewer['profile__department'] == proposal['user__profile__department']
+
+    # greedy balancing: always give the proposal to the least loaded eligible reviewers.
+    # the heap is ordered by load and penalties are never negative,
+    # so the scan stops as soon as the load alone cannot beat the current picks
+    @staticmethod
+    def plan(proposals, reviewers, pairings, existing, reviewers_per_proposal=1, avoid_same_campus=False):
+        reviewers_by_id = {r['id']: r for r in reviewers}
+        pairings = dict(pairings)
+        load = {r['id']: r['open_assignments'] for r in reviewers}
+        heap = [(load[r['id']], r['id']) for r in reviewers]
+        heapq.heapify(heap)
+
+        assignments = []
+        unassigned = []
+        for proposal in proposals:
+            already = existing.get(proposal['id'], set())
+            needed = reviewers_per_proposal - len(already)
+            if needed <= 0:
+                continue
+
+            popped = []
+            picks = []
+            while heap:
+                reviewer_load, reviewer_id = heap[0]
+                if len(picks) == needed and reviewer_load >= picks[-1][0]:
+                    break
+                heapq.heappop(heap)
+                popped.append((reviewer_load, reviewer_id))
+
+                reviewer = reviewers_by_id[reviewer_id]
+                if reviewer_id in already or ReviewerAutoAssignmentService.has_conflict(reviewer, proposal, avoid_same_campus):
+                    continue
+                past = pairings.get((reviewer_id, proposal['user_id']), 0)
+                picks.append((reviewer_load + past * ReviewerAutoAssignmentService.PAIRING_PENALTY, reviewer_id, past))
+                picks.sort()
+                del picks[needed:]
+
+            for score, reviewer_id, past in picks:
+                load[reviewer_id] += 1
+                pairings[(reviewer_id, proposal['user_id'])] = past + 1
+                assignments.append({
+                    "proposal": proposal['id'],
+                    "proposal_title": proposal['title'],
+                    "reviewer": reviewer_id,
+                    "reviewer_name": reviewers_by_id[reviewer_id]['profile__name'],
+                    "open_assignments": load[reviewer_id],
+                    "past_pairings": past,
+                })
+            if len(picks) < needed:
+                unassigned.append(proposal['id'])
+
+            picked = {reviewer_id for _, reviewer_id, _ in picks}
+            for reviewer_load, reviewer_id in popped:
+                heapq.heappush(heap, (load[reviewer_id] if reviewer_id in picked else reviewer_load, reviewer_id))
+
+        return assignments, unassigned
+
+    # write the planned program assignments, their project and activity children, statuses and notifications in bulk
+    @staticmethod
+    @transaction.atomic
+    def apply(assignments, assigned_by):
+        from notifications.models import Notification
+        from project_proposal.models import ProjectProposal
+        from activity_proposal.models import ActivityProposal
+
+        program_ids = {a['proposal'] for a in assignments}
+        projects_by_program = {}
+        for project_proposal_id, program_proposal_id in (
+            ProjectProposal.objects
+            .filter(program_proposal__proposal_id__in=program_ids)
+            .values_list('proposal_id', 'program_proposal__proposal_id')
+        ):
+            projects_by_program.setdefault(program_proposal_id, []).append(project_proposal_id)
+        activities_by_program = {}
+        for activity_proposal_id, program_proposal_id in (
+            ActivityProposal.objects
+            .filter(project_proposal__program_proposal__proposal_id__in=program_ids)
+            .values_list('proposal_id', 'project_proposal__program_proposal__proposal_id')
+        ):
+            activities_by_program.setdefault(program_proposal_id, []).append(activity_proposal_id)
+
+        rows = []
+        notifications = []
+        for a in assignments:
+            rows.append(ProposalReviewer(proposal_id=a['proposal'], reviewer_id=a['reviewer'], proposal_type='program', assigned_by=assigned_by))
+            for project_id in projects_by_program.get(a['proposal'], []):
+                rows.append(ProposalReviewer(proposal_id=project_id, reviewer_id=a['reviewer'], proposal_type='project', assigned_by=assigned_by))
+            for activity_id in activities_by_program.get(a['proposal'], []):
+                rows.append(ProposalReviewer(proposal_id=activity_id, reviewer_id=a['reviewer'], proposal_type='activity', assigned_by=assigned_by))
+            notifications.append(Notification(
+                user_id=a['reviewer'],
+                message=f"You have been assigned to review proposal {a['proposal_title']}",
+            ))
+
+        ProposalReviewer.objects.bulk_create(rows, ignore_conflicts=True, batch_size=1000)
+        ProposalStatusService.transition(program_ids, "for_review", actor=assigned_by, notify=False)
+        Notification.objects.bulk_create(notifications, batch_size=1000)
+        return len(rows)
+
+    @staticmethod
+    def auto_assign(proposal_ids, assigned_by, reviewers_per_proposal=1, dry_run=True, avoid_same_campus=False):
+        proposals = ReviewerAutoAssignmentService.load_proposals(proposal_ids)
+        reviewers = ReviewerAutoAssignmentService.load_reviewers()
+        pairings = ReviewerAutoAssignmentService.load_pairings({p['user_id'] for p in proposals})
+        existing = ReviewerAutoAssignmentService.load_existing([p['id'] for p in proposals])
+
+        assignments, unassigned = ReviewerAutoAssignmentService.plan(
+            proposals,
+            reviewers,
+            pairings,
+            existing,
+            reviewers_per_proposal=reviewers_per_proposal,
+            avoid_same_campus=avoid_same_campus,
+        )
+        found = {p['id'] for p in proposals}
+        result = {
+            "dry_run": dry_run,
+            "assignments": assignments,
+            "unassigned": unassigned,
+            "skipped": [pid for pid in proposal_ids if pid not in found],
+            "created": 0,
+        }
+        if not dry_run and assignments:
+            result["created"] = ReviewerAutoAssignmentService.apply(assignments, assigned_by)
+        return result
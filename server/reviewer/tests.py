@@ -1,3 +1,44 @@
 from django.test import TestCase
+from django.contrib.auth.models import User
+from users.models import UserProfile
+from proposals_node.models import Proposal
+from .models import ProposalReviewer
+from .services import ReviewerAutoAssignmentService
 
-# Create your tests here.
+class ReviewerAutoAssignmentTest(TestCase):
+
+    def create_user(self, username, role, campus="Iba", department="CCIT"):
+        user = User.objects.create(username=username)
+        UserProfile.objects.create(user=user, name=username, role=role, campus=campus, department=department)
+        return user
+
+    def test_balances_and_skips_conflicts(self):
+        admin = User.objects.create(username="admin", is_staff=True)
+        implementor = self.create_user("implementor", "implementor")
+        same_department = self.create_user("same", "reviewer")
+        busy = self.create_user("busy", "reviewer", campus="Botolan")
+        free = self.create_user("free", "reviewer", campus="Masinloc")
+
+        older = Proposal.objects.create(user=implementor, title="Older", proposal_type="Program")
+        ProposalReviewer.objects.create(proposal=older, reviewer=busy, proposal_type="program")
+        first = Proposal.objects.create(user=implementor, title="First", proposal_type="Program")
+        second = Proposal.objects.create(user=implementor, title="Second", proposal_type="Program")
+
+        result = ReviewerAutoAssignmentService.auto_assign([first.id, second.id], assigned_by=admin, dry_run=True)
+        self.assertEqual([(a["proposal"], a["reviewer"]) for a in result["assignments"]], [(first.id, free.id), (second.id, busy.id)])
+        self.assertFalse(ProposalReviewer.objects.filter(proposal__in=[first, second]).exists())
+
+        result = ReviewerAutoAssignmentService.auto_assign([first.id, second.id], assigned_by=admin, dry_run=False)
+        self.assertEqual(result["created"], 2)
+        self.assertFalse(ProposalReviewer.objects.filter(reviewer=same_department).exists())
+        self.assertEqual(Proposal.objects.get(id=first.id).status, "for_review")
+
+    def test_open_assignments_count_programs_only(self):
+        implementor = self.create_user("implementor", "implementor")
+        reviewer = self.create_user("reviewer", "reviewer", campus="Botolan")
+        for proposal_type in ("program", "project", "activity"):
+            proposal = Proposal.objects.create(user=implementor, title=proposal_type, proposal_type=proposal_type.title())
+            ProposalReviewer.objects.create(proposal=proposal, reviewer=reviewer, proposal_type=proposal_type)
+
+        [row] = ReviewerAutoAssignmentService.load_reviewers()
+        self.assertEqual(row["open_assignments"], 1)
@@ -5,6 +5,8 @@ from .views import (
     GetAssignedReviewerView,
     UnassignReviewerView,
     ReviewerListView,
+    ReviewerWorkloadView,
+    AutoAssignReviewerView,
     MyAssignedProgramProposalsView,
     MyAssignedProjectProposalsView,
     MyAssignedActivityProposalsView,
@@ -18,6 +20,8 @@ urlpatterns = [
     path('assigned-reviewer/<int:proposal>/', GetAssignedReviewerView.as_view(), name='assigned-reviewer-detail'),
     path('unassign-reviewer/<int:pk>/', UnassignReviewerView.as_view(), name='unassign-reviewer'),
     path('reviewers/', ReviewerListView.as_view(), name='reviewer-list'),
+    path('reviewers/workload/', ReviewerWorkloadView.as_view(), name='reviewer-workload'),
+    path('auto-assign-reviewer/', AutoAssignReviewerView.as_view(), name='auto-assign-reviewer'),
     
     # reviewer get the proposal 
     path('reviewer-proposals/program/', MyAssignedProgramProposalsView.as_view(), name='reviewer-program-proposal-list'),
@@ -6,7 +6,8 @@ from rest_framework import status, permissions
 from rest_framework.exceptions import PermissionDenied
 from django.shortcuts import get_object_or_404
 from proposals_node.models import Proposal
-from notifications.models import Notification
+from proposals_node.services import ProposalStatusService
+from notifications.services import NotificationService
 
 # app
 from django.contrib.auth.models import User
@@ -18,13 +19,14 @@ from .serializers import (
     ReviewerAssignedProposalSerializer   
 )
 from .selectors import ReviewerProposalSelector
+from .services import ReviewerAutoAssignmentService
 from proposals_node.models import Proposal
 # ====================================================================================================
 # ADMIN VIEWS assign reviewer and get the assigned 
 class AssignReviewerView(APIView):
     permission_classes = [IsAdminUser]
     def get(self, request):
-        proposal_reviewers = ProposalReviewer.objects.filter(assigned_by=request.user)
+        proposal_reviewers = ProposalReviewer.objects.filter(assigned_by=request.user, proposal__deletion_pending=False)
         serializer = ReviewerSerializer(proposal_reviewers, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -37,12 +39,11 @@ class AssignReviewerView(APIView):
         proposal = get_object_or_404(Proposal, id=request.data.get('proposal')) 
         if serializer.is_valid():
             reviewer = serializer.save()
-            # use reviewer.proposal instead of querying again
-            reviewer.proposal.status = "for_review"
-            reviewer.proposal.save()
-            Notification.objects.create(
-                user=user,
-                message=f'You have been assigned to review proposal {proposal.title}',
+            ProposalStatusService.transition([reviewer.proposal_id], "for_review", actor=request.user, notify=False)
+            NotificationService.notify_users(
+                [user.id],
+                f'You have been assigned to review proposal {proposal.title}',
+                idempotency_key=f"reviewer-assigned-{reviewer.id}",
             )
             return Response(
                 {
@@ -123,6 +124,45 @@ class ReviewerListView(APIView):
         serializer = UserSerializer(reviewers, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
     
+# get all reviewers with their open assignments
+class ReviewerWorkloadView(APIView):
+    permission_classes = [IsAdminUser]
+    def get(self, request):
+        reviewers = ReviewerAutoAssignmentService.load_reviewers()
+        data = [
+            {
+                "id": r['id'],
+                "name": r['profile__name'],
+                "campus": r['profile__campus'],
+                "department": r['profile__department'],
+                "open_assignments": r['open_assignments'],
+            }
+            for r in sorted(reviewers, key=lambda r: (r['open_assignments'], r['id']))
+        ]
+        return Response(data, status=status.HTTP_200_OK)
+
+# propose or apply balanced reviewer assignments for a batch of program proposals
+class AutoAssignReviewerView(APIView):
+    permission_classes = [IsAdminUser]
+    def post(self, request):
+        proposal_ids = request.data.get('proposals') or []
+        if not isinstance(proposal_ids, list) or not proposal_ids:
+            return Response({"error": "proposals must be a non empty list of proposal ids"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            proposal_ids = [int(pid) for pid in proposal_ids]
+            reviewers_per_proposal = int(request.data.get('reviewers_per_proposal', 1))
+        except (TypeError, ValueError):
+            return Response({"error": "proposals and reviewers_per_proposal must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+
+        result = ReviewerAutoAssignmentService.auto_assign(
+            proposal_ids,
+            assigned_by=request.user,
+            reviewers_per_proposal=max(reviewers_per_proposal, 1),
+            dry_run=request.data.get('dry_run', True) not in (False, "false", "0", 0),
+            avoid_same_campus=request.data.get('avoid_same_campus', False) in (True, "true", "1", 1),
+        )
+        return Response(result, status=status.HTTP_200_OK if result['dry_run'] else status.HTTP_201_CREATED)
+    
 # ====================================================================================================
 # REVIEWER VIEWS get the assigned proposal for the reviewer
 class MyAssignedProgramProposalsView(APIView):
@@ -147,6 +187,7 @@ class AssignedReviewerProposalView(APIView):
     def get(self, request, proposal_id, format=None):
         proposals = ProposalReviewer.objects.filter(
             proposal_id=proposal_id,
+            proposal__deletion_pending=False,
         )
         serializer = ReviewerAssignedProposalSerializer(proposals, many=True)
         return Response(serializer.data)
@@ -1,7 +1,9 @@
 from django.contrib import admin
 from .models import ProposalReview
-from .models import ProposalReviewHistory
+from .models import ReviewComment
+from .models import ReviewSubmissionKey
 
 admin.site.register(ProposalReview)
-admin.site.register(ProposalReviewHistory)
+admin.site.register(ReviewComment)
+admin.site.register(ReviewSubmissionKey)
 # Register your models here.
@@ -1,43 +1,24 @@
+from .models import ReviewComment
+
+
 class ProposalReviewMapper:
-    REVIEW_FIELD_MAP = {
-        "profile": "profile_feedback",
-        "implementing_agency": "implementing_agency_feedback",
-        "extension_site": "extension_site_feedback",
-        "tagging_cluster_extension": "tagging_cluster_extension_feedback",
-        "sdg_academic_program": "sdg_academic_program_feedback",
-        "rationale": "rationale_feedback",
-        "significance": "significance_feedback",
-        "general_objectives": "general_objectives_feedback",
-        "specific_objectives": "specific_objectives_feedback",
-        "methodology": "methodology_feedback",
-        "expected_output_6ps": "expected_output_feedback",
-        "sustainability_plan": "sustainability_plan_feedback",
-        "org_and_staffing": "org_staffing_feedback",
-        "work_plan": "work_plan_feedback",
-        "plan_of_activity": "plan_of_activity_feedback",
-        "objectives": "objectives_feedback",
-        "budget": "budget_requirements_feedback",
-    }
 
+    # comments come in as (section, reviewer_name, comment) rows already ordered by section
     @staticmethod
-    def get_review_per_docs_mapper(proposal_reviews_queryset):
-        review_data = {key: [] for key in ProposalReviewMapper.REVIEW_FIELD_MAP.keys()}
-
-        for r in proposal_reviews_queryset:
-            reviewer_name = r.proposal_reviewer.reviewer.profile.name
+    def get_review_per_docs_mapper(comments):
+        review_data = {section: [] for section in ReviewComment.SECTION_FIELDS}
 
-            for section, field_name in ProposalReviewMapper.REVIEW_FIELD_MAP.items():
-                if hasattr(r, field_name):
-                    review_data[section].append({
-                        "reviewer_name": reviewer_name,
-                        "comment": getattr(r, field_name)
-                    })
+        for section, reviewer_name, comment in comments:
+            review_data[section].append({
+                "reviewer_name": reviewer_name,
+                "comment": comment
+            })
 
         return review_data
     
     @staticmethod
-    def get_review_per_docs_program_mapper(program_proposal, proposal_reviews_queryset):
-        reviews = ProposalReviewMapper.get_review_per_docs_mapper(proposal_reviews_queryset)
+    def get_review_per_docs_program_mapper(program_proposal, review_comments):
+        reviews = ProposalReviewMapper.get_review_per_docs_mapper(review_comments)
         return {
             "program_title": program_proposal.program_title,
             
@@ -122,8 +103,8 @@ class ProposalReviewMapper:
        
         
     @staticmethod
-    def get_review_per_docs_project_mapper(project_proposal, proposal_reviews_queryset):
-        reviews = ProposalReviewMapper.get_review_per_docs_mapper(proposal_reviews_queryset)
+    def get_review_per_docs_project_mapper(project_proposal, review_comments):
+        reviews = ProposalReviewMapper.get_review_per_docs_mapper(review_comments)
         return {
             "project_title": project_proposal.project_title,
 
@@ -210,8 +191,8 @@ class ProposalReviewMapper:
         }
     
     @staticmethod
-    def get_review_per_docs_activity_mapper(activity_proposal, proposal_reviews_queryset):
-        reviews = ProposalReviewMapper.get_review_per_docs_mapper(proposal_reviews_queryset)
+    def get_review_per_docs_activity_mapper(activity_proposal, review_comments):
+        reviews = ProposalReviewMapper.get_review_per_docs_mapper(review_comments)
 
         return {
             "activity_title": activity_proposal.activity_title,
@@ -261,7 +242,7 @@ class ProposalReviewMapper:
 
             "objectives": {
                 "content": activity_proposal.objectives_of_activity,
-                "reviews": reviews["general_objectives"]
+                "reviews": reviews["objectives"]
             },
 
             "methodology": {
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals_node', '0009_proposal_proposal_user_type_idx'),
+        ('reviewer', '0006_proposalreviewer_reviewer_assignment_type_idx'),
+        ('reviews', '0010_alter_proposalreview_unique_together'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='proposalreviewhistory',
+            index=models.Index(fields=['proposal_node', 'review_round'], name='review_history_round_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0012_reviewsubmissionkey'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewComment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(choices=[('profile', 'Profile'), ('implementing_agency', 'Implementing Agency'), ('extension_site', 'Extension Site'), ('tagging_cluster_extension', 'Tagging Cluster Extension'), ('sdg_academic_program', 'Sdg Academic Program'), ('rationale', 'Rationale'), ('significance', 'Significance'), ('objectives', 'Objectives'), ('general_objectives', 'General Objectives'), ('specific_objectives', 'Specific Objectives'), ('methodology', 'Methodology'), ('expected_output_6ps', 'Expected Output 6Ps'), ('sustainability_plan', 'Sustainability Plan'), ('org_and_staffing', 'Org And Staffing'), ('work_plan', 'Work Plan'), ('plan_of_activity', 'Plan Of Activity'), ('budget', 'Budget')], max_length=40)),
+                ('review_round', models.PositiveIntegerField(default=0)),
+                ('comment', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('review', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='reviews.proposalreview')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('review', 'section', 'review_round'), name='unique_review_comment')],
+            },
+        ),
+    ]
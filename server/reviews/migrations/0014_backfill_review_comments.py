@@ -0,0 +1,121 @@
+from django.db import migrations
+
+# frozen copy of ReviewComment.SECTION_FIELDS, plan_of_activity never had a column
+SECTION_FIELDS = {
+    "profile": "profile_feedback",
+    "implementing_agency": "implementing_agency_feedback",
+    "extension_site": "extension_site_feedback",
+    "tagging_cluster_extension": "tagging_cluster_extension_feedback",
+    "sdg_academic_program": "sdg_academic_program_feedback",
+    "rationale": "rationale_feedback",
+    "significance": "significance_feedback",
+    "objectives": "objectives_feedback",
+    "general_objectives": "general_objectives_feedback",
+    "specific_objectives": "specific_objectives_feedback",
+    "methodology": "methodology_feedback",
+    "expected_output_6ps": "expected_output_feedback",
+    "sustainability_plan": "sustainability_plan_feedback",
+    "org_and_staffing": "org_staffing_feedback",
+    "work_plan": "work_plan_feedback",
+    "budget": "budget_requirements_feedback",
+}
+
+
+def comments_for(ReviewComment, review_id, row, review_round):
+    return [
+        ReviewComment(review_id=review_id, section=section, review_round=review_round, comment=getattr(row, field))
+        for section, field in SECTION_FIELDS.items()
+        if getattr(row, field, None)
+    ]
+
+
+def backfill_comments(apps, schema_editor):
+    ProposalReview = apps.get_model("reviews", "ProposalReview")
+    ProposalReviewHistory = apps.get_model("reviews", "ProposalReviewHistory")
+    ReviewComment = apps.get_model("reviews", "ReviewComment")
+    ProposalReviewer = apps.get_model("reviewer", "ProposalReviewer")
+
+    review_ids = {}
+    comments = []
+    for review in ProposalReview.objects.all().iterator(chunk_size=1000):
+        review_ids[(review.proposal_node_id, review.proposal_reviewer_id)] = review.id
+        comments += comments_for(ReviewComment, review.id, review, 0)
+        if len(comments) >= 5000:
+            ReviewComment.objects.bulk_create(comments, ignore_conflicts=True)
+            comments = []
+
+    assignments = {}
+    assignment_types = {}
+    for assignment_id, proposal_id, proposal_type in ProposalReviewer.objects.values_list("id", "proposal_id", "proposal_type"):
+        assignments.setdefault(proposal_id, []).append(assignment_id)
+        assignment_types[assignment_id] = proposal_type
+
+    # history rows hang off the review of the same reviewer and proposal, older duplicated rounds collapse
+    # into the first copy. rows from before the history had a reviewer belong to the only assignment of
+    # their proposal, a reviewer whose current review is gone gets an empty review to hold the history
+    unresolved = 0
+    for history in ProposalReviewHistory.objects.order_by("id").iterator(chunk_size=1000):
+        assignment_id = history.proposal_reviewer_id
+        if assignment_id is None:
+            candidates = assignments.get(history.proposal_node_id, [])
+            if len(candidates) != 1:
+                unresolved += 1
+                continue
+            assignment_id = candidates[0]
+
+        key = (history.proposal_node_id, assignment_id)
+        if key not in review_ids:
+            review_ids[key] = ProposalReview.objects.create(
+                proposal_reviewer_id=assignment_id,
+                proposal_node_id=history.proposal_node_id,
+                proposal_type=assignment_types[assignment_id],
+                review_round=history.review_round,
+            ).id
+        comments += comments_for(ReviewComment, review_ids[key], history, history.review_round)
+        if len(comments) >= 5000:
+            ReviewComment.objects.bulk_create(comments, ignore_conflicts=True)
+            comments = []
+    ReviewComment.objects.bulk_create(comments, ignore_conflicts=True)
+
+    # 0015 drops the history table, feedback that cannot be placed would be lost for good
+    if unresolved:
+        raise RuntimeError(
+            f"{unresolved} review history rows have no reviewer and their proposal does not have exactly one "
+            "assignment, set proposal_reviewer on them before migrating"
+        )
+
+
+def restore_columns(apps, schema_editor):
+    ProposalReview = apps.get_model("reviews", "ProposalReview")
+    ProposalReviewHistory = apps.get_model("reviews", "ProposalReviewHistory")
+    ReviewComment = apps.get_model("reviews", "ReviewComment")
+
+    reviews = {review.id: review for review in ProposalReview.objects.all()}
+    history = {}
+    for comment in ReviewComment.objects.exclude(section="plan_of_activity").iterator(chunk_size=1000):
+        review = reviews[comment.review_id]
+        if comment.review_round == 0:
+            setattr(review, SECTION_FIELDS[comment.section], comment.comment)
+            continue
+        key = (review.id, comment.review_round)
+        if key not in history:
+            history[key] = ProposalReviewHistory(
+                proposal_reviewer_id=review.proposal_reviewer_id, proposal_node_id=review.proposal_node_id, review_round=comment.review_round
+            )
+        setattr(history[key], SECTION_FIELDS[comment.section], comment.comment)
+
+    ProposalReview.objects.bulk_update(reviews.values(), list(SECTION_FIELDS.values()), batch_size=1000)
+    ProposalReviewHistory.objects.all().delete()
+    ProposalReviewHistory.objects.bulk_create(history.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviewer', '0005_alter_proposalreviewer_proposal_type'),
+        ('reviews', '0013_reviewcomment'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_comments, restore_columns),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0014_backfill_review_comments'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='budget_requirements_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='expected_output_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='extension_site_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='general_objectives_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='implementing_agency_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='methodology_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='objectives_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='org_staffing_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='profile_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='rationale_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='sdg_academic_program_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='significance_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='specific_objectives_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='sustainability_plan_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='tagging_cluster_extension_feedback',
+        ),
+        migrations.RemoveField(
+            model_name='proposalreview',
+            name='work_plan_feedback',
+        ),
+        migrations.DeleteModel(
+            name='ProposalReviewHistory',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0015_drop_feedback_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reviewcomment',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
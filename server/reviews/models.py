@@ -1,6 +1,7 @@
 from django.db import models
 from reviewer.models import ProposalReviewer
 from proposals_node.models import Proposal
+from django.contrib.auth.models import User
 
 class ProposalReview(models.Model):
     class Meta:
@@ -49,65 +50,71 @@ class ProposalReview(models.Model):
         blank=True
     )
 
-    # ---------- Section Feedback ----------
-    profile_feedback = models.TextField(null=True, blank=True)
-    implementing_agency_feedback = models.TextField(null=True, blank=True)
-    extension_site_feedback = models.TextField(null=True, blank=True)
-    tagging_cluster_extension_feedback = models.TextField(null=True, blank=True)
-    sdg_academic_program_feedback = models.TextField(null=True, blank=True)
-    rationale_feedback = models.TextField(null=True, blank=True)
-    significance_feedback = models.TextField(null=True, blank=True)
-    objectives_feedback = models.TextField(null=True, blank=True)
-    general_objectives_feedback = models.TextField(null=True, blank=True)
-    specific_objectives_feedback = models.TextField(null=True, blank=True)
-    methodology_feedback = models.TextField(null=True, blank=True)
-    expected_output_feedback = models.TextField(null=True, blank=True)
-    sustainability_plan_feedback = models.TextField(null=True, blank=True)
-    org_staffing_feedback = models.TextField(null=True, blank=True)
-    work_plan_feedback = models.TextField(null=True, blank=True)
-    budget_requirements_feedback = models.TextField(null=True, blank=True)
+    # section feedback lives in ReviewComment
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return f"Review {self.id} by reviewer {self.proposal_reviewer.id} for proposal {self.proposal_node.id}"
     
 
-class ProposalReviewHistory(models.Model):
-    
-    proposal_reviewer = models.ForeignKey(
-        ProposalReviewer,
-        on_delete=models.CASCADE,
-        related_name="proposal_reviewer_history",
-        null=True, blank=True
-    )
-    
-    proposal_node = models.ForeignKey(
-        Proposal,
-        on_delete=models.CASCADE,
-        related_name="review_history"
-    )
+# the stored response of a review submission, replayed when a client retries with the same Idempotency-Key
+class ReviewSubmissionKey(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="review_submission_keys")
+    key = models.CharField(max_length=255)
+    proposal_reviewer = models.ForeignKey(ProposalReviewer, on_delete=models.CASCADE, related_name="submission_keys")
+    status_code = models.PositiveSmallIntegerField()
+    response = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
 
-    review_round = models.PositiveIntegerField(default=1)
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='unique_review_submission_key')
+        ]
+
+    def __str__(self):
+        return f"{self.key} - {self.user}"
 
-    # copy all feedback fields
-    profile_feedback = models.TextField(null=True, blank=True)
-    implementing_agency_feedback = models.TextField(null=True, blank=True)
-    extension_site_feedback = models.TextField(null=True, blank=True)
-    tagging_cluster_extension_feedback = models.TextField(null=True, blank=True)
-    sdg_academic_program_feedback = models.TextField(null=True, blank=True)
-    rationale_feedback = models.TextField(null=True, blank=True)
-    significance_feedback = models.TextField(null=True, blank=True)
-    objectives_feedback = models.TextField(null=True, blank=True)
-    general_objectives_feedback = models.TextField(null=True, blank=True)
-    specific_objectives_feedback = models.TextField(null=True, blank=True)
-    methodology_feedback = models.TextField(null=True, blank=True)
-    expected_output_feedback = models.TextField(null=True, blank=True)
-    sustainability_plan_feedback = models.TextField(null=True, blank=True)
-    org_staffing_feedback = models.TextField(null=True, blank=True)
-    work_plan_feedback = models.TextField(null=True, blank=True)
-    budget_requirements_feedback = models.TextField(null=True, blank=True)
 
+# one reviewer comment on one section of the document, review_round 0 holds the comments being
+# written now and older rounds keep the number they had when the implementor revised the proposal
+class ReviewComment(models.Model):
+    CURRENT_ROUND = 0
+
+    # section -> the *_feedback name the review api reads and writes
+    SECTION_FIELDS = {
+        "profile": "profile_feedback",
+        "implementing_agency": "implementing_agency_feedback",
+        "extension_site": "extension_site_feedback",
+        "tagging_cluster_extension": "tagging_cluster_extension_feedback",
+        "sdg_academic_program": "sdg_academic_program_feedback",
+        "rationale": "rationale_feedback",
+        "significance": "significance_feedback",
+        "objectives": "objectives_feedback",
+        "general_objectives": "general_objectives_feedback",
+        "specific_objectives": "specific_objectives_feedback",
+        "methodology": "methodology_feedback",
+        "expected_output_6ps": "expected_output_feedback",
+        "sustainability_plan": "sustainability_plan_feedback",
+        "org_and_staffing": "org_staffing_feedback",
+        "work_plan": "work_plan_feedback",
+        "plan_of_activity": "plan_of_activity_feedback",
+        "budget": "budget_requirements_feedback",
+    }
+    SECTION_CHOICES = [(section, section.replace("_", " ").title()) for section in SECTION_FIELDS]
+
+    review = models.ForeignKey(ProposalReview, on_delete=models.CASCADE, related_name="comments")
+    section = models.CharField(max_length=40, choices=SECTION_CHOICES)
+    review_round = models.PositiveIntegerField(default=CURRENT_ROUND)
+    comment = models.TextField()
+    # bumped on every change, autosave only writes when the client still holds the current version
+    version = models.PositiveIntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['review', 'section', 'review_round'], name='unique_review_comment')
+        ]
 
     def __str__(self):
-        return f"History of Review {self.proposal_node.title} by reviewer {self.proposal_reviewer.id} for proposal {self.proposal_node.id} - Round {self.review_round} "
\ No newline at end of file
+        return f"{self.section} comment on review {self.review_id} - Round {self.review_round}"
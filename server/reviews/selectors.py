@@ -1,6 +1,6 @@
 from django.shortcuts import get_object_or_404
 # app
-from .models import ProposalReview, ProposalReviewHistory
+from .models import ReviewComment
 from .mapper import ProposalReviewMapper
 from proposals_node.models import Proposal
 from program_proposal.models import ProgramProposal, ProgramProposalHistory
@@ -8,49 +8,52 @@ from project_proposal.models import ProjectProposal, ProjectProposalHistory
 from activity_proposal.models import ActivityProposal, ActivityProposalHistory
 
 class ProposalReviewSelectors:
+    # every comment of one round in a single query, grouped by section for the mapper
+    @staticmethod
+    def review_comments(proposal_id, review_round):
+        return ReviewComment.objects.filter(
+            review__proposal_node_id=proposal_id,
+            review_round=review_round
+        ).order_by(
+            "section", "review__proposal_reviewer_id"
+        ).values_list(
+            "section", "review__proposal_reviewer__reviewer__profile__name", "comment"
+        )
+
     @staticmethod
     def proposal_reviews_mapper(proposal_id, proposal_type):
-        proposal_reviews_queryset = ProposalReview.objects.select_related(
-                "proposal_reviewer__reviewer__profile"
-            ).filter(
-                proposal_node_id=proposal_id
-            )
+        review_comments = ProposalReviewSelectors.review_comments(proposal_id, ReviewComment.CURRENT_ROUND)
 
         if proposal_type == "program":
             program = get_object_or_404(ProgramProposal, proposal=proposal_id)
-            return ProposalReviewMapper.get_review_per_docs_program_mapper(program, proposal_reviews_queryset)
+            return ProposalReviewMapper.get_review_per_docs_program_mapper(program, review_comments)
 
         elif proposal_type == "project":
             project =  get_object_or_404(ProjectProposal, proposal=proposal_id)
-            return ProposalReviewMapper.get_review_per_docs_project_mapper(project, proposal_reviews_queryset)
+            return ProposalReviewMapper.get_review_per_docs_project_mapper(project, review_comments)
 
         elif proposal_type == "activity":
             activity = get_object_or_404(ActivityProposal, proposal=proposal_id)
-            return ProposalReviewMapper.get_review_per_docs_activity_mapper(activity, proposal_reviews_queryset)
+            return ProposalReviewMapper.get_review_per_docs_activity_mapper(activity, review_comments)
 
         else:
             raise ValueError("Invalid proposal type")
         
     @staticmethod
     def proposal_reviews_history_mapper(proposal_id, history_id, version, proposal_type):
-        proposal_reviews_queryset = ProposalReviewHistory.objects.select_related(
-            "proposal_reviewer__reviewer__profile"
-        ).filter(
-            proposal_node_id=proposal_id,
-            review_round=version
-        )
+        review_comments = ProposalReviewSelectors.review_comments(proposal_id, version)
         
         if proposal_type == "program":
             program = get_object_or_404(ProgramProposalHistory, id=history_id)
-            return ProposalReviewMapper.get_review_per_docs_program_mapper(program, proposal_reviews_queryset)
+            return ProposalReviewMapper.get_review_per_docs_program_mapper(program, review_comments)
 
         elif proposal_type == "project":
             project = get_object_or_404(ProjectProposalHistory, id=history_id)
-            return ProposalReviewMapper.get_review_per_docs_project_mapper(project, proposal_reviews_queryset)
+            return ProposalReviewMapper.get_review_per_docs_project_mapper(project, review_comments)
 
         elif proposal_type == "activity":
             activity = get_object_or_404(ActivityProposalHistory, id=history_id)
-            return ProposalReviewMapper.get_review_per_docs_activity_mapper(activity, proposal_reviews_queryset)
+            return ProposalReviewMapper.get_review_per_docs_activity_mapper(activity, review_comments)
 
         else:
             raise ValueError("Invalid proposal type")
\ No newline at end of file
@@ -1,5 +1,7 @@
+from django.db.models import F
+from django.utils import timezone
 from rest_framework import serializers
-from .models import ProposalReview
+from .models import ProposalReview, ReviewComment
 
 
 class ProposalReviewSerializer(serializers.ModelSerializer):
@@ -7,6 +9,58 @@ class ProposalReviewSerializer(serializers.ModelSerializer):
         model = ProposalReview
         fields = '__all__'
 
+    # the *_feedback fields keep their api names but are stored as one ReviewComment per section
+    def get_fields(self):
+        fields = super().get_fields()
+        for field_name in ReviewComment.SECTION_FIELDS.values():
+            fields[field_name] = serializers.CharField(required=False, allow_null=True, allow_blank=True, write_only=True)
+        return fields
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        comments = dict(
+            instance.comments.filter(review_round=ReviewComment.CURRENT_ROUND).values_list("section", "comment")
+        )
+        for section, field_name in ReviewComment.SECTION_FIELDS.items():
+            data[field_name] = comments.get(section)
+        return data
+
+    @staticmethod
+    def pop_feedback(validated_data):
+        return {
+            section: validated_data.pop(field_name)
+            for section, field_name in ReviewComment.SECTION_FIELDS.items()
+            if field_name in validated_data
+        }
+
+    # only the sections sent are touched, an empty value removes the comment and an unchanged one is not rewritten
+    @staticmethod
+    def save_feedback(review, feedback):
+        current = {
+            comment.section: comment
+            for comment in ReviewComment.objects.filter(review=review, review_round=ReviewComment.CURRENT_ROUND, section__in=feedback)
+        }
+        cleared = []
+        created = []
+        for section, text in feedback.items():
+            comment = current.get(section)
+            if not text:
+                if comment is not None:
+                    cleared.append(comment.id)
+            elif comment is None:
+                created.append(ReviewComment(review=review, section=section, comment=text))
+            elif comment.comment != text:
+                ReviewComment.objects.filter(id=comment.id).update(comment=text, version=F("version") + 1, updated_at=timezone.now())
+        if cleared:
+            ReviewComment.objects.filter(id__in=cleared).delete()
+        ReviewComment.objects.bulk_create(created)
+
+    def create(self, validated_data):
+        feedback = self.pop_feedback(validated_data)
+        review = super().create(validated_data)
+        self.save_feedback(review, feedback)
+        return review
+
     def update(self, instance, validated_data):
         # increase review round
         if instance.review_round:
@@ -14,4 +68,15 @@ class ProposalReviewSerializer(serializers.ModelSerializer):
         else:
             validated_data['review_round'] = 1
 
-        return super().update(instance, validated_data)
\ No newline at end of file
+        feedback = self.pop_feedback(validated_data)
+        review = super().update(instance, validated_data)
+        self.save_feedback(review, feedback)
+        return review
+
+
+# the assignment and proposal come from the locked ProposalReviewer row, not from the request
+class ProposalReviewSubmitSerializer(ProposalReviewSerializer):
+    class Meta:
+        model = ProposalReview
+        fields = '__all__'
+        read_only_fields = ['proposal_reviewer', 'proposal_node']
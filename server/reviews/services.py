@@ -0,0 +1,175 @@
+from django.db import transaction
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+# app
+from .models import ProposalReview, ReviewComment, ReviewSubmissionKey
+from .serializers import ProposalReviewSubmitSerializer
+from reviewer.models import ProposalReviewer
+from proposals_node.services import ProposalStatusService
+from notifications.services import NotificationService
+
+
+class ProposalReviewSubmissionService:
+
+    # one transaction per submission, the locked assignment row serializes double clicks and
+    # retries, a repeated Idempotency-Key replays the stored response instead of running again
+    @staticmethod
+    @transaction.atomic
+    def submit(user, assignment_id, data, idempotency_key=None, proposal_id=None):
+        reviewer = (
+            ProposalReviewer.objects
+            .select_for_update(of=("self",))
+            .select_related("reviewer__profile", "proposal")
+            .filter(id=assignment_id, reviewer=user)
+            .first()
+        )
+        # only the assigned reviewer may submit, anyone else gets the same 404 as a missing assignment
+        if reviewer is None or (proposal_id is not None and str(reviewer.proposal_id) != str(proposal_id)):
+            raise Http404("No ProposalReviewer matches the given query.")
+        if not idempotency_key:
+            return ProposalReviewSubmissionService.apply(user, reviewer, data, proposal_id)
+
+        # the key is claimed before any write, a concurrent request with the same key waits on the unique
+        # index until this transaction ends and then finds the stored row
+        stored, created = ReviewSubmissionKey.objects.get_or_create(
+            user=user, key=idempotency_key,
+            defaults={"proposal_reviewer": reviewer, "status_code": 0, "response": {}},
+        )
+        if not created:
+            if stored.proposal_reviewer_id != reviewer.id:
+                return status.HTTP_409_CONFLICT, {"detail": "This Idempotency-Key was already used for another review."}
+            return stored.status_code, stored.response
+
+        status_code, response = ProposalReviewSubmissionService.apply(user, reviewer, data, proposal_id)
+        # a rejected submission frees the key so the corrected retry can use it
+        if status_code >= 400:
+            stored.delete()
+        else:
+            stored.status_code, stored.response = status_code, response
+            stored.save(update_fields=["status_code", "response"])
+        return status_code, response
+
+    @staticmethod
+    def apply(user, reviewer, data, proposal_id=None):
+        proposal = reviewer.proposal
+        proposal_node = data.get("proposal_node")
+        if proposal_node not in (None, "") and str(proposal_node) != str(proposal.id):
+            return status.HTTP_400_BAD_REQUEST, {"proposal_node": ["Does not match the reviewer assignment."]}
+
+        if reviewer.is_review:
+            return status.HTTP_400_BAD_REQUEST, {"detail": "This reviewer has already submitted a review."}
+
+        review = ProposalReview.objects.filter(proposal_reviewer=reviewer, proposal_node=proposal).first()
+        # the update route only revises a review that already exists
+        if review is None and proposal_id is not None:
+            raise Http404("No ProposalReview matches the given query.")
+
+        serializer = ProposalReviewSubmitSerializer(review, data=data, partial=review is not None)
+        if not serializer.is_valid():
+            return status.HTTP_400_BAD_REQUEST, serializer.errors
+        review = serializer.save(proposal_reviewer=reviewer, proposal_node=proposal)
+
+        # set based writes, no model save signals needed for either flag
+        ProposalReviewer.objects.filter(id=reviewer.id).update(is_review=True)
+        ProposalStatusService.transition([proposal.id], "for_revision", actor=user, notify=False)
+        NotificationService.notify_users(
+            [proposal.user_id],
+            f"{reviewer.reviewer.profile.name} has submitted a review for your proposal titled '{proposal.title}'.",
+            idempotency_key=f"review-submitted-{reviewer.id}-{review.review_round}",
+        )
+
+        status_code = status.HTTP_200_OK if proposal_id is not None else status.HTTP_201_CREATED
+        return status_code, ProposalReviewSubmitSerializer(review).data
+
+
+class ProposalReviewDraftService:
+
+    @staticmethod
+    def current_draft(user, assignment_id):
+        reviewer = get_object_or_404(ProposalReviewer, id=assignment_id, reviewer=user)
+        comments = ReviewComment.objects.filter(
+            review__proposal_reviewer=reviewer, review_round=ReviewComment.CURRENT_ROUND
+        ).values_list("section", "comment", "version", "updated_at")
+        return {
+            "is_review": reviewer.is_review,
+            "sections": {
+                section: {"comment": comment, "version": version, "updated_at": updated_at}
+                for section, comment, version, updated_at in comments
+            },
+        }
+
+    @staticmethod
+    def validate(sections):
+        if not isinstance(sections, dict) or not sections:
+            return {"sections": ["Send the changed sections as {section: {comment, version}}."]}
+        errors = {}
+        for section, change in sections.items():
+            if section not in ReviewComment.SECTION_FIELDS:
+                errors[section] = ["Unknown section."]
+            elif not isinstance(change, dict) or not isinstance(change.get("comment", ""), (str, type(None))):
+                errors[section] = ["Expected {comment, version}."]
+            elif change.get("version") is not None and not isinstance(change["version"], int):
+                errors[section] = ["version must be an integer."]
+        return errors
+
+    # saves only the sections sent, each one compare-and-set against the version the client last saw so
+    # two open tabs cannot overwrite each other, the review row and is_review are never touched
+    @staticmethod
+    @transaction.atomic
+    def autosave(user, assignment_id, sections):
+        errors = ProposalReviewDraftService.validate(sections)
+        if errors:
+            return status.HTTP_400_BAD_REQUEST, errors
+
+        reviewer = get_object_or_404(
+            ProposalReviewer.objects.select_for_update(of=("self",)).select_related("proposal"), id=assignment_id, reviewer=user
+        )
+        if reviewer.is_review:
+            return status.HTTP_400_BAD_REQUEST, {"detail": "This reviewer has already submitted a review."}
+
+        # round 0 until the first submission, which then moves it to round 1 like a review created on submit
+        review, _ = ProposalReview.objects.get_or_create(
+            proposal_reviewer=reviewer,
+            proposal_node=reviewer.proposal,
+            defaults={"proposal_type": reviewer.proposal_type, "review_round": 0},
+        )
+        current = {
+            comment.section: comment
+            # locked so a revision rolling the round over cannot move a row between the read and the write
+            for comment in ReviewComment.objects.select_for_update().filter(
+                review=review, review_round=ReviewComment.CURRENT_ROUND, section__in=sections
+            )
+        }
+
+        saved = {}
+        conflicts = {}
+        saved_bytes = 0
+        for section, change in sections.items():
+            text = change.get("comment") or ""
+            comment = current.get(section)
+            expected = change.get("version")
+            if comment is None and expected is None:
+                if text:
+                    comment = ReviewComment.objects.create(review=review, section=section, comment=text)
+                    saved_bytes += len(text.encode())
+                saved[section] = {"version": comment.version if comment else None}
+            elif comment is None or comment.version != expected:
+                conflicts[section] = {
+                    "version": comment.version if comment else None,
+                    "comment": comment.comment if comment else None,
+                }
+            elif not text:
+                comment.delete()
+                saved[section] = {"version": None}
+            elif comment.comment == text:
+                saved[section] = {"version": comment.version}
+            else:
+                comment.comment = text
+                comment.version += 1
+                comment.save(update_fields=["comment", "version", "updated_at"])
+                saved_bytes += len(text.encode())
+                saved[section] = {"version": comment.version}
+
+        data = {"saved": saved, "conflicts": conflicts, "saved_bytes": saved_bytes}
+        return (status.HTTP_409_CONFLICT if conflicts else status.HTTP_200_OK), data
@@ -1,3 +1,147 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
+from benchmarks.factory import SyntheticDataFactory, SCALES
+from jobs.services import JobService
+from notifications.models import Notification
+from reviewer.models import ProposalReviewer
+from proposals_node.models import Proposal
+from .mapper import ProposalReviewMapper
+from .models import ProposalReview, ReviewComment, ReviewSubmissionKey
+from .selectors import ProposalReviewSelectors
+from .services import ProposalReviewSubmissionService
 
-# Create your tests here.
+
+class ProposalReviewSubmissionTest(TestCase):
+
+    def setUp(self):
+        self.data = data = SyntheticDataFactory(seed=1, **SCALES["tiny"]).build()
+        self.assignment = data.assignments[0]
+        ProposalReviewer.objects.filter(id=self.assignment.id).update(is_review=False)
+        self.proposal = self.assignment.proposal
+        self.client = APIClient()
+        self.client.force_authenticate(self.assignment.reviewer)
+
+    def submit(self, key=None):
+        headers = {"Idempotency-Key": key} if key else {}
+        return self.client.put(
+            f"/api/proposal-review-update/{self.proposal.id}/{self.assignment.id}/",
+            {"decision": "needs_revision", "rationale_feedback": "tighten the rationale"},
+            format="json",
+            headers=headers,
+        )
+
+    def test_retry_with_same_key_replays_the_response(self):
+        round_before = ProposalReview.objects.get(proposal_reviewer=self.assignment).review_round
+        notifications = Notification.objects.filter(user=self.proposal.user).count()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first = self.submit("retry-1")
+        with self.captureOnCommitCallbacks(execute=True):
+            second = self.submit("retry-1")
+        JobService.run_pending()
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(ProposalReview.objects.get(proposal_reviewer=self.assignment).review_round, round_before + 1)
+        self.assertEqual(Notification.objects.filter(user=self.proposal.user).count(), notifications + 1)
+        self.assertTrue(ProposalReviewer.objects.get(id=self.assignment.id).is_review)
+        self.proposal.refresh_from_db()
+        self.assertEqual(self.proposal.status, "for_revision")
+
+    def test_key_reused_for_another_assignment_conflicts_and_rejected_submissions_free_the_key(self):
+        self.assertEqual(self.submit("shared").status_code, 200)
+        self.assertTrue(ReviewSubmissionKey.objects.filter(key="shared", status_code=200).exists())
+        proposal = Proposal.objects.create(user=self.proposal.user, title="Second program", proposal_type="Program")
+        other = ProposalReviewer.objects.create(proposal=proposal, reviewer=self.assignment.reviewer)
+
+        second = ProposalReviewSubmissionService.submit(
+            self.assignment.reviewer, other.id, {"decision": "approved"}, idempotency_key="shared"
+        )
+        self.assertEqual(second[0], 409)
+
+        rejected = ProposalReviewSubmissionService.submit(
+            self.assignment.reviewer, self.assignment.id, {"decision": "approved"}, idempotency_key="retry-after-fix"
+        )
+        self.assertEqual(rejected[0], 400)
+        self.assertFalse(ReviewSubmissionKey.objects.filter(key="retry-after-fix").exists())
+
+    def test_other_users_cannot_submit_for_an_assignment(self):
+        self.client.force_authenticate(self.proposal.user)
+        status_before = Proposal.objects.get(id=self.proposal.id).status
+
+        response = self.submit()
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(ProposalReviewer.objects.get(id=self.assignment.id).is_review)
+        self.assertEqual(Proposal.objects.get(id=self.proposal.id).status, status_before)
+
+    def test_second_submission_without_key_is_rejected_untouched(self):
+        self.assertEqual(self.submit().status_code, 200)
+        Proposal.objects.filter(id=self.proposal.id).update(status="under_review")
+
+        response = self.submit()
+
+        self.assertEqual(response.status_code, 400)
+        self.proposal.refresh_from_db()
+        self.assertEqual(self.proposal.status, "under_review")
+
+    def test_revision_rolls_comments_into_the_next_round(self):
+        self.assertEqual(self.submit().status_code, 200)
+        rounds = set(ReviewComment.objects.filter(review__proposal_node=self.proposal).values_list("review_round", flat=True))
+        last_round = max(rounds)
+
+        self.proposal.trigger_review_reset = True
+        self.proposal.save()
+
+        comments = ReviewComment.objects.filter(review__proposal_node=self.proposal)
+        self.assertFalse(comments.filter(review_round=ReviewComment.CURRENT_ROUND).exists())
+        self.assertEqual(comments.get(review_round=last_round + 1, review__proposal_reviewer=self.assignment, section="rationale").comment, "tighten the rationale")
+        self.assertFalse(ProposalReviewer.objects.filter(proposal=self.proposal, is_review=True).exists())
+
+        with self.assertNumQueries(1):
+            sections = ProposalReviewMapper.get_review_per_docs_mapper(
+                ProposalReviewSelectors.review_comments(self.proposal.id, last_round + 1)
+            )
+        self.assertIn("tighten the rationale", [review["comment"] for review in sections["rationale"]])
+
+    def test_activity_objectives_show_the_objectives_section(self):
+        comments = [("objectives", "Reviewer", "state measurable objectives"), ("general_objectives", "Reviewer", "unused")]
+        document = ProposalReviewMapper.get_review_per_docs_activity_mapper(self.data.activities[0], comments)
+        self.assertEqual(document["objectives"]["reviews"], [{"reviewer_name": "Reviewer", "comment": "state measurable objectives"}])
+
+    def test_autosave_writes_changed_sections_and_rejects_stale_versions(self):
+        review = ProposalReview.objects.get(proposal_reviewer=self.assignment)
+        ReviewComment.objects.update_or_create(review=review, section="rationale", review_round=ReviewComment.CURRENT_ROUND, defaults={"comment": "first pass"})
+        url = f"/api/proposal-review-draft/{self.assignment.id}/"
+        draft = self.client.get(url).json()["sections"]
+        version = draft["rationale"]["version"]
+        round_before = review.review_round
+
+        response = self.client.patch(url, {"sections": {"rationale": {"comment": "draft one", "version": version}}}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["saved"], {"rationale": {"version": version + 1}})
+        self.assertEqual(response.json()["saved_bytes"], len("draft one"))
+
+        # a second tab still holding the old version gets the server copy back instead of overwriting
+        stale = self.client.patch(url, {"sections": {"rationale": {"comment": "draft two", "version": version}}}, format="json")
+        self.assertEqual(stale.status_code, 409)
+        self.assertEqual(stale.json()["conflicts"]["rationale"], {"version": version + 1, "comment": "draft one"})
+
+        self.assertFalse(ProposalReviewer.objects.get(id=self.assignment.id).is_review)
+        self.assertEqual(ProposalReview.objects.get(proposal_reviewer=self.assignment).review_round, round_before)
+        self.assertEqual(self.client.patch(url, [{"rationale": "draft"}], format="json").status_code, 400)
+
+    def test_first_submission_after_an_autosave_is_round_one(self):
+        proposal = Proposal.objects.create(user=self.proposal.user, title="Second program", proposal_type="Program")
+        assignment = ProposalReviewer.objects.create(proposal=proposal, reviewer=self.assignment.reviewer)
+        draft = self.client.patch(
+            f"/api/proposal-review-draft/{assignment.id}/", {"sections": {"rationale": {"comment": "draft"}}}, format="json"
+        )
+        self.assertEqual(draft.status_code, 200)
+
+        status_code, _ = ProposalReviewSubmissionService.submit(
+            self.assignment.reviewer, assignment.id, {"decision": "needs_revision"}
+        )
+        self.assertEqual(status_code, 201)
+        self.assertEqual(ProposalReview.objects.get(proposal_reviewer=assignment).review_round, 1)
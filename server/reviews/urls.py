@@ -5,7 +5,8 @@ from .views import (
     ProposalReviewDetail,
     ProposalReviewByProposal,
     ProposalReviewHistoryByProposalHistory,
-    ProposalReviewUpdate
+    ProposalReviewUpdate,
+    ProposalReviewDraft
 )
 
 urlpatterns = [
@@ -25,6 +26,7 @@ urlpatterns = [
         name="proposal-review-history-by-proposal-history",
     ),
     path("proposal-review-update/<int:proposal>/<int:assignment>/", ProposalReviewUpdate.as_view(), name="proposal-review-update"),
+    path("proposal-review-draft/<int:assignment>/", ProposalReviewDraft.as_view(), name="proposal-review-draft"),
 ]
 
 urlpatterns = format_suffix_patterns(urlpatterns)
\ No newline at end of file
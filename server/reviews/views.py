@@ -8,46 +8,20 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from .models import ProposalReview
 from .serializers import ProposalReviewSerializer
 from .selectors import ProposalReviewSelectors
-from reviewer.models import ProposalReviewer
-from notifications.models import Notification
-from proposals_node.models import Proposal
+from .services import ProposalReviewSubmissionService, ProposalReviewDraftService
 # Create your views here.
 # create reviews =========================================================
 class ProposalReviewList(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, format=None):
-        serializer = ProposalReviewSerializer(data=request.data)
-
-        proposal_reviewer_id = request.data.get('proposal_reviewer')
-        reviewer = get_object_or_404(ProposalReviewer, id=proposal_reviewer_id)
-        # get the proposal for notification
-        proposal = get_object_or_404(Proposal, id=request.data.get('proposal_node'))
-        proposal.status = "for_revision"
-        proposal.save()
-        # Check if already reviewed
-        if reviewer.is_review:
-            return Response(
-                {"detail": "This reviewer has already submitted a review."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        if serializer.is_valid():
-            review = serializer.save()
-
-            reviewer.is_review = True
-            reviewer.save()
-
-            Notification.objects.create(
-                user=proposal.user,
-                message=f"{reviewer.reviewer.profile.name} has submitted a review for your proposal titled '{proposal.title}'."
-            )
-            return Response(
-                ProposalReviewSerializer(review).data,
-                status=status.HTTP_201_CREATED
-            )
-
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        status_code, data = ProposalReviewSubmissionService.submit(
+            request.user,
+            request.data.get('proposal_reviewer'),
+            request.data,
+            idempotency_key=request.headers.get('Idempotency-Key'),
+        )
+        return Response(data, status=status_code)
 
 
 # get the reviews only ======================================================
@@ -84,51 +58,26 @@ class ProposalReviewHistoryByProposalHistory(APIView):
 class ProposalReviewUpdate(APIView):
     permission_classes = [IsAuthenticated]
 
-    def get_object(self, proposal, assignment):
-        return get_object_or_404(
-            ProposalReview,
-            proposal_node_id=proposal,
-            proposal_reviewer_id=assignment
-        )
-
     def put(self, request, proposal, assignment):
-
-        review = self.get_object(proposal, assignment)
-
-        reviewer = get_object_or_404(
-            ProposalReviewer,
-            id=assignment
-        )
-        # get the proposal for notification
-        proposal = get_object_or_404(Proposal, id=request.data.get('proposal_node'))
-        proposal.status = "for_revision"
-        proposal.save()
-        # Prevent duplicate review submission
-        if reviewer.is_review:
-            return Response(
-                {"detail": "This reviewer has already submitted a review."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        serializer = ProposalReviewSerializer(
-            review,
-            data=request.data,
-            partial=True
+        status_code, data = ProposalReviewSubmissionService.submit(
+            request.user,
+            assignment,
+            request.data,
+            idempotency_key=request.headers.get('Idempotency-Key'),
+            proposal_id=proposal,
         )
+        return Response(data, status=status_code)
 
-        if serializer.is_valid():
-
-            serializer.save()
 
-            # mark reviewer as reviewed
-            reviewer.is_review = True
-            reviewer.save()
-            
-            Notification.objects.create(
-                user=proposal.user,
-                message=f"{reviewer.reviewer.profile.name} has submitted a review for your proposal titled '{proposal.title}'."
-            )
+# reviewer draft autosave, only the changed sections are sent and nothing is submitted ====================
+class ProposalReviewDraft(APIView):
+    permission_classes = [IsAuthenticated]
 
-            return Response(serializer.data, status=status.HTTP_200_OK)
+    def get(self, request, assignment, format=None):
+        data = ProposalReviewDraftService.current_draft(request.user, assignment)
+        return Response(data, status=status.HTTP_200_OK)
 
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+    def patch(self, request, assignment, format=None):
+        sections = request.data.get("sections") if isinstance(request.data, dict) else None
+        status_code, data = ProposalReviewDraftService.autosave(request.user, assignment, sections)
+        return Response(data, status=status_code)
@@ -0,0 +1,5 @@
+from django.contrib import admin
+from .models import ProposalSearchDocument
+
+admin.site.register(ProposalSearchDocument)
+# Register your models here.
@@ -0,0 +1,76 @@
+import random
+import time
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from proposals_node.models import Proposal
+from search.models import ProposalSearchDocument
+from search.selectors import ProposalSearchSelectors
+from search.services import SearchIndexService
+
+WORDS = (
+    "community extension livelihood training farmers fisherfolk literacy health nutrition water "
+    "sanitation disaster preparedness climate resilience mangrove coastal barangay youth women "
+    "entrepreneurship digital skills seminar workshop module assessment evaluation partnership "
+    "agriculture aquaculture tourism heritage culture education teachers learners school research "
+    "methodology rationale significance sustainability monitoring budget output outcome impact"
+).split()
+
+QUERIES = ["livelihood training", "coastal mangrove", "digital skills youth", "disaster", "farm", "edu"]
+
+
+class Command(BaseCommand):
+    help = "Seed synthetic search documents inside a rolled back transaction and time the search queries."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--documents", type=int, default=100000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def sentence(self, rng, words):
+        return " ".join(rng.choice(WORDS) for _ in range(words))
+
+    def seed(self, count, rng):
+        user = User.objects.create(username=f"search-benchmark-{rng.random()}")
+        proposals = Proposal.objects.bulk_create(
+            [Proposal(user=user, title=self.sentence(rng, 4), proposal_type="Program") for _ in range(count)],
+            batch_size=5000,
+        )
+        ProposalSearchDocument.objects.bulk_create(
+            [
+                ProposalSearchDocument(
+                    proposal=proposal,
+                    proposal_type="Program",
+                    title=proposal.title,
+                    summary=self.sentence(rng, 80),
+                    body=self.sentence(rng, 120),
+                    feedback=self.sentence(rng, 40),
+                )
+                for proposal in proposals
+            ],
+            batch_size=5000,
+        )
+        ProposalSearchDocument.objects.update(search_vector=SearchIndexService.weighted_vector())
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE search_proposalsearchdocument")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        with transaction.atomic():
+            started = time.perf_counter()
+            self.seed(options["documents"], rng)
+            self.stdout.write(f"seeded {options['documents']} documents in {time.perf_counter() - started:.1f}s")
+
+            for term in QUERIES:
+                timings = []
+                for _ in range(options["repeat"]):
+                    started = time.perf_counter()
+                    mode, queryset = ProposalSearchSelectors.search(term)
+                    results = [ProposalSearchSelectors.result_mapper(d) for d in queryset[:20]]
+                    timings.append((time.perf_counter() - started) * 1000)
+                timings.sort()
+                self.stdout.write(
+                    f"{term!r:24} mode={mode:9} hits={len(results):3} "
+                    f"median={timings[len(timings) // 2]:.1f}ms max={timings[-1]:.1f}ms"
+                )
+            transaction.set_rollback(True)
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('proposals_node', '0008_alter_proposal_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProposalSearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('proposal_type', models.CharField(blank=True, max_length=20, null=True)),
+                ('title', models.CharField(blank=True, default='', max_length=255)),
+                ('summary', models.TextField(blank=True, default='')),
+                ('body', models.TextField(blank=True, default='')),
+                ('feedback', models.TextField(blank=True, default='')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('proposal', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='search_document', to='proposals_node.proposal')),
+            ],
+            options={
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='search_document_vector_idx'), models.Index(fields=['proposal_type'], name='search_document_type_idx')],
+            },
+        ),
+    ]
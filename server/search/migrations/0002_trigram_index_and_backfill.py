@@ -0,0 +1,66 @@
+from django.db import migrations
+
+from search.services import SearchIndexService
+
+
+# pg_trgm ships with every standard postgres build but is optional, the search falls back to full text without it
+def create_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS search_document_title_trgm_idx "
+            "ON search_proposalsearchdocument USING gin (title gin_trgm_ops)"
+        )
+
+
+def drop_trigram_index(apps, schema_editor):
+    schema_editor.execute("DROP INDEX IF EXISTS search_document_title_trgm_idx")
+
+
+def backfill_documents(apps, schema_editor):
+    Proposal = apps.get_model("proposals_node", "Proposal")
+    ProposalReview = apps.get_model("reviews", "ProposalReview")
+    ProposalSearchDocument = apps.get_model("search", "ProposalSearchDocument")
+
+    reviews_by_proposal = {}
+    for review in ProposalReview.objects.all().iterator(chunk_size=1000):
+        feedback = SearchIndexService.join_fields(review, SearchIndexService.feedback_fields(ProposalReview))
+        reviews_by_proposal.setdefault(review.proposal_node_id, []).append(feedback)
+
+    proposals = Proposal.objects.select_related("program_details", "project_details", "activity_details")
+    documents = []
+    for proposal in proposals.iterator(chunk_size=500):
+        details = None
+        for related_name in ("program_details", "project_details", "activity_details"):
+            details = getattr(proposal, related_name, None)
+            if details is not None:
+                break
+        values = SearchIndexService.build_document(proposal, details, reviews_by_proposal.get(proposal.id, []))
+        documents.append(ProposalSearchDocument(proposal_id=proposal.id, **values))
+    ProposalSearchDocument.objects.bulk_create(documents, batch_size=1000)
+    ProposalSearchDocument.objects.update(search_vector=SearchIndexService.weighted_vector())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+        ('reviews', '0010_alter_proposalreview_unique_together'),
+        ('program_proposal', '0007_alter_programproposal_methodology'),
+        ('project_proposal', '0007_alter_projectproposal_methodology'),
+        ('activity_proposal', '0005_activityproposalhistory_version'),
+    ]
+    # the backfill reads the *_feedback columns, they are dropped by reviews 0015
+    run_before = [
+        ('reviews', '0015_drop_feedback_columns'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+        migrations.RunPython(backfill_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from proposals_node.models import Proposal
+
+# Create your models here.
+# one searchable document per proposal node, rebuilt whenever the proposal or its reviews are saved
+class ProposalSearchDocument(models.Model):
+    proposal = models.OneToOneField(Proposal, on_delete=models.CASCADE, related_name="search_document")
+    proposal_type = models.CharField(max_length=20, null=True, blank=True)
+
+    title = models.CharField(max_length=255, blank=True, default="")
+    # rationale and significance
+    summary = models.TextField(blank=True, default="")
+    # objectives and methodology
+    body = models.TextField(blank=True, default="")
+    # current reviewer comments from ReviewComment
+    feedback = models.TextField(blank=True, default="")
+
+    search_vector = SearchVectorField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='search_document_vector_idx'),
+            models.Index(fields=['proposal_type'], name='search_document_type_idx'),
+        ]
+
+    def __str__(self):
+        return self.title
@@ -0,0 +1,76 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchHeadline, TrigramSimilarity
+from django.db.models import F
+from .models import ProposalSearchDocument
+from .services import SearchIndexService, SEARCH_CONFIG
+
+HEADLINE_OPTIONS = {
+    "start_sel": "<mark>",
+    "stop_sel": "</mark>",
+    "max_words": 35,
+    "min_words": 15,
+    "max_fragments": 2,
+    "config": SEARCH_CONFIG,
+}
+# queries shorter than this go straight to the trigram title match
+MIN_FULL_TEXT_LENGTH = 3
+TRIGRAM_THRESHOLD = 0.2
+
+
+class ProposalSearchSelectors:
+
+    @staticmethod
+    def base_queryset(proposal_type=None):
+        # proposals waiting for the background deletion no longer show up
+        queryset = ProposalSearchDocument.objects.filter(proposal__deletion_pending=False)
+        if proposal_type:
+            queryset = queryset.filter(proposal_type=proposal_type)
+        return queryset
+
+    @staticmethod
+    def full_text(term, proposal_type=None):
+        query = SearchQuery(term, search_type="websearch", config=SEARCH_CONFIG)
+        return (
+            ProposalSearchSelectors.base_queryset(proposal_type)
+            .filter(search_vector=query)
+            .annotate(
+                rank=SearchRank(F("search_vector"), query),
+                snippet=SearchHeadline("summary", query, **HEADLINE_OPTIONS),
+                body_snippet=SearchHeadline("body", query, **HEADLINE_OPTIONS),
+                feedback_snippet=SearchHeadline("feedback", query, **HEADLINE_OPTIONS),
+            )
+            .order_by("-rank", "-proposal_id")
+        )
+
+    @staticmethod
+    def trigram(term, proposal_type=None):
+        return (
+            ProposalSearchSelectors.base_queryset(proposal_type)
+            .annotate(rank=TrigramSimilarity("title", term))
+            .filter(rank__gt=TRIGRAM_THRESHOLD)
+            .order_by("-rank", "-proposal_id")
+        )
+
+    # ranked full text search, falls back to trigram similarity on titles for short or unmatched terms
+    @staticmethod
+    def search(term, proposal_type=None):
+        term = (term or "").strip()
+        use_trigram = SearchIndexService.trigram_available()
+
+        if len(term) >= MIN_FULL_TEXT_LENGTH or not use_trigram:
+            queryset = ProposalSearchSelectors.full_text(term, proposal_type)
+            if not use_trigram or queryset.exists():
+                return "full_text", queryset
+
+        return "trigram", ProposalSearchSelectors.trigram(term, proposal_type)
+
+    @staticmethod
+    def result_mapper(document):
+        return {
+            "proposal_id": document.proposal_id,
+            "proposal_type": document.proposal_type,
+            "title": document.title,
+            "rank": document.rank,
+            "snippet": getattr(document, "snippet", None),
+            "body_snippet": getattr(document, "body_snippet", None),
+            "feedback_snippet": getattr(document, "feedback_snippet", None),
+        }
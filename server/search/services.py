@@ -0,0 +1,99 @@
+from functools import lru_cache
+from django.contrib.postgres.search import SearchVector
+from django.db import connection
+
+SEARCH_CONFIG = "english"
+
+TITLE_FIELDS = ["program_title", "project_title", "activity_title"]
+SUMMARY_FIELDS = ["rationale", "significance"]
+BODY_FIELDS = ["general_objectives", "specific_objectives", "objectives_of_activity", "methodology"]
+
+
+class SearchIndexService:
+
+    # json sections (methodology, lists of phases) are flattened to plain text
+    @staticmethod
+    def flatten(value):
+        if value is None:
+            return ""
+        if isinstance(value, dict):
+            return " ".join(SearchIndexService.flatten(v) for v in value.values())
+        if isinstance(value, (list, tuple)):
+            return " ".join(SearchIndexService.flatten(v) for v in value)
+        return str(value)
+
+    @staticmethod
+    def join_fields(obj, fields):
+        parts = [SearchIndexService.flatten(getattr(obj, field, None)) for field in fields]
+        return "\n".join(part for part in parts if part)
+
+    @staticmethod
+    def feedback_fields(review_model):
+        return [f.name for f in review_model._meta.fields if f.name.endswith("_feedback")]
+
+    # works with the real models and with the historical models inside migrations, feedback is the
+    # plain text of the current review comments
+    @staticmethod
+    def build_document(proposal, details, feedback):
+        titles = [proposal.title]
+        if details is not None:
+            titles.append(SearchIndexService.join_fields(details, TITLE_FIELDS))
+
+        return {
+            "proposal_type": proposal.proposal_type,
+            "title": " ".join(dict.fromkeys(t for t in titles if t))[:255],
+            "summary": SearchIndexService.join_fields(details, SUMMARY_FIELDS) if details is not None else "",
+            "body": SearchIndexService.join_fields(details, BODY_FIELDS) if details is not None else "",
+            "feedback": "\n".join(f for f in feedback if f),
+        }
+
+    @staticmethod
+    def weighted_vector():
+        return (
+            SearchVector("title", weight="A", config=SEARCH_CONFIG)
+            + SearchVector("summary", weight="B", config=SEARCH_CONFIG)
+            + SearchVector("body", weight="C", config=SEARCH_CONFIG)
+            + SearchVector("feedback", weight="D", config=SEARCH_CONFIG)
+        )
+
+    @staticmethod
+    def get_details(proposal):
+        for related_name in ("program_details", "project_details", "activity_details"):
+            details = getattr(proposal, related_name, None)
+            if details is not None:
+                return details
+        return None
+
+    @staticmethod
+    def reindex_proposal(proposal_id):
+        from proposals_node.models import Proposal
+        from reviews.models import ReviewComment
+        from .models import ProposalSearchDocument
+
+        proposal = (
+            Proposal.objects
+            .select_related("program_details", "project_details", "activity_details")
+            .filter(id=proposal_id)
+            .first()
+        )
+        if proposal is None:
+            return None
+
+        feedback = ReviewComment.objects.filter(
+            review__proposal_node_id=proposal_id, review_round=ReviewComment.CURRENT_ROUND
+        ).order_by("review_id", "section").values_list("comment", flat=True)
+        values = SearchIndexService.build_document(proposal, SearchIndexService.get_details(proposal), feedback)
+        ProposalSearchDocument.objects.update_or_create(proposal=proposal, defaults=values)
+        ProposalSearchDocument.objects.filter(proposal=proposal).update(
+            search_vector=SearchIndexService.weighted_vector()
+        )
+        return proposal_id
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def trigram_available():
+        if connection.vendor != "postgresql":
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            return cursor.fetchone() is not None
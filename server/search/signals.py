@@ -0,0 +1,40 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from proposals_node.models import Proposal
+from program_proposal.models import ProgramProposal
+from project_proposal.models import ProjectProposal
+from activity_proposal.models import ActivityProposal
+from reviews.models import ProposalReview
+from jobs.services import JobService
+
+# reindex once per transaction even when the same proposal is saved several times, the
+# rebuild itself runs on a background worker
+def schedule_reindex(proposal_id):
+    if proposal_id is None:
+        return
+    connection = transaction.get_connection()
+    for _, callback, _ in connection.run_on_commit:
+        if getattr(callback, "search_proposal_id", None) == proposal_id:
+            return
+
+    def run():
+        JobService.enqueue("search.reindex", {"proposal_id": proposal_id})
+
+    run.search_proposal_id = proposal_id
+    transaction.on_commit(run)
+
+@receiver(post_save, sender=Proposal)
+def reindex_proposal_node(sender, instance, **kwargs):
+    schedule_reindex(instance.id)
+
+@receiver(post_save, sender=ProgramProposal)
+@receiver(post_save, sender=ProjectProposal)
+@receiver(post_save, sender=ActivityProposal)
+def reindex_proposal_details(sender, instance, **kwargs):
+    schedule_reindex(instance.proposal_id)
+
+@receiver(post_save, sender=ProposalReview)
+def reindex_proposal_reviews(sender, instance, **kwargs):
+    schedule_reindex(instance.proposal_node_id)
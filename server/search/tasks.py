@@ -0,0 +1,14 @@
+from jobs.registry import task
+from .services import SearchIndexService
+
+
+@task("search.reindex")
+def reindex_proposal(proposal_id):
+    SearchIndexService.reindex_proposal(proposal_id)
+
+
+# one job for a whole bulk created tree instead of one per proposal
+@task("search.reindex_many")
+def reindex_proposals(proposal_ids):
+    for proposal_id in proposal_ids:
+        SearchIndexService.reindex_proposal(proposal_id)
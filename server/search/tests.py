@@ -0,0 +1,24 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from proposals_node.models import Proposal
+from program_proposal.models import ProgramProposal
+from .models import ProposalSearchDocument
+from .selectors import ProposalSearchSelectors
+from jobs.services import JobService
+
+class ProposalSearchTest(TestCase):
+
+    def test_search_ranks_title_matches_first(self):
+        user = User.objects.create(username="testuser")
+        with self.captureOnCommitCallbacks(execute=True):
+            first = Proposal.objects.create(user=user, title="Mangrove Rehabilitation", proposal_type="Program")
+            ProgramProposal.objects.create(proposal=first, program_title="Mangrove Rehabilitation", rationale="Coastal barangays")
+            second = Proposal.objects.create(user=user, title="Digital Literacy", proposal_type="Program")
+            ProgramProposal.objects.create(proposal=second, program_title="Digital Literacy", rationale="Training near the mangrove area")
+        JobService.run_pending()
+
+        self.assertEqual(ProposalSearchDocument.objects.count(), 2)
+        mode, queryset = ProposalSearchSelectors.search("mangrove")
+        self.assertEqual(mode, "full_text")
+        self.assertEqual([d.proposal_id for d in queryset], [first.id, second.id])
+        self.assertIn("<mark>", queryset[1].snippet)
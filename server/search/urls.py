@@ -0,0 +1,9 @@
+from django.urls import path
+from rest_framework.urlpatterns import format_suffix_patterns
+from .views import ProposalSearchView
+
+urlpatterns = [
+    path("search/", ProposalSearchView.as_view(), name="proposal-search"),
+]
+
+urlpatterns = format_suffix_patterns(urlpatterns)
@@ -0,0 +1,33 @@
+from rest_framework.permissions import IsAdminUser
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from .selectors import ProposalSearchSelectors
+# Create your views here.
+
+class SearchPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+# ADMIN VIEWS search proposals and reviewer feedback
+class ProposalSearchView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, format=None):
+        term = request.query_params.get("q", "").strip()
+        if not term:
+            return Response({"error": "The q parameter is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        mode, queryset = ProposalSearchSelectors.search(
+            term,
+            proposal_type=request.query_params.get("proposal_type")
+        )
+        paginator = SearchPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        response = paginator.get_paginated_response(
+            [ProposalSearchSelectors.result_mapper(document) for document in page]
+        )
+        response.data["mode"] = mode
+        return response
@@ -19,6 +19,9 @@ from .serializers import (
     UserProfileUpdateSerializer
 )
 from .services import OverviewUserService
+from deletions.models import DeletionRequest
+from deletions.serializers import DeletionRequestSerializer
+from deletions.services import DeletionService
 # proposal 
 from proposals_node.models import Proposal
 from proposals_node.serializers import ProposalSerializer
@@ -91,11 +94,16 @@ class UpdateMyProfileView(APIView):
 
     
 # ADMIN VIEWS get all users, get user by ID, update user, delete user
+def pending_deletion_ids():
+    return DeletionRequest.objects.filter(target="user", status__in=DeletionRequest.ACTIVE).values("target_id")
+
+
 class AdminUserList(APIView):
     permission_classes = [IsAdminUser]
     
     def get(self, request, format=None):
-        users = User.objects.all()
+        # users waiting for the background deletion are already gone for the admin
+        users = User.objects.exclude(id__in=pending_deletion_ids())
         serializer = UserSerializer(users, many=True)
         return Response(serializer.data)
     
@@ -111,7 +119,7 @@ class AdminUserDetail(APIView):
 
     def get_object(self, pk):
         try:
-            return User.objects.get(pk=pk)
+            return User.objects.exclude(id__in=pending_deletion_ids()).get(pk=pk)
         except User.DoesNotExist:
             raise Http404
     
@@ -133,10 +141,13 @@ class AdminUserDetail(APIView):
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    # the user is hidden at once and removed by background jobs, ?dry_run=true only returns the row counts
     def delete(self, request, pk, format=None):
         user = self.get_object(pk)
-        user.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        if request.query_params.get("dry_run") == "true":
+            return Response(DeletionService.dry_run("user", [user.id]), status=status.HTTP_200_OK)
+        deletion = DeletionService.request("user", user, requested_by=request.user)
+        return Response(DeletionRequestSerializer(deletion).data, status=status.HTTP_202_ACCEPTED)
     
 # ADMIN USER OVERVIEW get total user, total implementor, total reviewer, total admin
 class AdminOverviewView(APIView):